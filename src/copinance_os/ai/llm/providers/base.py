@@ -66,6 +66,14 @@ class LLMProvider(ABC):
         """
         pass
 
+    def is_configured(self) -> bool:
+        """Whether the provider has the credentials it needs to make calls.
+
+        Cheap, synchronous, and offline, unlike :meth:`is_available`. Providers
+        that need an API key return False when none was supplied.
+        """
+        return True
+
     @abstractmethod
     def get_provider_name(self) -> str:
         """Get the name of the LLM provider.
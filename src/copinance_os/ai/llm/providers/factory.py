@@ -13,6 +13,9 @@ from copinance_os.ai.llm.streaming import TextStreamingMode, normalize_text_stre
 
 logger = structlog.get_logger(__name__)
 
+# Cloud providers that cannot make calls without an API key.
+_API_KEY_PROVIDERS = frozenset({"gemini", "openai"})
+
 
 class LLMProviderFactory:
     """Factory for creating LLM providers from configuration."""
@@ -113,6 +116,17 @@ class LLMProviderFactory:
                 f"Supported providers: gemini, ollama, openai"
             )
 
+    @staticmethod
+    def is_configured(provider_name: str, llm_config: LLMConfig | None = None) -> bool:
+        """Whether ``llm_config`` carries the credentials ``provider_name`` requires.
+
+        Lets callers skip provider (and SDK client) construction when the result
+        would be unusable. Mirrors :meth:`LLMProvider.is_configured`.
+        """
+        if provider_name.lower() not in _API_KEY_PROVIDERS:
+            return True
+        return bool(llm_config and llm_config.api_key)
+
     @staticmethod
     def get_provider_for_execution_type(
         execution_type: str,
@@ -163,6 +163,11 @@ class GeminiProvider(LLMProvider):
             logger.error("Gemini API call failed", error=str(e))
             raise
 
+    @override
+    def is_configured(self) -> bool:
+        """Return True when an API key was supplied."""
+        return bool(self._api_key)
+
     @override
     async def is_available(self) -> bool:
         """Check if Gemini provider is available and configured.
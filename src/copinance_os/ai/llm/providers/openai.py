@@ -233,6 +233,11 @@ class OpenAIProvider(LLMProvider):
             logger.error("OpenAI API call failed", error=str(e))
             raise
 
+    @override
+    def is_configured(self) -> bool:
+        """Return True when an API key was supplied."""
+        return bool(self._api_key)
+
     @override
     async def is_available(self) -> bool:
         if not OPENAI_AVAILABLE or not self._api_key or self._client is None:
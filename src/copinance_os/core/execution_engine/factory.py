@@ -1,5 +1,7 @@
 """Factory for creating analysis executor instances."""
 
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import structlog
 
 from copinance_os.ai.llm.analyzer_factory import LLMAnalyzerFactory
@@ -27,6 +29,7 @@ from copinance_os.domain.models.market.requests import (
     GetQuoteResponse,
 )
 from copinance_os.domain.ports.analysis_execution import AnalysisExecutor
+from copinance_os.domain.ports.analyzers import LLMAnalyzer
 from copinance_os.domain.ports.data_providers import (
     FundamentalDataProvider,
     MacroeconomicDataProvider,
@@ -55,78 +58,70 @@ class AnalysisExecutorFactory:
         llm_config: LLMConfig | None = None,
         prompt_manager: PromptManager | None = None,
     ) -> list[AnalysisExecutor]:
-        """Create all available analysis executors with their dependencies."""
-        executors: list[AnalysisExecutor] = [
-            InstrumentAnalysisExecutor(
-                get_instrument_use_case=get_instrument_use_case,
-                get_quote_use_case=get_quote_use_case,
-                get_historical_data_use_case=get_historical_data_use_case,
-                get_options_chain_use_case=get_options_chain_use_case,
-                fundamentals_use_case=fundamentals_use_case,
-                cache_manager=cache_manager,
-            ),
-            MarketAnalysisExecutor(
-                market_data_provider=market_data_provider,
-                macro_data_provider=macro_data_provider,
-                cache_manager=cache_manager,
-            ),
-        ]
+        """Create all available analysis executors with their dependencies.
 
-        agent_added = False
-        if llm_config:
-            try:
-                provider_name = LLMProviderFactory.get_provider_for_execution_type(
-                    "question_driven_analysis", llm_config=llm_config
+        The LLM analyzer (SDK client setup) is built on a worker thread while the
+        deterministic executors are constructed, so setup time is the slower of
+        the two rather than their sum.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            analyzer_future: Future[LLMAnalyzer] | None = None
+            if llm_config:
+                provider_name = llm_config.get_provider_for_execution_type(
+                    "question_driven_analysis"
                 )
-                llm_analyzer = LLMAnalyzerFactory.create(provider_name, llm_config=llm_config)
+                if LLMProviderFactory.is_configured(provider_name, llm_config):
+                    analyzer_future = pool.submit(
+                        LLMAnalyzerFactory.create, provider_name, llm_config
+                    )
+                else:
+                    # Skip SDK client setup for a provider that would be discarded anyway.
+                    logger.warning(
+                        "LLM provider API key not configured",
+                        provider=provider_name,
+                        hint="Provide API key in LLMConfig",
+                    )
+            else:
+                logger.debug("LLM config not provided, using fallback question-driven executor")
 
+            executors: list[AnalysisExecutor] = [
+                InstrumentAnalysisExecutor(
+                    get_instrument_use_case=get_instrument_use_case,
+                    get_quote_use_case=get_quote_use_case,
+                    get_historical_data_use_case=get_historical_data_use_case,
+                    get_options_chain_use_case=get_options_chain_use_case,
+                    fundamentals_use_case=fundamentals_use_case,
+                    cache_manager=cache_manager,
+                ),
+                MarketAnalysisExecutor(
+                    market_data_provider=market_data_provider,
+                    macro_data_provider=macro_data_provider,
+                    cache_manager=cache_manager,
+                ),
+            ]
+
+            llm_analyzer: LLMAnalyzer | None = None
+            if analyzer_future is not None:
                 try:
-                    provider = llm_analyzer._llm_provider  # type: ignore[attr-defined]
-                    if hasattr(provider, "_api_key") and provider._api_key is None:
-                        logger.warning(
-                            "LLM provider API key not configured",
-                            provider=provider.get_provider_name(),
-                            hint="Provide API key in LLMConfig",
-                        )
-                    else:
-                        executors.append(
-                            QuestionDrivenAnalysisExecutor(
-                                llm_analyzer=llm_analyzer,
-                                market_data_provider=market_data_provider,
-                                macro_data_provider=macro_data_provider,
-                                fundamental_data_provider=fundamental_data_provider,
-                                sec_filings_provider=sec_filings_provider,
-                                cache_manager=cache_manager,
-                                prompt_manager=prompt_manager,
-                            )
-                        )
-                        agent_added = True
+                    llm_analyzer = analyzer_future.result()
                 except Exception as e:
                     logger.warning(
-                        "Failed to initialize LLM analyzer for question-driven analysis",
+                        "Failed to create LLM analyzer for question-driven analysis",
                         error=str(e),
                         hint="Check LLM configuration",
                     )
-            except Exception as e:
-                logger.warning(
-                    "Failed to create LLM analyzer for question-driven analysis",
-                    error=str(e),
-                    hint="Check LLM configuration",
-                )
-        else:
-            logger.debug("LLM config not provided, using fallback question-driven executor")
 
-        if not agent_added:
-            executors.append(
-                QuestionDrivenAnalysisExecutor(
-                    llm_analyzer=None,
-                    market_data_provider=market_data_provider,
-                    macro_data_provider=macro_data_provider,
-                    fundamental_data_provider=fundamental_data_provider,
-                    sec_filings_provider=sec_filings_provider,
-                    cache_manager=cache_manager,
-                    prompt_manager=prompt_manager,
-                )
+        # Without an analyzer the question-driven executor uses its fallback path
+        executors.append(
+            QuestionDrivenAnalysisExecutor(
+                llm_analyzer=llm_analyzer,
+                market_data_provider=market_data_provider,
+                macro_data_provider=macro_data_provider,
+                fundamental_data_provider=fundamental_data_provider,
+                sec_filings_provider=sec_filings_provider,
+                cache_manager=cache_manager,
+                prompt_manager=prompt_manager,
             )
+        )
 
         return executors
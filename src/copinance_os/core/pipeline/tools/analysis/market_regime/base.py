@@ -3,8 +3,9 @@
 This module provides common abstractions for different regime detection methodologies,
 allowing rule-based and statistical methods to share a consistent interface.
 
-Pure numeric helpers live in ``copinance_os.domain.indicators``; pipeline tools import
-them from there directly.
+Pure numeric helpers live in ``copinance_os.domain.indicators`` and structured results
+in ``copinance_os.domain.models.regime`` (``MarketRegimeDetectionResult``); pipeline
+tools import them from there directly.
 """
 
 from abc import ABC, abstractmethod
@@ -79,47 +80,3 @@ class BaseRegimeDetectionTool(Tool, ABC):
         Subclasses must implement this with their specific execution logic.
         """
         pass
-
-
-class RegimeDetectionResult:
-    """Structured result from regime detection.
-
-    Provides a common structure for regime detection results across different methods.
-    """
-
-    def __init__(
-        self,
-        symbol: str,
-        regime: str,
-        confidence: float | str,
-        method: str,
-        metadata: dict[str, Any] | None = None,
-    ) -> None:
-        """Initialize regime detection result.
-
-        Args:
-            symbol: Stock symbol
-            regime: Detected regime (e.g., "bull", "bear", "high_volatility")
-            confidence: Confidence level (float 0-1 or string like "high"/"medium"/"low")
-            method: Detection method used
-            metadata: Additional method-specific metadata
-        """
-        self.symbol = symbol
-        self.regime = regime
-        self.confidence = confidence
-        self.method = method
-        self.metadata = metadata or {}
-
-    def to_dict(self) -> dict[str, Any]:
-        """Convert result to dictionary.
-
-        Returns:
-            Dictionary representation of the result
-        """
-        return {
-            "symbol": self.symbol,
-            "regime": self.regime,
-            "confidence": self.confidence,
-            "method": self.method,
-            "metadata": self.metadata,
-        }
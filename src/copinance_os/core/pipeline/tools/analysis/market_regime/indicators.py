@@ -10,9 +10,14 @@ All data sources are free and use existing yfinance provider.
 
 import asyncio
 import contextlib
-from datetime import UTC, datetime, timedelta
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
+from functools import cached_property
 from typing import Any
 
+import numpy as np
 import structlog
 
 from copinance_os.data.cache import CacheManager
@@ -20,13 +25,15 @@ from copinance_os.data.literacy import market_regime as mr_lit
 from copinance_os.domain.indicators import (
     relative_strength_index,
     rolling_volatility_annualized_from_prices,
-    simple_moving_average,
 )
 from copinance_os.domain.literacy import resolve_financial_literacy
 from copinance_os.domain.models.entities.profile import FinancialLiteracy
 from copinance_os.domain.models.market import MarketDataPoint
 from copinance_os.domain.models.pipeline.tool_results import ToolResult
-from copinance_os.domain.ports.data_providers import MarketDataProvider
+from copinance_os.domain.ports.data_providers import (
+    BatchHistoricalDataProvider,
+    MarketDataProvider,
+)
 from copinance_os.domain.ports.tools import Tool, ToolSchema
 
 logger = structlog.get_logger(__name__)
@@ -45,6 +52,91 @@ SECTOR_ETFS = {
     "XLC": "Communication Services",
     "XLRE": "Real Estate",
 }
+# Pre-built views of SECTOR_ETFS for iteration in the hot paths
+SECTOR_ETFS_PAIRS: tuple[tuple[str, str], ...] = tuple(SECTOR_ETFS.items())
+SECTOR_SYMBOLS: tuple[str, ...] = tuple(SECTOR_ETFS)
+
+# Sector groups used to classify the rotation theme
+DEFENSIVE_SECTORS = frozenset({"XLU", "XLP"})  # utilities, staples
+GROWTH_SECTORS = frozenset({"XLK", "XLY"})  # technology, discretionary
+VALUE_SECTORS = frozenset({"XLF", "XLI"})  # financials, industrials
+
+# Upper bound on concurrent per-sector provider requests
+MAX_CONCURRENT_FETCHES = 8
+
+# How long fetched daily history is reused in-process by a tool instance
+DEFAULT_HISTORY_CACHE_TTL_SECONDS = 300.0
+
+# Lifetime of entries this tool writes to the cache manager, overriding its default TTL.
+# Daily bars and ETF market caps change slowly, so repeated runs can reuse them for hours.
+HISTORY_CACHE_TTL = timedelta(hours=6)
+QUOTE_CACHE_TTL = timedelta(hours=1)
+
+# (symbol, start day, end day, interval) identifying one historical data request
+_HistoryKey = tuple[str, date, date, str]
+
+# VIX interpretation, looked up with bisect_right so each threshold starts the next level:
+# < 15: Low volatility (complacent market)
+# 15-25: Normal volatility
+# 25-30: High volatility (fearful market)
+# >= 30: Very high volatility (panic)
+_VIX_THRESHOLDS = (15.0, 25.0, 30.0)
+_VIX_LEVELS = (
+    ("low", "complacent"),
+    ("normal", "normal"),
+    ("high", "fearful"),
+    ("very_high", "panic"),
+)
+
+
+def _history_key(
+    symbol: str, start_date: datetime, end_date: datetime, interval: str
+) -> _HistoryKey:
+    """Key a history request by calendar day, like the shared cache does."""
+    return (symbol.upper(), start_date.date(), end_date.date(), interval)
+
+
+def _to_prices(data_list: list[MarketDataPoint]) -> np.ndarray:
+    """Closing prices as a float64 array (``close_price`` is required on every point)."""
+    return np.fromiter((d.close_price for d in data_list), dtype=np.float64, count=len(data_list))
+
+
+def _assume_utc(dt: datetime) -> datetime:
+    """Treat naive timestamps as UTC so they compare with aware ones.
+
+    Aware timestamps are returned unchanged: comparisons between aware datetimes
+    already use their UTC instants, so no ``astimezone`` conversion is needed.
+    """
+    return dt.replace(tzinfo=UTC) if dt.tzinfo is None else dt
+
+
+def _close_prices(history: dict[str, list[MarketDataPoint]]) -> dict[str, np.ndarray]:
+    """Convert every symbol's history to a close-price array once."""
+    return {symbol: _to_prices(data) for symbol, data in history.items()}
+
+
+def _return_pct(prices: np.ndarray, lookback: int) -> float | None:
+    """Percent change from ``prices[-lookback]`` to the latest price.
+
+    Returns None if there are fewer than ``lookback`` prices or the base price is
+    not positive.
+    """
+    if len(prices) < lookback:
+        return None
+    base = float(prices[-lookback])
+    return (float(prices[-1]) - base) / base * 100 if base > 0 else None
+
+
+def _return_pct_rows(matrix: np.ndarray, lookback: int) -> np.ndarray:
+    """Row-wise :func:`_return_pct` over a ``(symbols, days)`` price matrix.
+
+    Rows whose base price is not positive get 0. Requires at least ``lookback``
+    columns.
+    """
+    base = matrix[:, -lookback]
+    changes = np.zeros(len(matrix))
+    np.divide(matrix[:, -1] - base, base, out=changes, where=base > 0)
+    return changes * 100
 
 
 class MarketRegimeIndicatorsTool(Tool):
@@ -62,15 +154,25 @@ class MarketRegimeIndicatorsTool(Tool):
         self,
         market_data_provider: MarketDataProvider,
         cache_manager: CacheManager | None = None,
+        history_cache_ttl_seconds: float | None = DEFAULT_HISTORY_CACHE_TTL_SECONDS,
     ) -> None:
         """Initialize tool with market data provider and optional cache.
 
         Args:
             market_data_provider: Provider for historical market data
             cache_manager: Optional cache manager to avoid redundant fetches
+            history_cache_ttl_seconds: How long this instance reuses fetched history
+                in-process. ``None`` disables the in-process cache.
         """
         self._provider = market_data_provider
         self._cache_manager = cache_manager
+        self._history_cache_ttl_seconds = history_cache_ttl_seconds
+        # (symbol, start day, end day, interval) -> (monotonic fetch time, history)
+        self._history_cache: dict[_HistoryKey, tuple[float, list[MarketDataPoint]]] = {}
+        # Fetches in progress; concurrent requests for the same key await the same task
+        self._history_inflight: dict[_HistoryKey, asyncio.Task[list[MarketDataPoint]]] = {}
+        # Read-only close arrays for cached history, tagged with the list they came from
+        self._close_cache: dict[_HistoryKey, tuple[list[MarketDataPoint], np.ndarray]] = {}
 
     def get_name(self) -> str:
         """Get tool name."""
@@ -85,7 +187,12 @@ class MarketRegimeIndicatorsTool(Tool):
         )
 
     def get_schema(self) -> ToolSchema:
-        """Get tool schema."""
+        """Get tool schema (built once per instance; treat as read-only)."""
+        return self._schema
+
+    @cached_property
+    def _schema(self) -> ToolSchema:
+        # Also read by validate_parameters on every execute()
         return ToolSchema(
             name=self.get_name(),
             description=self.get_description(),
@@ -137,52 +244,178 @@ class MarketRegimeIndicatorsTool(Tool):
         end_date: datetime,
         interval: str = "1d",
     ) -> list[MarketDataPoint]:
-        """Fetch historical data, using cache when available to avoid redundant requests."""
-        start_str = start_date.strftime("%Y-%m-%d")
-        end_str = end_date.strftime("%Y-%m-%d")
-        symbol_upper = symbol.upper()
-        if self._cache_manager:
-            try:
-                entry = await self._cache_manager.get(
-                    "get_historical_market_data",
-                    symbol=symbol_upper,
-                    start_date=start_str,
-                    end_date=end_str,
-                    interval=interval,
-                )
-                if entry and entry.data:
-                    logger.debug(
-                        "Returning cached historical data for regime indicators",
-                        symbol=symbol_upper,
-                        cached_at=entry.cached_at.isoformat(),
-                    )
-                    return [MarketDataPoint.model_validate(p) for p in (entry.data or [])]
-            except Exception as e:
-                logger.debug(
-                    "Cache lookup failed for historical data, fetching",
-                    symbol=symbol_upper,
-                    error=str(e),
-                )
+        """Fetch historical data, using cache when available to avoid redundant requests.
+
+        Results are first looked up in this instance's in-process TTL cache (keyed by
+        calendar day, like the shared cache), then in the cache manager. Concurrent
+        calls for the same key share one in-flight fetch.
+        """
+        key = _history_key(symbol, start_date, end_date, interval)
+        cached = self._cached_history(key)
+        if cached is not None:
+            return cached
+
+        task = self._history_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._load_and_remember(key, symbol, start_date, end_date, interval)
+            )
+            self._history_inflight[key] = task
+            task.add_done_callback(self._forget_inflight(key))
+        # Shielded so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, key: _HistoryKey) -> Callable[[asyncio.Task[Any]], None]:
+        """Build a done-callback that drops a finished fetch from the in-flight map."""
+
+        def forget(task: asyncio.Task[Any]) -> None:
+            self._history_inflight.pop(key, None)
+            if not task.cancelled():
+                # Mark the error as retrieved even if every caller was cancelled
+                task.exception()
+
+        return forget
+
+    async def _load_and_remember(
+        self,
+        key: _HistoryKey,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str,
+    ) -> list[MarketDataPoint]:
+        """Load historical data and store non-empty results in the TTL cache."""
+        data = await self._load_historical_data(symbol, start_date, end_date, interval)
+        self._remember_history(key, data)
+        return data
+
+    def _cached_history(self, key: _HistoryKey) -> list[MarketDataPoint] | None:
+        """Return unexpired history from the in-process TTL cache, if any."""
+        ttl = self._history_cache_ttl_seconds
+        if ttl is None:
+            return None
+        hit = self._history_cache.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            return hit[1]
+        return None
+
+    def _remember_history(self, key: _HistoryKey, data: list[MarketDataPoint]) -> None:
+        """Store non-empty history in the in-process TTL cache."""
+        ttl = self._history_cache_ttl_seconds
+        if ttl is not None and data:
+            now = time.monotonic()
+            # Drop expired entries so the cache does not grow across days and windows
+            self._history_cache = {k: v for k, v in self._history_cache.items() if now - v[0] < ttl}
+            self._history_cache[key] = (now, data)
+            self._close_cache = {
+                k: v for k, v in self._close_cache.items() if k in self._history_cache
+            }
+
+    def _cached_close_prices(
+        self,
+        history: dict[str, list[MarketDataPoint]],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[str, np.ndarray]:
+        """Like :func:`_close_prices`, reusing arrays converted from the same cached lists.
+
+        Arrays are only kept while their history is in the TTL cache, and are made
+        read-only because later runs share them.
+        """
+        prices: dict[str, np.ndarray] = {}
+        for symbol, data in history.items():
+            key = _history_key(symbol, start_date, end_date, "1d")
+            hit = self._close_cache.get(key)
+            if hit is not None and hit[0] is data:
+                prices[symbol] = hit[1]
+                continue
+            closes = _to_prices(data)
+            if key in self._history_cache:
+                closes.flags.writeable = False
+                self._close_cache[key] = (data, closes)
+            prices[symbol] = closes
+        return prices
+
+    async def _load_historical_data(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str,
+    ) -> list[MarketDataPoint]:
+        """Fetch historical data through the cache manager (if any) and provider."""
+        cached = await self._read_cached_history(symbol, start_date, end_date, interval)
+        if cached:
+            return cached
         data = await self._provider.get_historical_data(
-            symbol_upper, start_date, end_date, interval=interval
+            symbol.upper(), start_date, end_date, interval=interval
         )
-        if self._cache_manager and data:
-            try:
-                serialized = [
-                    p.model_dump(mode="json") if hasattr(p, "model_dump") else p for p in data
-                ]
-                await self._cache_manager.set(
-                    "get_historical_market_data",
-                    data=serialized,
-                    metadata={"symbol": symbol_upper, "interval": interval},
+        if data:
+            await self._write_cached_history(symbol, start_date, end_date, interval, data)
+        return data or []
+
+    async def _read_cached_history(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str,
+    ) -> list[MarketDataPoint] | None:
+        """Look up historical data in the cache manager; None on a miss or without one."""
+        if not self._cache_manager:
+            return None
+        symbol_upper = symbol.upper()
+        try:
+            entry = await self._cache_manager.get(
+                "get_historical_market_data",
+                symbol=symbol_upper,
+                start_date=start_date.strftime("%Y-%m-%d"),
+                end_date=end_date.strftime("%Y-%m-%d"),
+                interval=interval,
+            )
+            if entry and entry.data:
+                logger.debug(
+                    "Returning cached historical data for regime indicators",
                     symbol=symbol_upper,
-                    start_date=start_str,
-                    end_date=end_str,
-                    interval=interval,
+                    cached_at=entry.cached_at.isoformat(),
                 )
-            except Exception:
-                pass
-        return data or []
+                return [MarketDataPoint.model_validate(p) for p in (entry.data or [])]
+        except Exception as e:
+            logger.debug(
+                "Cache lookup failed for historical data, fetching",
+                symbol=symbol_upper,
+                error=str(e),
+            )
+        return None
+
+    async def _write_cached_history(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str,
+        data: list[MarketDataPoint],
+    ) -> None:
+        """Store fetched historical data in the cache manager, if there is one."""
+        if not self._cache_manager:
+            return
+        symbol_upper = symbol.upper()
+        try:
+            serialized = [
+                p.model_dump(mode="json") if hasattr(p, "model_dump") else p for p in data
+            ]
+            await self._cache_manager.set(
+                "get_historical_market_data",
+                data=serialized,
+                metadata={"symbol": symbol_upper, "interval": interval},
+                ttl=HISTORY_CACHE_TTL,
+                symbol=symbol_upper,
+                start_date=start_date.strftime("%Y-%m-%d"),
+                end_date=end_date.strftime("%Y-%m-%d"),
+                interval=interval,
+            )
+        except Exception:
+            pass
 
     async def _get_quote_cached(self, symbol: str) -> dict[str, Any]:
         """Fetch quote, using cache when available to avoid redundant requests."""
@@ -210,10 +443,134 @@ class MarketRegimeIndicatorsTool(Tool):
                     "get_market_quote",
                     data=quote,
                     metadata={"symbol": symbol_upper},
+                    ttl=QUOTE_CACHE_TTL,
                     symbol=symbol_upper,
                 )
         return quote or {}
 
+    async def _fetch_history(
+        self,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+        required: str | None = None,
+    ) -> dict[str, list[MarketDataPoint]]:
+        """Fetch daily history for several symbols concurrently.
+
+        Providers that implement :class:`BatchHistoricalDataProvider` get one request
+        for every symbol missing from the caches. Otherwise, or if that request fails,
+        symbols are fetched one by one with at most ``MAX_CONCURRENT_FETCHES`` requests
+        in flight. Symbols whose fetch fails or returns no data are left out of the
+        result.
+
+        If ``required`` (one of ``symbols``) yields no data, the result is empty and
+        per-symbol fetches that have not started yet are cancelled.
+        """
+        if isinstance(self._provider, BatchHistoricalDataProvider):
+            try:
+                history = await self._fetch_history_batch(
+                    self._provider, symbols, start_date, end_date
+                )
+            except Exception as e:
+                logger.debug("Batch history fetch failed, fetching per symbol", error=str(e))
+            else:
+                return history if required is None or required in history else {}
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def fetch_one(symbol: str) -> tuple[str, list[MarketDataPoint] | None]:
+            async with semaphore:
+                try:
+                    data = await self._get_historical_data_cached(
+                        symbol, start_date, end_date, "1d"
+                    )
+                except Exception as e:
+                    logger.debug("Failed to fetch historical data", symbol=symbol, error=str(e))
+                    return symbol, None
+            return symbol, data
+
+        tasks = {symbol: asyncio.create_task(fetch_one(symbol)) for symbol in symbols}
+        try:
+            if required is not None and not (await tasks[required])[1]:
+                logger.debug("No history for required symbol, skipping the rest", symbol=required)
+                return {}
+            results = await asyncio.gather(*tasks.values())
+        finally:
+            # No-op for finished tasks; stops queued fetches on early return or cancellation
+            for task in tasks.values():
+                task.cancel()
+        return {symbol: data for symbol, data in results if data}
+
+    async def _fetch_history_batch(
+        self,
+        provider: BatchHistoricalDataProvider,
+        symbols: list[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[str, list[MarketDataPoint]]:
+        """Fetch daily history, requesting all cache misses from ``provider`` at once."""
+        history: dict[str, list[MarketDataPoint]] = {}
+        for symbol in symbols:
+            cached = self._cached_history(_history_key(symbol, start_date, end_date, "1d"))
+            if cached is not None:
+                history[symbol] = cached
+
+        unresolved = [symbol for symbol in symbols if symbol not in history]
+        stored = await asyncio.gather(
+            *(self._read_cached_history(s, start_date, end_date, "1d") for s in unresolved)
+        )
+        missing: list[str] = []
+        for symbol, data in zip(unresolved, stored, strict=True):
+            if data:
+                self._remember_history(_history_key(symbol, start_date, end_date, "1d"), data)
+                history[symbol] = data
+            else:
+                missing.append(symbol)
+
+        if missing:
+            fetched = await provider.get_historical_data_batch(missing, start_date, end_date, "1d")
+            for symbol in missing:
+                data = fetched.get(symbol.upper()) or []
+                if data:
+                    self._remember_history(_history_key(symbol, start_date, end_date, "1d"), data)
+                    await self._write_cached_history(symbol, start_date, end_date, "1d", data)
+                    history[symbol] = data
+
+        return {symbol: history[symbol] for symbol in symbols if symbol in history}
+
+    async def _fetch_market_cap(self, symbol: str, semaphore: asyncio.Semaphore) -> int | None:
+        """Fetch a sector ETF's market cap from its quote, retrying once on failure.
+
+        Some ETFs (like XLC, XLRE) may have intermittent API issues.
+        """
+        max_retries = 2
+        for attempt in range(max_retries):
+            try:
+                async with semaphore:
+                    quote = await self._get_quote_cached(symbol)
+                market_cap = quote.get("market_cap")
+                if market_cap:
+                    return int(market_cap)
+                logger.debug("Market cap not available in quote", sector=symbol)
+                return None
+            except Exception as e:
+                if attempt < max_retries - 1:
+                    # Wait a bit before retry (exponential backoff)
+                    await asyncio.sleep(0.5 * (attempt + 1))
+                    logger.debug(
+                        "Retrying market cap fetch",
+                        sector=symbol,
+                        attempt=attempt + 1,
+                        error=str(e),
+                    )
+                else:
+                    logger.debug(
+                        "Failed to fetch market cap for sector after retries",
+                        sector=symbol,
+                        error=str(e),
+                    )
+        return None
+
     async def execute(self, **kwargs: Any) -> ToolResult:
         """Execute market regime indicators analysis."""
         try:
@@ -239,82 +596,81 @@ class MarketRegimeIndicatorsTool(Tool):
                 "analysis_date": end_date.isoformat(),
             }
 
-            # Fetch shared data once if needed by multiple indicators
-            market_data = None
-            sector_data_cache: dict[str, list] = {}
-            needs_shared_data = include_market_breadth or include_sector_rotation
+            # Start the VIX fetch first so it overlaps the market/sector fetches below
+            vix_task = (
+                asyncio.create_task(self._fetch_vix_data(start_date, end_date, financial_literacy))
+                if include_vix
+                else None
+            )
 
-            if needs_shared_data:
-                try:
-                    # Fetch market index data once (used by both breadth and rotation)
-                    market_data = await self._get_historical_data_cached(
-                        market_index, start_date, end_date, "1d"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to fetch market data for breadth/rotation analysis",
-                        market_index=market_index,
-                        error=str(e),
-                    )
-                    market_data = None
-
-                # Fetch all sector ETF data once (used by both breadth and rotation)
-                for sector_symbol in SECTOR_ETFS:
-                    try:
-                        sector_data = await self._get_historical_data_cached(
-                            sector_symbol, start_date, end_date, "1d"
-                        )
-                        if sector_data:
-                            sector_data_cache[sector_symbol] = sector_data
-                    except Exception as e:
-                        logger.debug(
-                            "Failed to fetch sector data",
-                            sector=sector_symbol,
-                            error=str(e),
-                        )
-
-            # Fetch VIX data
-            if include_vix:
+            # Fetch the market index and all sector ETFs once, concurrently; breadth and
+            # rotation both work from this history
+            history: dict[str, list[MarketDataPoint]] = {}
+            prices: dict[str, np.ndarray] = {}
+            if include_market_breadth or include_sector_rotation:
+                symbols = list(dict.fromkeys((market_index, *SECTOR_SYMBOLS)))
+                # Neither calculation works without the market index, so a missing one
+                # stops the sector fetches early
+                history = await self._fetch_history(
+                    symbols, start_date, end_date, required=market_index
+                )
+                # Closes are converted once and shared by both calculations (and by
+                # later runs while the history stays cached)
+                prices = self._cached_close_prices(history, start_date, end_date)
+
+            # Sector rotation is CPU-only, so it runs while the VIX fetch is in flight
+            rotation_data: dict[str, Any] | None = None
+            if include_sector_rotation:
                 try:
-                    vix_data = await self._fetch_vix_data(start_date, end_date, financial_literacy)
-                    results["vix"] = vix_data
+                    rotation_data = self._calculate_sector_rotation(market_index, prices)
                 except Exception as e:
-                    logger.warning("Failed to fetch VIX data", error=str(e))
-                    results["vix"] = {
+                    logger.warning("Failed to calculate sector rotation", error=str(e))
+                    rotation_data = {
                         "available": False,
-                        "data_points": 0,
-                        "error": f"Failed to fetch VIX data: {str(e)}",
+                        "market_return_20d": 0.0,
+                        "market_return_60d": 0.0,
+                        "error": f"Failed to calculate sector rotation: {str(e)}",
                     }
 
-            # Fetch market breadth (using cached data)
+            # Breadth's market-cap quotes and the VIX fetch overlap instead of queueing
+            pending: dict[str, Awaitable[dict[str, Any]]] = {}
+            if vix_task is not None:
+                pending["vix"] = vix_task
             if include_market_breadth:
-                try:
-                    breadth_data = await self._calculate_market_breadth(
-                        market_index, start_date, end_date, market_data, sector_data_cache
-                    )
-                    results["market_breadth"] = breadth_data
-                except Exception as e:
-                    logger.warning("Failed to calculate market breadth", error=str(e))
-                    results["market_breadth"] = {
+                pending["market_breadth"] = self._calculate_market_breadth(
+                    market_index, history, prices, as_of=end_date
+                )
+            outcomes = dict(
+                zip(
+                    pending,
+                    await asyncio.gather(*pending.values(), return_exceptions=True),
+                    strict=True,
+                )
+            )
+
+            if "vix" in outcomes:
+                vix_data = outcomes["vix"]
+                if isinstance(vix_data, BaseException):
+                    logger.warning("Failed to fetch VIX data", error=str(vix_data))
+                    vix_data = {
                         "available": False,
-                        "error": f"Failed to calculate market breadth: {str(e)}",
+                        "data_points": 0,
+                        "error": f"Failed to fetch VIX data: {str(vix_data)}",
                     }
+                results["vix"] = vix_data
 
-            # Fetch sector rotation signals (using cached data)
-            if include_sector_rotation:
-                try:
-                    rotation_data = await self._calculate_sector_rotation(
-                        market_index, start_date, end_date, market_data, sector_data_cache
-                    )
-                    results["sector_rotation"] = rotation_data
-                except Exception as e:
-                    logger.warning("Failed to calculate sector rotation", error=str(e))
-                    results["sector_rotation"] = {
+            if "market_breadth" in outcomes:
+                breadth_data = outcomes["market_breadth"]
+                if isinstance(breadth_data, BaseException):
+                    logger.warning("Failed to calculate market breadth", error=str(breadth_data))
+                    breadth_data = {
                         "available": False,
-                        "market_return_20d": 0.0,
-                        "market_return_60d": 0.0,
-                        "error": f"Failed to calculate sector rotation: {str(e)}",
+                        "error": f"Failed to calculate market breadth: {str(breadth_data)}",
                     }
+                results["market_breadth"] = breadth_data
+
+            if rotation_data is not None:
+                results["sector_rotation"] = rotation_data
 
             return ToolResult(
                 success=True,
@@ -366,39 +722,15 @@ class MarketRegimeIndicatorsTool(Tool):
                     "error": "No VIX data available",
                 }
 
-            # Extract closing prices
-            vix_prices = [float(d.close_price) for d in vix_data_list if d.close_price is not None]
-
-            if not vix_prices:
-                return {
-                    "available": False,
-                    "data_points": 0,
-                    "error": "No valid VIX price data",
-                }
-
-            current_vix = vix_prices[-1]
-            recent_avg = sum(vix_prices[-20:]) / min(20, len(vix_prices))
-            recent_max = max(vix_prices[-20:]) if len(vix_prices) >= 20 else max(vix_prices)
-            recent_min = min(vix_prices[-20:]) if len(vix_prices) >= 20 else min(vix_prices)
+            # Only the latest 20 closes feed the stats, so convert just those
+            recent = _to_prices(vix_data_list[-20:])
+            current_vix = float(recent[-1])
+            recent_avg = float(recent.mean())
+            recent_max = float(recent.max())
+            recent_min = float(recent.min())
 
             # Classify VIX level
-            # VIX interpretation:
-            # < 15: Low volatility (complacent market)
-            # 15-25: Normal volatility
-            # > 25: High volatility (fearful market)
-            # > 30: Very high volatility (panic)
-            if current_vix < 15:
-                vix_regime = "low"
-                vix_sentiment = "complacent"
-            elif current_vix < 25:
-                vix_regime = "normal"
-                vix_sentiment = "normal"
-            elif current_vix < 30:
-                vix_regime = "high"
-                vix_sentiment = "fearful"
-            else:
-                vix_regime = "very_high"
-                vix_sentiment = "panic"
+            vix_regime, vix_sentiment = _VIX_LEVELS[bisect_right(_VIX_THRESHOLDS, current_vix)]
 
             return {
                 "available": True,
@@ -408,7 +740,7 @@ class MarketRegimeIndicatorsTool(Tool):
                 "recent_min_20d": round(recent_min, 2),
                 "regime": vix_regime,
                 "sentiment": mr_lit.vix_sentiment_label(vix_sentiment, financial_literacy),
-                "data_points": len(vix_prices),
+                "data_points": len(vix_data_list),
             }
 
         except Exception as e:
@@ -422,10 +754,9 @@ class MarketRegimeIndicatorsTool(Tool):
     async def _calculate_market_breadth(
         self,
         market_index: str,
-        start_date: datetime,
-        end_date: datetime,
-        market_data: list | None = None,
-        sector_data_cache: dict[str, list] | None = None,
+        history: dict[str, list[MarketDataPoint]],
+        prices: dict[str, np.ndarray] | None = None,
+        as_of: datetime | None = None,
     ) -> dict[str, Any]:
         """Calculate market breadth using sector ETFs.
 
@@ -435,20 +766,19 @@ class MarketRegimeIndicatorsTool(Tool):
 
         Args:
             market_index: Market index symbol (e.g., "SPY")
-            start_date: Start date for analysis
-            end_date: End date for analysis
+            history: Daily history keyed by symbol for the market index and sector ETFs
+            prices: Close prices converted from ``history``; converted here if omitted
+            as_of: Analysis time whose calendar year the YTD returns cover; defaults to
+                now. ``execute`` passes the end of its fetch window so both use one clock.
 
         Returns:
             Dictionary with market breadth metrics
         """
         try:
-            # Use provided market data or fetch if not provided
-            if market_data is None:
-                market_data = await self._get_historical_data_cached(
-                    market_index, start_date, end_date, "1d"
-                )
-
-            if not market_data:
+            if prices is None:
+                prices = _close_prices(history)
+            market_prices = prices.get(market_index)
+            if market_prices is None or not len(market_prices):
                 return {
                     "available": False,
                     "sectors_above_50ma": 0,
@@ -457,8 +787,6 @@ class MarketRegimeIndicatorsTool(Tool):
                     "error": f"No data available for {market_index}",
                 }
 
-            market_prices = [float(d.close_price) for d in market_data if d.close_price is not None]
-
             if len(market_prices) < 20:
                 return {
                     "available": False,
@@ -468,12 +796,8 @@ class MarketRegimeIndicatorsTool(Tool):
                     "error": "Insufficient market data for breadth calculation",
                 }
 
-            # Get current market price
-            current_market_price = market_prices[-1]
-
-            # Use cached sector data or fetch if not provided
-            if sector_data_cache is None:
-                sector_data_cache = {}
+            # Performance vs. market is measured over the whole window
+            market_return = _return_pct(market_prices, len(market_prices)) or 0.0
 
             sector_performance: dict[str, dict[str, Any]] = {}
             sectors_above_ma = 0
@@ -482,259 +806,178 @@ class MarketRegimeIndicatorsTool(Tool):
 
             # Get current date for YTD calculation
             # Use UTC to ensure timezone consistency with market data timestamps
-            current_date = datetime.now(UTC)
-            year_start_date = datetime(current_date.year, 1, 1, tzinfo=UTC)
+            current_date = _assume_utc(as_of) if as_of is not None else datetime.now(UTC)
+            year_start_date = datetime(current_date.astimezone(UTC).year, 1, 1, tzinfo=UTC)
 
-            # First pass: collect all sector data and market caps
+            # First pass: collect sectors with enough history, then their market caps
             sector_data_dict: dict[str, dict[str, Any]] = {}
-            market_caps: dict[str, int | None] = {}
-
-            for sector_symbol, sector_name in SECTOR_ETFS.items():
-                try:
-                    # Use cached data if available, otherwise fetch
-                    if sector_symbol in sector_data_cache:
-                        sector_data = sector_data_cache[sector_symbol]
-                    else:
-                        sector_data = await self._get_historical_data_cached(
-                            sector_symbol, start_date, end_date, "1d"
-                        )
-
-                    if not sector_data:
-                        continue
-
-                    sector_prices = [
-                        float(d.close_price) for d in sector_data if d.close_price is not None
-                    ]
-
-                    if (
-                        len(sector_prices) < 50
-                    ):  # Need at least 50 days for 50-day MA (minimum requirement)
-                        continue
-
-                    # Fetch market cap from quote with retry logic
-                    # Some ETFs (like XLC, XLRE) may have intermittent API issues
-                    market_cap = None
-                    max_retries = 2
-                    for attempt in range(max_retries):
-                        try:
-                            quote = await self._get_quote_cached(sector_symbol)
-                            market_cap = quote.get("market_cap")
-                            if market_cap:
-                                market_caps[sector_symbol] = int(market_cap)
-                                break
-                            else:
-                                # If quote succeeded but market_cap is None, try alternative calculation
-                                # For ETFs, we can estimate from current price and shares outstanding
-                                current_price = quote.get("current_price")
-                                if current_price and hasattr(current_price, "__float__"):
-                                    # Try to get shares outstanding from quote if available
-                                    # Note: This is a fallback - yfinance may not provide this for all ETFs
-                                    logger.debug(
-                                        "Market cap not available in quote, attempting alternative",
-                                        sector=sector_symbol,
-                                    )
-                                market_caps[sector_symbol] = None
-                                break
-                        except Exception as e:
-                            if attempt < max_retries - 1:
-                                # Wait a bit before retry (exponential backoff)
-                                await asyncio.sleep(0.5 * (attempt + 1))
-                                logger.debug(
-                                    "Retrying market cap fetch",
-                                    sector=sector_symbol,
-                                    attempt=attempt + 1,
-                                    error=str(e),
-                                )
-                            else:
-                                logger.debug(
-                                    "Failed to fetch market cap for sector after retries",
-                                    sector=sector_symbol,
-                                    error=str(e),
-                                )
-                                market_caps[sector_symbol] = None
-
-                    # Store sector data for processing
-                    sector_data_dict[sector_symbol] = {
-                        "name": sector_name,
-                        "prices": sector_prices,
-                        "data": sector_data,
-                    }
 
-                except Exception as e:
-                    logger.debug(
-                        "Failed to fetch sector data",
-                        sector=sector_symbol,
-                        error=str(e),
-                    )
+            for sector_symbol, sector_name in SECTOR_ETFS_PAIRS:
+                sector_prices = prices.get(sector_symbol)
+                # Need at least 50 days for 50-day MA (minimum requirement)
+                if sector_prices is None or len(sector_prices) < 50:
                     continue
+                sector_data = history[sector_symbol]
 
-            # Calculate market cap ranks
-            # Sort sectors by market cap (largest first), assign ranks
-            sorted_sectors_by_cap = sorted(
-                [
-                    (symbol, cap)
-                    for symbol, cap in market_caps.items()
-                    if cap is not None and symbol in sector_data_dict
-                ],
-                key=lambda x: x[1],
-                reverse=True,
+                # Store sector data for processing
+                sector_data_dict[sector_symbol] = {
+                    "name": sector_name,
+                    "prices": sector_prices,
+                    "data": sector_data,
+                }
+
+            quote_semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+            caps = await asyncio.gather(
+                *(self._fetch_market_cap(symbol, quote_semaphore) for symbol in sector_data_dict)
             )
-            market_cap_ranks: dict[str, int] = {}
-            for rank, (symbol, _) in enumerate(sorted_sectors_by_cap, start=1):
-                market_cap_ranks[symbol] = rank
+            market_caps: dict[str, int | None] = dict(zip(sector_data_dict, caps, strict=True))
+
+            # Rank sectors by market cap (largest first); a stable sort keeps fetch
+            # order among equal caps
+            capped_symbols = [symbol for symbol, cap in market_caps.items() if cap is not None]
+            caps_array = np.array([market_caps[s] for s in capped_symbols], dtype=np.int64)
+            cap_order = np.argsort(-caps_array, kind="stable").tolist()
+            market_cap_ranks = {
+                capped_symbols[i]: rank for rank, i in enumerate(cap_order, start=1)
+            }
 
-            # Second pass: calculate all metrics for each sector
-            for sector_symbol, sector_info in sector_data_dict.items():
-                try:
-                    sector_name = sector_info["name"]
-                    sector_prices = sector_info["prices"]
-                    sector_data = sector_info["data"]
-
-                    current_sector_price = sector_prices[-1]
-
-                    # Calculate moving averages
-                    sector_ma_50 = simple_moving_average(sector_prices, 50)
-                    # Only calculate 200-day MA if we have enough data
-                    sector_ma_200 = (
-                        simple_moving_average(sector_prices, 200)
-                        if len(sector_prices) >= 200
-                        else [None] * len(sector_prices)
-                    )
-                    current_sector_ma_50 = (
-                        sector_ma_50[-1] if sector_ma_50[-1] is not None else current_sector_price
-                    )
-                    current_sector_ma_200 = (
-                        sector_ma_200[-1] if sector_ma_200[-1] is not None else None
-                    )
+            # Second pass: window-end stats for all sectors at once. Every collected
+            # sector has at least 50 closes, so their last 50 stack into one matrix
+            # even when history lengths differ.
+            symbols = list(sector_data_dict)
+            tails = (
+                np.stack([sector_data_dict[symbol]["prices"][-50:] for symbol in symbols])
+                if symbols
+                else np.empty((0, 50))
+            )
+            current_prices = tails[:, -1]
+            ma_50 = tails.mean(axis=1)
+            above_50ma = (current_prices > ma_50) & (ma_50 != 0)
+            returns_1d = _return_pct_rows(tails, 2)
+            returns_5d = _return_pct_rows(tails, 6)
+            valid_1d = tails[:, -2] > 0
+            valid_5d = tails[:, -6] > 0
+
+            # Per analyzed sector: (symbol, name, above 50MA, above 200MA) and raw metrics.
+            # Inputs were validated above, so this loop is plain arithmetic; anything
+            # unexpected is reported by the handler around the whole calculation.
+            analyzed: list[tuple[str, str, bool, bool | None]] = []
+            raw_metrics: list[tuple[float | None, ...]] = []
+            for row, sector_symbol in enumerate(symbols):
+                sector_info = sector_data_dict[sector_symbol]
+                sector_name = sector_info["name"]
+                sector_prices = sector_info["prices"]
+                sector_data = sector_info["data"]
+
+                current_sector_price = float(current_prices[row])
+                closes = tails[row].tolist()
+
+                # Only calculate 200-day MA if we have enough data
+                current_sector_ma_200 = (
+                    float(sector_prices[-200:].mean()) if len(sector_prices) >= 200 else None
+                )
 
-                    # Calculate returns for different periods
-                    return_1d = None
-                    return_5d = None
-                    return_120d = None
-                    return_ytd = None
-
-                    if len(sector_prices) >= 2:
-                        return_1d = (
-                            (sector_prices[-1] - sector_prices[-2]) / sector_prices[-2] * 100
-                            if sector_prices[-2] > 0
-                            else None
-                        )
-                    if len(sector_prices) >= 6:
-                        return_5d = (
-                            (sector_prices[-1] - sector_prices[-6]) / sector_prices[-6] * 100
-                            if sector_prices[-6] > 0
-                            else None
-                        )
-                    if len(sector_prices) >= 121:
-                        return_120d = (
-                            (sector_prices[-1] - sector_prices[-121]) / sector_prices[-121] * 100
-                            if sector_prices[-121] > 0
-                            else None
-                        )
-
-                    # Calculate YTD return
-                    # Find the price closest to year start
-                    if sector_data:
-                        # Find the first data point on or after year start
-                        # Normalize timestamps for comparison (handle both timezone-aware and naive)
-                        def normalize_datetime(dt: datetime) -> datetime:
-                            """Normalize datetime to UTC-aware for comparison."""
-                            if dt.tzinfo is None:
-                                # If naive, assume UTC
-                                return dt.replace(tzinfo=UTC)
-                            # If aware, convert to UTC
-                            return dt.astimezone(UTC)
-
-                        normalized_year_start = normalize_datetime(year_start_date)
-                        year_start_prices = [
-                            (d.timestamp, float(d.close_price))
-                            for d in sector_data
-                            if d.close_price is not None
-                            and normalize_datetime(d.timestamp) >= normalized_year_start
-                        ]
-                        if year_start_prices:
-                            # Get the earliest price in the year
-                            year_start_prices.sort(key=lambda x: x[0])
-                            ytd_start_price = year_start_prices[0][1]
-                            return_ytd = (
-                                (current_sector_price - ytd_start_price) / ytd_start_price * 100
-                                if ytd_start_price > 0
-                                else None
-                            )
-
-                    # Calculate RSI
-                    rsi_14d = relative_strength_index(sector_prices, period=14)
-
-                    # Calculate volatility (20-day)
-                    volatility_list = rolling_volatility_annualized_from_prices(
-                        sector_prices, window=20
-                    )
-                    volatility_20d = (
-                        volatility_list[-1] * 100
-                        if volatility_list and volatility_list[-1] is not None
+                # Calculate returns for different periods
+                return_1d = float(returns_1d[row]) if valid_1d[row] else None
+                return_5d = float(returns_5d[row]) if valid_5d[row] else None
+                return_120d = _return_pct(sector_prices, 121)
+                return_ytd = None
+
+                # Calculate YTD return from the first data point on or after year start.
+                # History is chronological (the latest close is the current price), so
+                # binary-search for it instead of scanning every point.
+                ytd_index = bisect_left(
+                    sector_data, year_start_date, key=lambda d: _assume_utc(d.timestamp)
+                )
+                if ytd_index < len(sector_data):
+                    ytd_start_price = float(sector_data[ytd_index].close_price)
+                    return_ytd = (
+                        (current_sector_price - ytd_start_price) / ytd_start_price * 100
+                        if ytd_start_price > 0
                         else None
-                    )  # Convert to percentage
-
-                    # Calculate performance vs. market
-                    market_return = (
-                        (current_market_price - market_prices[0]) / market_prices[0] * 100
-                        if market_prices[0] > 0
-                        else 0
                     )
-                    sector_return = (
-                        (current_sector_price - sector_prices[0]) / sector_prices[0] * 100
-                        if sector_prices[0] > 0
-                        else 0
-                    )
-                    relative_performance = sector_return - market_return
 
-                    # Check if above MA
-                    above_ma = (
-                        current_sector_price > current_sector_ma_50
-                        if current_sector_ma_50
-                        else False
-                    )
-                    above_200ma = (
-                        current_sector_price > current_sector_ma_200
-                        if current_sector_ma_200 is not None
-                        else None
+                # Both only read the tail: RSI the last 15 closes, the latest 20-day
+                # volatility the last 21 (the rolling series needs one more to align)
+                rsi_14d = relative_strength_index(closes, period=14)
+                volatility_list = rolling_volatility_annualized_from_prices(closes[-22:], window=20)
+                volatility_20d = (
+                    volatility_list[-1] * 100
+                    if volatility_list and volatility_list[-1] is not None
+                    else None
+                )  # Convert to percentage
+
+                # Calculate performance vs. market
+                sector_return = _return_pct(sector_prices, len(sector_prices)) or 0.0
+                relative_performance = sector_return - market_return
+
+                # Check if above MA
+                above_ma = bool(above_50ma[row])
+                above_200ma = (
+                    current_sector_price > current_sector_ma_200
+                    if current_sector_ma_200 is not None
+                    else None
+                )
+                above_market = relative_performance > 0
+
+                if above_ma:
+                    sectors_above_ma += 1
+                if above_market:
+                    sectors_above_market += 1
+
+                total_sectors += 1
+
+                analyzed.append((sector_symbol, sector_name, above_ma, above_200ma))
+                raw_metrics.append(
+                    (
+                        current_sector_price,
+                        relative_performance,
+                        sector_return,
+                        market_return,
+                        return_1d,
+                        return_5d,
+                        return_120d,
+                        return_ytd,
+                        rsi_14d,
+                        volatility_20d,
                     )
-                    above_market = relative_performance > 0
-
-                    if above_ma:
-                        sectors_above_ma += 1
-                    if above_market:
-                        sectors_above_market += 1
-
-                    total_sectors += 1
-
-                    sector_performance[sector_symbol] = {
-                        "name": sector_name,
-                        "current_price": round(current_sector_price, 2),
-                        "above_50ma": above_ma,
-                        "relative_performance_pct": round(relative_performance, 2),
-                        "sector_return_pct": round(sector_return, 2),
-                        "market_return_pct": round(market_return, 2),
-                        "return_1d": round(return_1d, 2) if return_1d is not None else None,
-                        "return_5d": round(return_5d, 2) if return_5d is not None else None,
-                        "return_120d": round(return_120d, 2) if return_120d is not None else None,
-                        "return_ytd": round(return_ytd, 2) if return_ytd is not None else None,
-                        "price_above_200ma": above_200ma,
-                        "rsi_14d": round(rsi_14d, 2) if rsi_14d is not None else None,
-                        "volatility_20d": (
-                            round(volatility_20d, 2) if volatility_20d is not None else None
-                        ),
-                        "market_cap": market_caps.get(sector_symbol),
-                        "market_cap_rank": market_cap_ranks.get(sector_symbol),
-                    }
+                )
 
-                except Exception as e:
-                    logger.debug(
-                        "Failed to calculate sector metrics",
-                        sector=sector_symbol,
-                        error=str(e),
-                    )
-                    continue
+            # Round every sector's metrics in one call; unavailable (None) values go
+            # through as NaN and come back out as None
+            rounded = np.round(np.array(raw_metrics, dtype=np.float64), 2).tolist()
+            for (sector_symbol, sector_name, above_ma, above_200ma), values in zip(
+                analyzed, rounded, strict=True
+            ):
+                (
+                    current_price,
+                    relative_pct,
+                    sector_pct,
+                    market_pct,
+                    return_1d,
+                    return_5d,
+                    return_120d,
+                    return_ytd,
+                    rsi_14d,
+                    volatility_20d,
+                ) = (None if value != value else value for value in values)
+                sector_performance[sector_symbol] = {
+                    "name": sector_name,
+                    "current_price": current_price,
+                    "above_50ma": above_ma,
+                    "relative_performance_pct": relative_pct,
+                    "sector_return_pct": sector_pct,
+                    "market_return_pct": market_pct,
+                    "return_1d": return_1d,
+                    "return_5d": return_5d,
+                    "return_120d": return_120d,
+                    "return_ytd": return_ytd,
+                    "price_above_200ma": above_200ma,
+                    "rsi_14d": rsi_14d,
+                    "volatility_20d": volatility_20d,
+                    "market_cap": market_caps.get(sector_symbol),
+                    "market_cap_rank": market_cap_ranks.get(sector_symbol),
+                }
 
             if total_sectors == 0:
                 return {
@@ -781,13 +1024,10 @@ class MarketRegimeIndicatorsTool(Tool):
                 "error": str(e),
             }
 
-    async def _calculate_sector_rotation(
+    def _calculate_sector_rotation(
         self,
         market_index: str,
-        start_date: datetime,
-        end_date: datetime,
-        market_data: list | None = None,
-        sector_data_cache: dict[str, list] | None = None,
+        prices: dict[str, np.ndarray],
     ) -> dict[str, Any]:
         """Calculate sector rotation signals.
 
@@ -799,20 +1039,14 @@ class MarketRegimeIndicatorsTool(Tool):
 
         Args:
             market_index: Market index symbol (e.g., "SPY")
-            start_date: Start date for analysis
-            end_date: End date for analysis
+            prices: Close prices keyed by symbol for the market index and sector ETFs
 
         Returns:
             Dictionary with sector rotation signals
         """
         try:
-            # Use provided market data or fetch if not provided
-            if market_data is None:
-                market_data = await self._get_historical_data_cached(
-                    market_index, start_date, end_date, "1d"
-                )
-
-            if not market_data:
+            market_prices = prices.get(market_index)
+            if market_prices is None or not len(market_prices):
                 return {
                     "available": False,
                     "market_return_20d": 0.0,
@@ -820,8 +1054,6 @@ class MarketRegimeIndicatorsTool(Tool):
                     "error": f"No data available for {market_index}",
                 }
 
-            market_prices = [float(d.close_price) for d in market_data if d.close_price is not None]
-
             if len(market_prices) < 20:
                 return {
                     "available": False,
@@ -831,84 +1063,20 @@ class MarketRegimeIndicatorsTool(Tool):
                 }
 
             # Calculate market returns
-            market_return_20d = (
-                (market_prices[-1] - market_prices[-20]) / market_prices[-20] * 100
-                if len(market_prices) >= 20 and market_prices[-20] > 0
-                else 0
-            )
-            market_return_60d = (
-                (market_prices[-1] - market_prices[-60]) / market_prices[-60] * 100
-                if len(market_prices) >= 60 and market_prices[-60] > 0
-                else 0
-            )
-
-            # Use cached sector data or fetch if not provided
-            if sector_data_cache is None:
-                sector_data_cache = {}
-
-            # Analyze sector ETFs using cached data
-            sector_momentum: list[dict[str, Any]] = []
-
-            for sector_symbol, sector_name in SECTOR_ETFS.items():
-                try:
-                    # Use cached data if available, otherwise fetch
-                    if sector_symbol in sector_data_cache:
-                        sector_data = sector_data_cache[sector_symbol]
-                    else:
-                        sector_data = await self._get_historical_data_cached(
-                            sector_symbol, start_date, end_date, "1d"
-                        )
-
-                    if not sector_data or len(sector_data) < 60:
-                        continue
-
-                    sector_prices = [
-                        float(d.close_price) for d in sector_data if d.close_price is not None
-                    ]
-
-                    if len(sector_prices) < 60:
-                        continue
-
-                    # Calculate sector returns
-                    sector_return_20d = (
-                        (sector_prices[-1] - sector_prices[-20]) / sector_prices[-20] * 100
-                        if len(sector_prices) >= 20 and sector_prices[-20] > 0
-                        else 0
-                    )
-                    sector_return_60d = (
-                        (sector_prices[-1] - sector_prices[-60]) / sector_prices[-60] * 100
-                        if len(sector_prices) >= 60 and sector_prices[-60] > 0
-                        else 0
-                    )
-
-                    # Calculate relative momentum
-                    relative_momentum_20d = sector_return_20d - market_return_20d
-                    relative_momentum_60d = sector_return_60d - market_return_60d
-
-                    # Momentum score (weighted: recent momentum more important)
-                    momentum_score = (relative_momentum_20d * 0.6) + (relative_momentum_60d * 0.4)
-
-                    sector_momentum.append(
-                        {
-                            "symbol": sector_symbol,
-                            "name": sector_name,
-                            "momentum_score": round(momentum_score, 2),
-                            "relative_momentum_20d": round(relative_momentum_20d, 2),
-                            "relative_momentum_60d": round(relative_momentum_60d, 2),
-                            "sector_return_20d": round(sector_return_20d, 2),
-                            "sector_return_60d": round(sector_return_60d, 2),
-                        }
-                    )
-
-                except Exception as e:
-                    logger.debug(
-                        "Failed to fetch sector data for rotation",
-                        sector=sector_symbol,
-                        error=str(e),
-                    )
+            market_return_20d = _return_pct(market_prices, 20) or 0.0
+            market_return_60d = _return_pct(market_prices, 60) or 0.0
+
+            # Collect the last 60 closes of every sector with enough history
+            sectors: list[tuple[str, str]] = []
+            tails: list[np.ndarray] = []
+            for sector in SECTOR_ETFS_PAIRS:
+                sector_prices = prices.get(sector[0])
+                if sector_prices is None or len(sector_prices) < 60:
                     continue
+                sectors.append(sector)
+                tails.append(sector_prices[-60:])
 
-            if not sector_momentum:
+            if not tails:
                 return {
                     "available": False,
                     "market_return_20d": 0.0,
@@ -916,8 +1084,53 @@ class MarketRegimeIndicatorsTool(Tool):
                     "error": "No sector data available for rotation calculation",
                 }
 
-            # Sort by momentum score (highest first)
-            sector_momentum.sort(key=lambda x: x["momentum_score"], reverse=True)
+            # Returns and momentum for all sectors at once, one row per sector
+            matrix = np.stack(tails)
+            sector_returns_20d = _return_pct_rows(matrix, 20)
+            sector_returns_60d = _return_pct_rows(matrix, 60)
+
+            # Calculate relative momentum
+            relative_momentum_20d = sector_returns_20d - market_return_20d
+            relative_momentum_60d = sector_returns_60d - market_return_60d
+
+            # Momentum score (weighted: recent momentum more important)
+            momentum_scores = (relative_momentum_20d * 0.6) + (relative_momentum_60d * 0.4)
+
+            # Round every metric in one pass; columns follow the output field order
+            metrics = np.round(
+                np.stack(
+                    [
+                        momentum_scores,
+                        relative_momentum_20d,
+                        relative_momentum_60d,
+                        sector_returns_20d,
+                        sector_returns_60d,
+                    ],
+                    axis=1,
+                ),
+                2,
+            )
+
+            # Rank by rounded momentum score (highest first, ties keep sector order) and
+            # build the output dicts once, already in ranked order
+            order = np.argsort(-metrics[:, 0], kind="stable").tolist()
+            ranked_metrics = metrics[order].tolist()
+            sector_momentum: list[dict[str, Any]] = []
+            for i, (score, rel_20d, rel_60d, ret_20d, ret_60d) in zip(
+                order, ranked_metrics, strict=True
+            ):
+                sector_symbol, sector_name = sectors[i]
+                sector_momentum.append(
+                    {
+                        "symbol": sector_symbol,
+                        "name": sector_name,
+                        "momentum_score": score,
+                        "relative_momentum_20d": rel_20d,
+                        "relative_momentum_60d": rel_60d,
+                        "sector_return_20d": ret_20d,
+                        "sector_return_60d": ret_60d,
+                    }
+                )
 
             # Identify rotation themes
             # Top 3 sectors = leading rotation
@@ -925,18 +1138,11 @@ class MarketRegimeIndicatorsTool(Tool):
             leading_sectors = sector_momentum[:3]
             lagging_sectors = sector_momentum[-3:]
 
-            # Classify rotation theme
-            # Check if defensive sectors (utilities, staples) are leading
-            defensive_symbols = {"XLU", "XLP"}
-            defensive_leading = any(s["symbol"] in defensive_symbols for s in leading_sectors)
-
-            # Check if growth sectors (technology, discretionary) are leading
-            growth_symbols = {"XLK", "XLY"}
-            growth_leading = any(s["symbol"] in growth_symbols for s in leading_sectors)
-
-            # Check if value sectors (financials, industrials) are leading
-            value_symbols = {"XLF", "XLI"}
-            value_leading = any(s["symbol"] in value_symbols for s in leading_sectors)
+            # Classify rotation theme by which sector groups are among the leaders
+            leading_symbols = {s["symbol"] for s in leading_sectors}
+            defensive_leading = not DEFENSIVE_SECTORS.isdisjoint(leading_symbols)
+            growth_leading = not GROWTH_SECTORS.isdisjoint(leading_symbols)
+            value_leading = not VALUE_SECTORS.isdisjoint(leading_symbols)
 
             if defensive_leading and not growth_leading:
                 rotation_theme = "defensive"
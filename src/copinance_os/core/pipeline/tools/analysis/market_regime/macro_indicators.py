@@ -6,8 +6,11 @@ falls back to yfinance proxies via MarketDataProvider when needed.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
-from datetime import UTC, datetime, timedelta
+import time
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime, timedelta
 from typing import Any, cast
 
 import structlog
@@ -16,6 +19,7 @@ from copinance_os.data.cache import CacheManager
 from copinance_os.data.literacy import macro_indicators as macro_lit
 from copinance_os.domain.literacy import resolve_financial_literacy
 from copinance_os.domain.models.entities.profile import FinancialLiteracy
+from copinance_os.domain.models.market import MacroDataPoint
 from copinance_os.domain.models.pipeline.tool_results import ToolResult
 from copinance_os.domain.ports.data_providers import MacroeconomicDataProvider, MarketDataProvider
 from copinance_os.domain.ports.tools import Tool, ToolSchema
@@ -34,6 +38,12 @@ logger = structlog.get_logger(__name__)
 # Cache key used for FRED/macro block results (per block + date range)
 MACRO_BLOCK_CACHE_TOOL_NAME = "get_macro_regime_indicators_block"
 
+# How long fetched macro series are reused in-process by a tool instance
+DEFAULT_SERIES_CACHE_TTL_SECONDS = 900.0
+
+# (series ID, start day, end day) identifying one time-series request
+_SeriesKey = tuple[str, date, date]
+
 
 class MacroRegimeIndicatorsTool(Tool):
     """Tool that returns macro regime indicators (rates, credit, commodities)."""
@@ -43,10 +53,25 @@ class MacroRegimeIndicatorsTool(Tool):
         macro_data_provider: MacroeconomicDataProvider,
         market_data_provider: MarketDataProvider,
         cache_manager: CacheManager | None = None,
+        series_cache_ttl_seconds: float | None = DEFAULT_SERIES_CACHE_TTL_SECONDS,
     ) -> None:
+        """Initialize tool with macro and market data providers and optional cache.
+
+        Args:
+            macro_data_provider: Provider for macroeconomic time series (e.g., FRED)
+            market_data_provider: Provider for yfinance proxy data
+            cache_manager: Optional cache manager for computed blocks
+            series_cache_ttl_seconds: How long this instance reuses fetched macro
+                series in-process. ``None`` disables the in-process cache.
+        """
         self._macro_provider = macro_data_provider
         self._market_provider = market_data_provider
         self._cache_manager = cache_manager
+        self._series_cache_ttl_seconds = series_cache_ttl_seconds
+        # (series ID, start day, end day) -> (monotonic fetch time, points)
+        self._series_cache: dict[_SeriesKey, tuple[float, list[MacroDataPoint]]] = {}
+        # Fetches in progress; concurrent requests for the same key await the same task
+        self._series_inflight: dict[_SeriesKey, asyncio.Task[list[MacroDataPoint]]] = {}
 
     @staticmethod
     def _apply_literacy_to_interpretation(
@@ -125,6 +150,108 @@ class MacroRegimeIndicatorsTool(Tool):
                 end_date=end_str,
             )
 
+    async def _check_fred_available(self) -> bool:
+        """Probe the macro provider once; a probe that raises counts as unavailable."""
+        try:
+            return await self._macro_provider.is_available()
+        except Exception as e:
+            logger.warning("FRED availability check raised; using fallbacks", error=str(e))
+            return False
+
+    def _has_fred_api_key(self) -> bool:
+        """Whether the macro provider has an API key configured (even if unreachable)."""
+        return getattr(self._macro_provider, "_api_key", None) is not None
+
+    async def _get_time_series_cached(
+        self, series_id: str, start_date: datetime, end_date: datetime
+    ) -> list[MacroDataPoint]:
+        """Fetch a macro series, reusing recent results from this instance.
+
+        Results are kept in an in-process TTL cache keyed by series and calendar day,
+        so repeated tool calls within the TTL skip the provider. Concurrent calls for
+        the same key share one in-flight fetch. Empty results and errors are not
+        cached.
+        """
+        key = (series_id, start_date.date(), end_date.date())
+        ttl = self._series_cache_ttl_seconds
+        if ttl is not None:
+            hit = self._series_cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < ttl:
+                return hit[1]
+
+        task = self._series_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._load_and_remember_series(key, series_id, start_date, end_date)
+            )
+            self._series_inflight[key] = task
+            task.add_done_callback(self._forget_inflight_series(key))
+        # Shielded so one cancelled caller does not cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    def _forget_inflight_series(self, key: _SeriesKey) -> Callable[[asyncio.Task[Any]], None]:
+        """Build a done-callback that drops a finished fetch from the in-flight map."""
+
+        def forget(task: asyncio.Task[Any]) -> None:
+            self._series_inflight.pop(key, None)
+            if not task.cancelled():
+                # Mark the error as retrieved even if every caller was cancelled
+                task.exception()
+
+        return forget
+
+    async def _load_and_remember_series(
+        self, key: _SeriesKey, series_id: str, start_date: datetime, end_date: datetime
+    ) -> list[MacroDataPoint]:
+        """Load a macro series and store non-empty results in the TTL cache."""
+        points = await self._macro_provider.get_time_series(series_id, start_date, end_date)
+        ttl = self._series_cache_ttl_seconds
+        if ttl is not None and points:
+            now = time.monotonic()
+            # Drop expired entries so the cache does not grow across days and windows
+            self._series_cache = {k: v for k, v in self._series_cache.items() if now - v[0] < ttl}
+            self._series_cache[key] = (now, points)
+        return points
+
+    async def _fetch_series_metrics(
+        self,
+        fred_series: dict[str, tuple[str, str]],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch FRED series concurrently and summarize each with its unit.
+
+        Each distinct series ID is requested once. If any request fails, the first
+        error is raised after all requests have finished, so the calling block fails
+        over as a whole just as it did when the series were fetched one by one.
+
+        Args:
+            fred_series: Output key -> (FRED series ID, unit)
+            start_date: Start of the observation window
+            end_date: End of the observation window
+
+        Returns:
+            Series metrics keyed like ``fred_series``, in the same order
+        """
+        series_ids = list(dict.fromkeys(series_id for series_id, _ in fred_series.values()))
+        results = await asyncio.gather(
+            *(
+                self._get_time_series_cached(series_id, start_date, end_date)
+                for series_id in series_ids
+            ),
+            return_exceptions=True,
+        )
+        points_by_id = dict(zip(series_ids, results, strict=True))
+        series: dict[str, dict[str, Any]] = {}
+        for key, (series_id, unit) in fred_series.items():
+            points = points_by_id[series_id]
+            if isinstance(points, BaseException):
+                raise points
+            metrics = _series_metrics(points)
+            metrics["unit"] = unit
+            series[key] = metrics
+        return series
+
     def get_name(self) -> str:
         return "get_macro_regime_indicators"
 
@@ -228,50 +355,66 @@ class MacroRegimeIndicatorsTool(Tool):
                 "lookback_days": lookback_days,
             }
 
-            if include_rates:
-                data["rates"] = self._resolve_block_literacy(
-                    await self._get_rates_block(start_date, end_date), lit
-                )
-
-            if include_credit:
-                data["credit"] = self._resolve_block_literacy(
-                    await self._get_credit_block(start_date, end_date), lit
-                )
-
-            if include_commodities:
-                data["commodities"] = self._resolve_block_literacy(
-                    await self._get_commodities_block(start_date, end_date), lit
-                )
-
-            if include_labor:
-                data["labor"] = self._resolve_block_literacy(
-                    await self._get_labor_block(start_date, end_date), lit
-                )
-
-            if include_housing:
-                data["housing"] = self._resolve_block_literacy(
-                    await self._get_housing_block(start_date, end_date), lit
-                )
-
-            if include_manufacturing:
-                data["manufacturing"] = self._resolve_block_literacy(
-                    await self._get_manufacturing_block(start_date, end_date), lit
-                )
-
-            if include_consumer:
-                data["consumer"] = self._resolve_block_literacy(
-                    await self._get_consumer_block(start_date, end_date), lit
-                )
-
-            if include_global:
-                data["global"] = self._resolve_block_literacy(
-                    await self._get_global_block(start_date, end_date), lit
-                )
+            included = {
+                "rates": include_rates,
+                "credit": include_credit,
+                "commodities": include_commodities,
+                "labor": include_labor,
+                "housing": include_housing,
+                "manufacturing": include_manufacturing,
+                "consumer": include_consumer,
+                "global": include_global,
+                "advanced": include_advanced,
+            }
+            requested = [name for name, include in included.items() if include]
 
-            if include_advanced:
-                data["advanced"] = self._resolve_block_literacy(
-                    await self._get_advanced_block(start_date, end_date), lit
+            # Cached blocks are served without touching any provider
+            cached = await asyncio.gather(
+                *(self._get_block_cached(name, start_date, end_date) for name in requested)
+            )
+            blocks: dict[str, Any] = {
+                name: block
+                for name, block in zip(requested, cached, strict=True)
+                if block is not None
+            }
+            missing = [name for name in requested if name not in blocks]
+
+            fred_blocks: dict[str, Callable[[datetime, datetime, bool], Awaitable[dict[str, Any]]]]
+            fred_blocks = {
+                "rates": self._get_rates_block,
+                "credit": self._get_credit_block,
+                "commodities": self._get_commodities_block,
+                "labor": self._get_labor_block,
+                "housing": self._get_housing_block,
+                "manufacturing": self._get_manufacturing_block,
+                "consumer": self._get_consumer_block,
+                "advanced": self._get_advanced_block,
+            }
+            # One availability probe per call, shared by every block that uses FRED
+            fred_available = False
+            if any(name in fred_blocks for name in missing):
+                fred_available = await self._check_fred_available()
+
+            # Blocks are independent network-bound fetches, so they run concurrently
+            pending: dict[str, Awaitable[dict[str, Any]]] = {
+                name: (
+                    fred_blocks[name](start_date, end_date, fred_available)
+                    if name in fred_blocks
+                    else self._get_global_block(start_date, end_date)
                 )
+                for name in missing
+            }
+            outcomes = await asyncio.gather(*pending.values(), return_exceptions=True)
+            for block_name, block in zip(pending, outcomes, strict=True):
+                # One failing block must not sink the others
+                if isinstance(block, BaseException):
+                    logger.warning("Macro block failed", block=block_name, error=str(block))
+                    block = {"available": False, "error": str(block)}
+                blocks[block_name] = block
+
+            # Results keep the fixed block order above
+            for block_name in requested:
+                data[block_name] = self._resolve_block_literacy(blocks[block_name], lit)
 
             return ToolResult(success=True, data=data, metadata={"lookback_days": lookback_days})
         except Exception as e:
@@ -283,18 +426,13 @@ class MacroRegimeIndicatorsTool(Tool):
                 metadata={"error_type": type(e).__name__},
             )
 
-    async def _get_rates_block(self, start_date: datetime, end_date: datetime) -> dict[str, Any]:
-        cached = await self._get_block_cached("rates", start_date, end_date)
-        if cached is not None:
-            return cached
-        # Check if FRED is available first
-        fred_available = await self._macro_provider.is_available()
+    async def _get_rates_block(
+        self, start_date: datetime, end_date: datetime, fred_available: bool
+    ) -> dict[str, Any]:
         provider_name = self._macro_provider.get_provider_name()
 
         # Check if API key is configured (even if availability check failed)
-        has_api_key = (
-            hasattr(self._macro_provider, "_api_key") and self._macro_provider._api_key is not None
-        )
+        has_api_key = self._has_fred_api_key()
 
         if not fred_available:
             if not has_api_key:
@@ -330,13 +468,9 @@ class MacroRegimeIndicatorsTool(Tool):
         if fred_available:
             out: dict[str, Any] = {"available": True, "source": "fred", "series": {}}
             try:
-                for key, (series_id, unit) in fred_series.items():
-                    points = await self._macro_provider.get_time_series(
-                        series_id, start_date, end_date
-                    )
-                    metrics = _series_metrics(points)
-                    metrics["unit"] = unit
-                    out["series"][key] = metrics
+                out["series"].update(
+                    await self._fetch_series_metrics(fred_series, start_date, end_date)
+                )
 
                 # Interpret 10Y trend and yield curve inversion
                 teny = out["series"].get("10y_nominal", {})
@@ -415,18 +549,13 @@ class MacroRegimeIndicatorsTool(Tool):
             await self._set_block_cached("rates", start_date, end_date, out)
             return out
 
-    async def _get_credit_block(self, start_date: datetime, end_date: datetime) -> dict[str, Any]:
-        cached = await self._get_block_cached("credit", start_date, end_date)
-        if cached is not None:
-            return cached
-        # Check if FRED is available first
-        fred_available = await self._macro_provider.is_available()
+    async def _get_credit_block(
+        self, start_date: datetime, end_date: datetime, fred_available: bool
+    ) -> dict[str, Any]:
         provider_name = self._macro_provider.get_provider_name()
 
         # Check if API key is configured (even if availability check failed)
-        has_api_key = (
-            hasattr(self._macro_provider, "_api_key") and self._macro_provider._api_key is not None
-        )
+        has_api_key = self._has_fred_api_key()
 
         if not fred_available:
             if not has_api_key:
@@ -448,10 +577,10 @@ class MacroRegimeIndicatorsTool(Tool):
         if fred_available:
             out: dict[str, Any] = {"available": True, "source": "fred", "series": {}}
             try:
-                hy = await self._macro_provider.get_time_series(
-                    "BAMLH0A0HYM2", start_date, end_date
+                hy, ig = await asyncio.gather(
+                    self._get_time_series_cached("BAMLH0A0HYM2", start_date, end_date),
+                    self._get_time_series_cached("BAMLC0A0CM", start_date, end_date),
                 )
-                ig = await self._macro_provider.get_time_series("BAMLC0A0CM", start_date, end_date)
                 out["series"]["hy_oas_bps"] = _series_metrics(hy)
                 out["series"]["ig_oas_bps"] = _series_metrics(ig)
 
@@ -558,19 +687,12 @@ class MacroRegimeIndicatorsTool(Tool):
             return out
 
     async def _get_commodities_block(
-        self, start_date: datetime, end_date: datetime
+        self, start_date: datetime, end_date: datetime, fred_available: bool
     ) -> dict[str, Any]:
-        cached = await self._get_block_cached("commodities", start_date, end_date)
-        if cached is not None:
-            return cached
-        # Check if FRED is available first
-        fred_available = await self._macro_provider.is_available()
         provider_name = self._macro_provider.get_provider_name()
 
         # Check if API key is configured (even if availability check failed)
-        has_api_key = (
-            hasattr(self._macro_provider, "_api_key") and self._macro_provider._api_key is not None
-        )
+        has_api_key = self._has_fred_api_key()
 
         if not fred_available:
             if not has_api_key:
@@ -592,7 +714,7 @@ class MacroRegimeIndicatorsTool(Tool):
         if fred_available:
             out: dict[str, Any] = {"available": True, "source": "fred", "series": {}}
             try:
-                wti = await self._macro_provider.get_time_series("DCOILWTICO", start_date, end_date)
+                wti = await self._get_time_series_cached("DCOILWTICO", start_date, end_date)
                 metrics = _series_metrics(wti)
                 metrics["unit"] = "usd_per_barrel"
                 out["series"]["wti_spot"] = metrics
@@ -640,16 +762,11 @@ class MacroRegimeIndicatorsTool(Tool):
             await self._set_block_cached("commodities", start_date, end_date, out)
             return out
 
-    async def _get_labor_block(self, start_date: datetime, end_date: datetime) -> dict[str, Any]:
+    async def _get_labor_block(
+        self, start_date: datetime, end_date: datetime, fred_available: bool
+    ) -> dict[str, Any]:
         """Labor market indicators: unemployment, payrolls, JOLTS."""
-        cached = await self._get_block_cached("labor", start_date, end_date)
-        if cached is not None:
-            return cached
-        fred_available = await self._macro_provider.is_available()
-
-        has_api_key = (
-            hasattr(self._macro_provider, "_api_key") and self._macro_provider._api_key is not None
-        )
+        has_api_key = self._has_fred_api_key()
 
         out: dict[str, Any]
         if not fred_available:
@@ -673,11 +790,9 @@ class MacroRegimeIndicatorsTool(Tool):
                 "jolts_quits": ("JTSQUR", "thousands"),
             }
 
-            for key, (series_id, unit) in fred_series.items():
-                points = await self._macro_provider.get_time_series(series_id, start_date, end_date)
-                metrics = _series_metrics(points)
-                metrics["unit"] = unit
-                out["series"][key] = metrics
+            out["series"].update(
+                await self._fetch_series_metrics(fred_series, start_date, end_date)
+            )
 
             # Interpret labor market conditions
             unemployment = out["series"].get("unemployment_rate", {})
@@ -717,16 +832,11 @@ class MacroRegimeIndicatorsTool(Tool):
             await self._set_block_cached("labor", start_date, end_date, out)
             return out
 
-    async def _get_housing_block(self, start_date: datetime, end_date: datetime) -> dict[str, Any]:
+    async def _get_housing_block(
+        self, start_date: datetime, end_date: datetime, fred_available: bool
+    ) -> dict[str, Any]:
         """Housing market indicators: new/existing sales, Case-Shiller."""
-        cached = await self._get_block_cached("housing", start_date, end_date)
-        if cached is not None:
-            return cached
-        fred_available = await self._macro_provider.is_available()
-
-        has_api_key = (
-            hasattr(self._macro_provider, "_api_key") and self._macro_provider._api_key is not None
-        )
+        has_api_key = self._has_fred_api_key()
 
         out: dict[str, Any]
         if not fred_available:
@@ -751,11 +861,9 @@ class MacroRegimeIndicatorsTool(Tool):
                 "building_permits": ("PERMIT", "thousands"),
             }
 
-            for key, (series_id, unit) in fred_series.items():
-                points = await self._macro_provider.get_time_series(series_id, start_date, end_date)
-                metrics = _series_metrics(points)
-                metrics["unit"] = unit
-                out["series"][key] = metrics
+            out["series"].update(
+                await self._fetch_series_metrics(fred_series, start_date, end_date)
+            )
 
             # Interpret housing market conditions
             cs_index = out["series"].get("case_shiller_20_city", {})
@@ -795,17 +903,10 @@ class MacroRegimeIndicatorsTool(Tool):
             return out
 
     async def _get_manufacturing_block(
-        self, start_date: datetime, end_date: datetime
+        self, start_date: datetime, end_date: datetime, fred_available: bool
     ) -> dict[str, Any]:
         """Manufacturing indicators: ISM, industrial production, capacity utilization."""
-        cached = await self._get_block_cached("manufacturing", start_date, end_date)
-        if cached is not None:
-            return cached
-        fred_available = await self._macro_provider.is_available()
-
-        has_api_key = (
-            hasattr(self._macro_provider, "_api_key") and self._macro_provider._api_key is not None
-        )
+        has_api_key = self._has_fred_api_key()
 
         out: dict[str, Any]
         if not fred_available:
@@ -838,11 +939,9 @@ class MacroRegimeIndicatorsTool(Tool):
                 ),  # Durable manufacturing
             }
 
-            for key, (series_id, unit) in fred_series.items():
-                points = await self._macro_provider.get_time_series(series_id, start_date, end_date)
-                metrics = _series_metrics(points)
-                metrics["unit"] = unit
-                out["series"][key] = metrics
+            out["series"].update(
+                await self._fetch_series_metrics(fred_series, start_date, end_date)
+            )
 
             # Interpret manufacturing conditions
             ip = out["series"].get("industrial_production", {})
@@ -879,16 +978,11 @@ class MacroRegimeIndicatorsTool(Tool):
             await self._set_block_cached("manufacturing", start_date, end_date, out)
             return out
 
-    async def _get_consumer_block(self, start_date: datetime, end_date: datetime) -> dict[str, Any]:
+    async def _get_consumer_block(
+        self, start_date: datetime, end_date: datetime, fred_available: bool
+    ) -> dict[str, Any]:
         """Consumer indicators: retail sales, confidence, spending."""
-        cached = await self._get_block_cached("consumer", start_date, end_date)
-        if cached is not None:
-            return cached
-        fred_available = await self._macro_provider.is_available()
-
-        has_api_key = (
-            hasattr(self._macro_provider, "_api_key") and self._macro_provider._api_key is not None
-        )
+        has_api_key = self._has_fred_api_key()
 
         out: dict[str, Any]
         if not fred_available:
@@ -916,17 +1010,22 @@ class MacroRegimeIndicatorsTool(Tool):
                 "real_pce": ("PCEC96", "billions_chained_2012_dollars"),  # Real PCE
             }
 
-            for key, (series_id, unit) in fred_series.items():
-                points = await self._macro_provider.get_time_series(series_id, start_date, end_date)
-                metrics = _series_metrics(points)
-                metrics["unit"] = unit
-                out["series"][key] = metrics
+            # RSXFS (for the month-over-month change) is only used when retail sales
+            # are available, but it is requested alongside the other series so the
+            # block makes a single round of requests; its failure only matters if used
+            series_metrics, sales_points = await asyncio.gather(
+                self._fetch_series_metrics(fred_series, start_date, end_date),
+                self._get_time_series_cached("RSXFS", start_date, end_date),
+                return_exceptions=True,
+            )
+            if isinstance(series_metrics, BaseException):
+                raise series_metrics
+            out["series"].update(series_metrics)
 
             # Calculate retail sales month-over-month change
             if out["series"]["retail_sales"].get("available"):
-                sales_points = await self._macro_provider.get_time_series(
-                    "RSXFS", start_date, end_date
-                )
+                if isinstance(sales_points, BaseException):
+                    raise sales_points
                 if len(sales_points) >= 2:
                     latest_sales = sales_points[-1].value
                     prev_sales = sales_points[-2].value
@@ -995,9 +1094,6 @@ class MacroRegimeIndicatorsTool(Tool):
 
     async def _get_global_block(self, start_date: datetime, end_date: datetime) -> dict[str, Any]:
         """Global indicators: FX rates, emerging market flows."""
-        cached = await self._get_block_cached("global", start_date, end_date)
-        if cached is not None:
-            return cached
         # Use market data provider for FX rates
         out: dict[str, Any] = {"available": True, "source": "yfinance", "series": {}}
         try:
@@ -1093,33 +1189,23 @@ class MacroRegimeIndicatorsTool(Tool):
             await self._set_block_cached("global", start_date, end_date, out)
             return out
 
-    async def _get_advanced_block(self, start_date: datetime, end_date: datetime) -> dict[str, Any]:
+    async def _get_advanced_block(
+        self, start_date: datetime, end_date: datetime, fred_available: bool
+    ) -> dict[str, Any]:
         """Advanced indicators: LEI, CDS spreads, Fed balance sheet."""
-        cached = await self._get_block_cached("advanced", start_date, end_date)
-        if cached is not None:
-            return cached
-        fred_available = await self._macro_provider.is_available()
-
         out: dict[str, Any] = {"available": True, "source": "mixed", "series": {}}
 
         # Try FRED first for LEI and other advanced indicators
         if fred_available:
             try:
-                # Leading Economic Index
-                lei_points = await self._macro_provider.get_time_series(
-                    "USSLIND", start_date, end_date
-                )
-                lei_metrics = _series_metrics(lei_points)
-                lei_metrics["unit"] = "index_2010_100"
-                out["series"]["leading_economic_index"] = lei_metrics
-
-                # Federal Reserve Balance Sheet (weekly)
-                fed_bs_points = await self._macro_provider.get_time_series(
-                    "WALCL", start_date, end_date
+                fred_series = {
+                    "leading_economic_index": ("USSLIND", "index_2010_100"),
+                    # Federal Reserve Balance Sheet (weekly)
+                    "fed_balance_sheet": ("WALCL", "billions_dollars"),
+                }
+                out["series"].update(
+                    await self._fetch_series_metrics(fred_series, start_date, end_date)
                 )
-                fed_bs_metrics = _series_metrics(fed_bs_points)
-                fed_bs_metrics["unit"] = "billions_dollars"
-                out["series"]["fed_balance_sheet"] = fed_bs_metrics
 
                 # Interpret advanced indicators
                 lei = out["series"].get("leading_economic_index", {})
@@ -0,0 +1,62 @@
+"""Compact JSON encoding for persisted state.
+
+Uses ``orjson`` when installed (``pip install copinance-os[orjson]``) and falls
+back to the standard library with compact separators. Both paths produce and
+accept UTF-8 ``bytes`` so callers can use ``Path.read_bytes`` / ``write_bytes``.
+Decode errors are always :class:`json.JSONDecodeError` (``orjson``'s error
+subclasses it).
+"""
+
+import json
+import mmap
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    ORJSON_AVAILABLE = False
+
+# Files at least this large are memory-mapped instead of read into a bytes copy.
+MMAP_THRESHOLD_BYTES = 1 << 20
+
+
+def dumps_json(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes.
+
+    Output is compact unless ``indent`` is True (two-space indentation).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads_json(data: bytes | bytearray | memoryview | str) -> Any:
+    """Deserialize JSON from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def load_json_file(path: Path) -> Any:
+    """Read and deserialize a JSON file.
+
+    Files of :data:`MMAP_THRESHOLD_BYTES` or more are memory-mapped and parsed
+    in place when ``orjson`` is available, avoiding a full-size ``bytes`` copy.
+    Smaller files (and the stdlib fallback) use ``Path.read_bytes``.
+    """
+    if orjson is None or path.stat().st_size < MMAP_THRESHOLD_BYTES:
+        return loads_json(path.read_bytes())
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        view = memoryview(mm)
+        try:
+            return orjson.loads(view)
+        finally:
+            view.release()
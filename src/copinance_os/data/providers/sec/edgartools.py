@@ -1324,8 +1324,11 @@ class EdgarToolsFundamentalProvider(FundamentalDataProvider):
         symbol: str,
         periods: int = 5,
         period_type: str = "annual",
+        *,
+        as_of: datetime | None = None,
     ) -> StockFundamentals:
         """Minimal snapshot (company name); prefer ``get_financial_statements`` or YFinance for full ratios."""
+        data_as_of = as_of if as_of is not None else datetime.now(UTC)
 
         def _fetch_sync() -> StockFundamentals:
             co = self._company(symbol)
@@ -1365,7 +1368,7 @@ class EdgarToolsFundamentalProvider(FundamentalDataProvider):
                 symbol=symbol.upper(),
                 company_name=name,
                 provider=self._provider_name,
-                data_as_of=datetime.now(UTC),
+                data_as_of=data_as_of,
                 metadata=meta,
             )
 
@@ -1396,7 +1399,7 @@ class EdgarToolsFundamentalProvider(FundamentalDataProvider):
                 symbol=symbol.upper(),
                 company_name=None,
                 provider=self._provider_name,
-                data_as_of=datetime.now(UTC),
+                data_as_of=data_as_of,
                 metadata={
                     "note": "edgartools lookup failed; see error in logs",
                     "periods_requested": str(periods),
@@ -63,6 +63,7 @@ from copinance_os.domain.ports.data_providers import (
     FundamentalDataProvider,
     MarketDataProvider,
 )
+from copinance_os.infra.error_handler import convert_to_domain_exception
 
 logger = structlog.get_logger(__name__)
 
@@ -297,27 +298,7 @@ class YFinanceMarketProvider(MarketDataProvider):
                 )
                 return []
 
-            stock_data_list: list[MarketDataPoint] = []
-            for timestamp, row in hist.iterrows():
-                ts = (
-                    timestamp.to_pydatetime()
-                    if hasattr(timestamp, "to_pydatetime")
-                    else datetime.fromisoformat(str(timestamp))
-                )
-                stock_data = MarketDataPoint(
-                    symbol=symbol.upper(),
-                    timestamp=cast(datetime, ts),
-                    open_price=Decimal(str(float(row["Open"]))),
-                    close_price=Decimal(str(float(row["Close"]))),
-                    high_price=Decimal(str(float(row["High"]))),
-                    low_price=Decimal(str(float(row["Low"]))),
-                    volume=int(row["Volume"]),
-                    metadata={
-                        "interval": interval,
-                        "provider": self._provider_name,
-                    },
-                )
-                stock_data_list.append(stock_data)
+            stock_data_list = self._history_to_data_points(symbol, hist, interval)
 
             logger.info(
                 "Fetched historical data",
@@ -335,6 +316,109 @@ class YFinanceMarketProvider(MarketDataProvider):
                 f"Failed to fetch historical data for {symbol}: {e}",
             ) from e
 
+    async def get_historical_data_batch(
+        self,
+        symbols: Sequence[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> dict[str, list[MarketDataPoint]]:
+        """Get historical market data for several symbols in one download.
+
+        Uses ``yf.download``, which requests all symbols together instead of one
+        ``Ticker.history`` call each. Prices are adjusted like
+        :meth:`get_historical_data`; rows where a symbol has no bar (e.g. another
+        exchange's holiday) are dropped.
+
+        Args:
+            symbols: Stock ticker symbols
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            interval: Data interval (1d, 1wk, 1mo, etc.)
+
+        Returns:
+            MarketDataPoint lists keyed by upper-cased symbol; symbols without data
+            are omitted
+        """
+        tickers = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        try:
+            if not YFINANCE_AVAILABLE:
+                raise ImportError(
+                    "yfinance is not installed. Install it with: pip install yfinance"
+                )
+            if not tickers:
+                return {}
+            frame: DataFrame | None = await asyncio.to_thread(
+                lambda: yf.download(
+                    tickers,
+                    start=start_date,
+                    end=end_date,
+                    interval=interval,
+                    group_by="ticker",
+                    auto_adjust=True,
+                    ignore_tz=False,
+                    progress=False,
+                    multi_level_index=True,
+                ),
+            )
+
+            result: dict[str, list[MarketDataPoint]] = {}
+            if frame is None or frame.empty:
+                logger.warning(
+                    "No historical data found", symbols=tickers, start=start_date, end=end_date
+                )
+                return result
+            downloaded = set(frame.columns.get_level_values(0))
+            for ticker in tickers:
+                if ticker not in downloaded:
+                    continue
+                hist = frame[ticker].dropna(subset=["Close"])
+                if not hist.empty:
+                    result[ticker] = self._history_to_data_points(ticker, hist, interval)
+
+            logger.info(
+                "Fetched batch historical data",
+                symbols=len(tickers),
+                returned=len(result),
+                provider=self._provider_name,
+            )
+            return result
+
+        except Exception as e:
+            logger.error("Failed to fetch batch historical data", symbols=tickers, error=str(e))
+            raise DataProviderError(
+                self._provider_name,
+                "get_historical_data_batch",
+                f"Failed to fetch historical data for {', '.join(tickers)}: {e}",
+            ) from e
+
+    def _history_to_data_points(
+        self, symbol: str, hist: DataFrame, interval: str
+    ) -> list[MarketDataPoint]:
+        """Convert a yfinance OHLCV frame into MarketDataPoint objects."""
+        stock_data_list: list[MarketDataPoint] = []
+        for timestamp, row in hist.iterrows():
+            ts = (
+                timestamp.to_pydatetime()
+                if hasattr(timestamp, "to_pydatetime")
+                else datetime.fromisoformat(str(timestamp))
+            )
+            stock_data = MarketDataPoint(
+                symbol=symbol.upper(),
+                timestamp=cast(datetime, ts),
+                open_price=Decimal(str(float(row["Open"]))),
+                close_price=Decimal(str(float(row["Close"]))),
+                high_price=Decimal(str(float(row["High"]))),
+                low_price=Decimal(str(float(row["Low"]))),
+                volume=int(row["Volume"]),
+                metadata={
+                    "interval": interval,
+                    "provider": self._provider_name,
+                },
+            )
+            stock_data_list.append(stock_data)
+        return stock_data_list
+
     @override
     async def get_intraday_data(
         self,
@@ -1175,13 +1259,17 @@ class YFinanceFundamentalProvider(FundamentalDataProvider):
         symbol: str,
         periods: int = 5,
         period_type: str = "annual",
+        *,
+        as_of: datetime | None = None,
     ) -> StockFundamentals:
         """Get comprehensive detailed fundamentals for a stock.
 
         This method aggregates financial statements, calculates ratios, and provides
         a complete fundamental analysis view normalized from yfinance data.
 
-        Results are cached for the configured TTL to reduce API calls.
+        Results are cached for the configured TTL to reduce API calls. ``as_of``
+        stamps ``data_as_of`` on fresh fetches; a cache hit keeps the timestamp it
+        was fetched with.
         """
         # Check cache first
         cached = self._get_cached_fundamentals(symbol, periods, period_type)
@@ -1219,7 +1307,21 @@ class YFinanceFundamentalProvider(FundamentalDataProvider):
             cashflow_df: DataFrame = await asyncio.to_thread(
                 lambda: getattr(ticker, method_map["cash_flow"])
             )
+        except Exception as e:
+            logger.error(
+                "Failed to fetch detailed fundamentals",
+                symbol=symbol,
+                error=str(e),
+            )
+            raise convert_to_domain_exception(
+                e,
+                self._provider_name,
+                "get_detailed_fundamentals",
+                context={"symbol": symbol},
+                log=False,
+            ) from e
 
+        try:
             # Check if all statements are empty (invalid symbol)
             if income_df.empty and balance_df.empty and cashflow_df.empty:
                 raise DataProviderError(
@@ -1616,7 +1718,7 @@ class YFinanceFundamentalProvider(FundamentalDataProvider):
                 shares_outstanding=shares_outstanding,
                 float_shares=float_shares,
                 provider=self._provider_name,
-                data_as_of=datetime.now(UTC),
+                data_as_of=as_of if as_of is not None else datetime.now(UTC),
                 fiscal_year_end=(
                     info.get("fiscalYearEnd")
                     or info.get("fiscalYearEndDate")
@@ -1625,27 +1727,29 @@ class YFinanceFundamentalProvider(FundamentalDataProvider):
                 currency=info.get("currency"),
                 metadata=fundamentals_metadata,
             )
-
-            logger.info(
-                "Fetched detailed fundamentals",
-                symbol=symbol,
-                periods=len(income_statements),
-                provider=self._provider_name,
-            )
-
-            # Cache the results before returning
-            self._cache_fundamentals(symbol, periods, period_type, fundamentals)
-
-            return fundamentals
-
-        except Exception as e:
+        # yfinance frames and info dicts vary by symbol; missing rows or a None frame
+        # surface as lookup/attribute errors and are reported like bad values
+        except (ValueError, TypeError, AttributeError, LookupError, ArithmeticError) as e:
+            error_str = str(e)
             logger.error(
-                "Failed to fetch detailed fundamentals",
+                "Failed to parse detailed fundamentals",
                 symbol=symbol,
-                error=str(e),
+                error=error_str,
             )
             raise DataProviderError(
                 self._provider_name,
                 "get_detailed_fundamentals",
-                f"Failed to fetch detailed fundamentals for {symbol}: {e}",
+                f"Failed to parse detailed fundamentals for {symbol}: {error_str}",
             ) from e
+
+        logger.info(
+            "Fetched detailed fundamentals",
+            symbol=symbol,
+            periods=len(income_statements),
+            provider=self._provider_name,
+        )
+
+        # Cache the results before returning
+        self._cache_fundamentals(symbol, periods, period_type, fundamentals)
+
+        return fundamentals
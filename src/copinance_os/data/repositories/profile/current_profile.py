@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 from uuid import UUID
 
+from copinance_os.data.loaders.json_codec import dumps_json, loads_json
 from copinance_os.data.loaders.persistence import PERSISTENCE_SCHEMA_VERSION
 
 
@@ -25,8 +26,7 @@ class CurrentProfile:
         if not self._config_path.exists():
             return None
         try:
-            with self._config_path.open(encoding="utf-8") as f:
-                config = json.load(f)
+            config = loads_json(self._config_path.read_bytes())
             if config.get("schema_version") != PERSISTENCE_SCHEMA_VERSION:
                 return None
             current_id = config.get("current_profile_id")
@@ -42,8 +42,7 @@ class CurrentProfile:
         config: dict[str, object] = {}
         if self._config_path.exists():
             try:
-                with self._config_path.open(encoding="utf-8") as f:
-                    config = json.load(f)
+                config = loads_json(self._config_path.read_bytes())
             except (OSError, json.JSONDecodeError, ValueError, TypeError):
                 config = {}
 
@@ -54,5 +53,4 @@ class CurrentProfile:
         config["schema_version"] = PERSISTENCE_SCHEMA_VERSION
 
         self._config_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._config_path.open("w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        self._config_path.write_bytes(dumps_json(config))
@@ -1,5 +1,6 @@
 """Analysis profile repository implementation."""
 
+from itertools import islice
 from uuid import UUID
 
 from copinance_os.data.repositories.storage.factory import StorageType, create_storage
@@ -35,18 +36,17 @@ class AnalysisProfileRepositoryImpl(AnalysisProfileRepository):
     async def save(self, profile: AnalysisProfile) -> AnalysisProfile:
         """Save or update analysis profile."""
         self._collection[profile.id] = profile
-        self._storage.save("analysis/profiles")
+        self._storage.mark_dirty("analysis/profiles", profile.id)
         return profile
 
     async def delete(self, profile_id: UUID) -> bool:
         """Delete analysis profile by ID."""
         if profile_id in self._collection:
             del self._collection[profile_id]
-            self._storage.save("analysis/profiles")
+            self._storage.mark_dirty("analysis/profiles", profile_id)
             return True
         return False
 
     async def list_all(self, limit: int = 100, offset: int = 0) -> list[AnalysisProfile]:
         """List all profiles with pagination."""
-        all_profiles = list(self._collection.values())
-        return all_profiles[offset : offset + limit]
+        return list(islice(self._collection.values(), offset, offset + limit))
@@ -1,5 +1,7 @@
 """Equity instrument repository implementation."""
 
+from uuid import UUID
+
 from copinance_os.data.repositories.storage.factory import StorageType, create_storage
 from copinance_os.domain.models.entities.stock import Stock
 from copinance_os.domain.models.market import MarketDataPoint
@@ -27,33 +29,115 @@ class StockRepositoryImpl(StockRepository):
         self._storage = storage
         self._stocks = self._storage.get_collection("market/instruments/equities", Stock)
         self._market_data: dict[str, list[MarketDataPoint]] = {}
+        # Upper-cased symbol -> first stock (in collection order) with that symbol, the
+        # one a full scan would find. Stocks are keyed by UUID in storage, so without
+        # this every lookup would scan the collection.
+        self._symbol_index: dict[str, Stock] = {}
+        # Stock id -> upper-cased symbol it was last indexed under, to spot renames.
+        self._indexed_symbols: dict[UUID, str] = {}
+        # Built on first lookup rather than here: indexing reads every record, which
+        # would validate a lazily loaded collection just by constructing the repository.
+        self._indexed = False
+        # Stock id -> (stock, symbol, name, lower-cased symbol, lower-cased name) for
+        # search(); an entry is reused only while it matches the stored stock.
+        self._search_keys: dict[UUID, tuple[Stock, str, str, str, str]] = {}
 
-    async def get_by_symbol(self, symbol: str) -> Stock | None:
-        """Get stock by symbol."""
-        # Find stock by symbol (stocks are keyed by UUID, need to search)
+    def _rebuild_indexes(self) -> None:
+        self._symbol_index = {}
+        self._indexed_symbols = {}
+        for stock in self._stocks.values():
+            key = stock.symbol.upper()
+            self._symbol_index.setdefault(key, stock)
+            self._indexed_symbols[stock.id] = key
+        self._indexed = True
+
+    def _is_current(self, stock: Stock, key: str) -> bool:
+        """Whether an index entry still names a stored stock holding symbol ``key``."""
+        return self._stocks.get(stock.id) is stock and stock.symbol.upper() == key
+
+    def _reindex_symbol(self, key: str) -> Stock | None:
+        """Point ``key`` at the first stored stock with that symbol by scanning."""
+        stock: Stock
         for stock in self._stocks.values():
-            # Type narrowing: storage returns dict[UUID, Any], but we know it's Stock
-            if isinstance(stock, Stock) and stock.symbol.upper() == symbol.upper():
+            if stock.symbol.upper() == key:
+                self._symbol_index[key] = stock
                 return stock
+        self._symbol_index.pop(key, None)
         return None
 
+    def _index_saved(self, stock: Stock) -> None:
+        key = stock.symbol.upper()
+        previous_key = self._indexed_symbols.get(stock.id)
+        self._indexed_symbols[stock.id] = key
+        if previous_key is not None and previous_key != key:
+            # Renamed (possibly in place): the old symbol may belong to another stock
+            # now, and the new one to a stock that comes first in the collection
+            self._reindex_symbol(previous_key)
+            self._reindex_symbol(key)
+        else:
+            current = self._symbol_index.get(key)
+            if current is None or current.id == stock.id or not self._is_current(current, key):
+                self._symbol_index[key] = stock
+
+    def _lowered(self, stock: Stock) -> tuple[str, str]:
+        """Return the stock's lower-cased symbol and name, cached until either changes."""
+        entry = self._search_keys.get(stock.id)
+        if (
+            entry is None
+            or entry[0] is not stock
+            or (entry[1], entry[2]) != (stock.symbol, stock.name)
+        ):
+            entry = (stock, stock.symbol, stock.name, stock.symbol.lower(), stock.name.lower())
+            self._search_keys[stock.id] = entry
+        return entry[3], entry[4]
+
+    async def get_by_symbol(self, symbol: str) -> Stock | None:
+        """Get stock by symbol."""
+        if not self._indexed:
+            self._rebuild_indexes()
+        key = symbol.upper()
+        stock = self._symbol_index.get(key)
+        if stock is not None and self._is_current(stock, key):
+            return stock
+        # Index miss or stale entry (a stock renamed in place, or the shared collection
+        # changed outside this repository): fall back to a scan
+        return self._reindex_symbol(key)
+
     async def search(self, query: str, limit: int = 10) -> list[Stock]:
         """Search equity instruments by query."""
+        if limit <= 0:
+            return []
+        if len(self._search_keys) > len(self._stocks):
+            # Drop keys of stocks removed from the shared collection
+            self._search_keys = {
+                stock_id: entry
+                for stock_id, entry in self._search_keys.items()
+                if stock_id in self._stocks
+            }
         query_lower = query.lower()
-        results = [
-            stock
-            for stock in self._stocks.values()
-            if query_lower in stock.symbol.lower() or query_lower in stock.name.lower()
-        ]
-        return results[:limit]
+        results: list[Stock] = []
+        # Walk the collection itself so stocks added, replaced, or edited through
+        # another repository on the same storage are never served from stale keys
+        stock: Stock
+        for stock in self._stocks.values():
+            symbol_lower, name_lower = self._lowered(stock)
+            if query_lower in symbol_lower or query_lower in name_lower:
+                results.append(stock)
+                if len(results) >= limit:
+                    break
+        return results
 
     async def save(self, stock: Stock) -> Stock:
         """Save or update equity instrument."""
         self._stocks[stock.id] = stock
-        self._storage.save("market/instruments/equities")
+        if self._indexed:
+            self._index_saved(stock)
+        self._storage.mark_dirty("market/instruments/equities", stock.id)
         return stock
 
     async def get_market_data(self, symbol: str, limit: int = 100) -> list[MarketDataPoint]:
-        """Get historical market data."""
+        """Get the most recent ``limit`` historical data points, oldest first."""
+        if limit <= 0:
+            return []
         data = self._market_data.get(symbol.upper(), [])
-        return data[:limit]
+        return data[-limit:]
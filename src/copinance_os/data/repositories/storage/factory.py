@@ -5,23 +5,47 @@ implementation technology. The factory pattern ensures that storage
 details are hidden from the rest of the application.
 """
 
+from collections.abc import Callable
+from enum import StrEnum
 from pathlib import Path
 
 from copinance_os.data.repositories.storage.file import JsonFileStorage
 from copinance_os.data.repositories.storage.memory import InMemoryStorage
+from copinance_os.data.repositories.storage.msgpack import MsgPackFileStorage
 from copinance_os.domain.ports.storage import Storage
 
 
-class StorageType:
-    """Storage type constants."""
+class StorageType(StrEnum):
+    """Storage backend types."""
 
     FILE = "file"
     MEMORY = "memory"
+    MSGPACK = "msgpack"
+
+
+def _file_backed(
+    storage_class: Callable[..., Storage], storage_type: StorageType
+) -> Callable[[Path | str | None, bool], Storage]:
+    def build(base_path: Path | str | None, fsync: bool) -> Storage:
+        if base_path is None:
+            raise ValueError(f"base_path is required for {storage_type} storage")
+        return storage_class(base_path, fsync=fsync)
+
+    return build
+
+
+_STORAGE_BUILDERS: dict[StorageType, Callable[[Path | str | None, bool], Storage]] = {
+    StorageType.FILE: _file_backed(JsonFileStorage, StorageType.FILE),
+    StorageType.MSGPACK: _file_backed(MsgPackFileStorage, StorageType.MSGPACK),
+    StorageType.MEMORY: lambda _base_path, _fsync: InMemoryStorage(),
+}
 
 
 def create_storage(
     storage_type: str = StorageType.MEMORY,
     base_path: Path | str | None = None,
+    *,
+    fsync: bool = True,
 ) -> Storage:
     """Create a storage instance.
 
@@ -30,28 +54,29 @@ def create_storage(
     without affecting code that uses this factory.
 
     Args:
-        storage_type: Type of storage backend ("file" or "memory").
+        storage_type: Type of storage backend ("file", "msgpack", or "memory").
                      Defaults to side-effect-free process memory.
-        base_path: Explicit base path for file storage. Required for file storage;
-                  ignored for memory storage.
+        base_path: Explicit base path for file storage. Required for file and
+                  msgpack storage; ignored for memory storage.
+        fsync: Flush file-backed collection files to disk before each atomic replace.
+               Disable to trade durability on power loss for faster saves; ignored
+               for memory storage.
 
     Returns:
         Storage instance implementing the Storage interface.
 
     Raises:
         ValueError: If storage_type is not supported
+        ImportError: If storage_type is "msgpack" and msgpack is not installed
     """
-    if storage_type == StorageType.FILE:
-        if base_path is None:
-            raise ValueError("base_path is required for file storage")
-        return JsonFileStorage(base_path=base_path)
-    elif storage_type == StorageType.MEMORY:
-        return InMemoryStorage()
-    else:
+    try:
+        build = _STORAGE_BUILDERS[StorageType(storage_type)]
+    except ValueError:
         raise ValueError(
             f"Unsupported storage type: {storage_type}. "
-            f"Supported types: {StorageType.FILE}, {StorageType.MEMORY}"
-        )
+            f"Supported types: {', '.join(StorageType)}"
+        ) from None
+    return build(base_path, fsync)
 
 
 def get_default_storage() -> Storage:
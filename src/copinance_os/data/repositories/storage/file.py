@@ -1,34 +1,66 @@
 """JSON file-based storage backend for repositories."""
 
 import json
+import os
 import sys
+import tempfile
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
+from copinance_os.data.loaders.json_codec import dumps_json, load_json_file, loads_json
 from copinance_os.data.loaders.persistence import PERSISTENCE_SCHEMA_VERSION, get_data_dir
+from copinance_os.data.repositories.storage.lazy_collection import LazyCollection
 from copinance_os.domain.ports.storage import Storage
 
+# A delta log is compacted into the collection file once it has at least this many
+# lines and at least as many lines as the collection has entities.
+MIN_DELTA_LINES_BEFORE_COMPACT = 64
+
 
 class JsonFileStorage(Storage):
     """JSON file-based storage backend.
 
     This storage backend persists data to JSON files on disk.
     Data persists between process invocations. Suitable for CLI
-    applications and development.
+    applications and development. Files are replaced atomically on save.
+
+    Single-entity writes reported through :meth:`mark_dirty` are appended to a
+    ``<file>.delta.jsonl`` log next to the collection file (e.g.
+    ``items.json.delta.jsonl``) and folded into it
+    on :meth:`save` or once the log grows past the collection size.
     """
 
-    def __init__(self, base_path: Path | str) -> None:
+    FILE_SUFFIX = ".json"
+
+    def __init__(self, base_path: Path | str, *, pretty: bool = False, fsync: bool = True) -> None:
         """Initialize JSON file storage.
 
         Args:
             base_path: Explicit base directory for storing JSON files.
+            pretty: Write indented JSON instead of compact output.
+            fsync: Flush collection files to disk before replacing them. Disable to
+                trade durability on power loss for faster saves; the replace stays atomic.
         """
         self._root_path = Path(base_path)
-        self._base_path = self._root_path
+        self._pretty = pretty
+        self._fsync = fsync
         self._data_path = get_data_dir(self._root_path)
-        self._collections: dict[str, dict[UUID, Any]] = {}
+        self._collections: dict[str, LazyCollection] = {}
         self._file_paths: dict[str, Path] = {}
+        self._delta_paths: dict[str, Path] = {}
+        # Parent directories already created by this instance; saves skip the mkdir call.
+        self._created_dirs: set[Path] = set()
+        self._delta_lines: dict[str, int] = {}
+        # Collection name -> serialized entities keyed by ID string, as last written by
+        # this instance plus delta-logged changes; lets delta compaction skip
+        # re-serialization.
+        self._dumped: dict[str, dict[str, Any]] = {}
+
+    @property
+    def base_path(self) -> Path:
+        """Root directory this storage was created with."""
+        return self._root_path
 
     def _get_file_path(self, collection_name: str, *, create_parent: bool = False) -> Path:
         """Get file path for a collection.
@@ -37,7 +69,7 @@ class JsonFileStorage(Storage):
             collection_name: Name of the collection
 
         Returns:
-            Path to JSON file for this collection
+            Path to the file for this collection
         """
         if collection_name not in self._file_paths:
             normalized = collection_name.replace("\\", "/").strip("/")
@@ -45,51 +77,127 @@ class JsonFileStorage(Storage):
                 normalized = "default"
             parts = [part.replace("..", "_").replace("/", "_") for part in normalized.split("/")]
             directory = self._data_path.joinpath(*parts[:-1]) if len(parts) > 1 else self._data_path
-            self._file_paths[collection_name] = directory / f"{parts[-1]}.json"
+            self._file_paths[collection_name] = directory / f"{parts[-1]}{self.FILE_SUFFIX}"
         path = self._file_paths[collection_name]
-        if create_parent:
+        if create_parent and path.parent not in self._created_dirs:
             path.parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path.parent)
         return path
 
-    def get_collection(self, collection_name: str, entity_type: type[Any]) -> dict[UUID, Any]:
+    def _read_file(self, file_path: Path) -> Any:
+        """Read and decode a collection file."""
+        return load_json_file(file_path)
+
+    def _encode(self, data: dict[str, Any]) -> bytes:
+        """Encode collection file contents."""
+        return dumps_json(data, indent=self._pretty)
+
+    def _get_delta_path(self, collection_name: str) -> Path:
+        """Get the delta log path for a collection."""
+        if collection_name not in self._delta_paths:
+            file_path = self._get_file_path(collection_name)
+            # Keep the suffix so backends sharing a directory keep separate logs
+            self._delta_paths[collection_name] = file_path.with_name(
+                f"{file_path.name}.delta.jsonl"
+            )
+        return self._delta_paths[collection_name]
+
+    def get_collection(self, collection_name: str, entity_type: type[Any]) -> LazyCollection:
         """Get or create a collection by name.
 
+        Records are validated on first access rather than at load time; see
+        :class:`LazyCollection`.
+
         Args:
             collection_name: Name of the collection
             entity_type: Pydantic model type for deserialization
 
         Returns:
-            Dictionary mapping UUIDs to entities
+            Mapping of UUIDs to entities
         """
         if collection_name not in self._collections:
-            self._collections[collection_name] = {}
-            self._load_collection(collection_name, entity_type)
+            self._collections[collection_name] = self._load_collection(collection_name, entity_type)
         return self._collections[collection_name]
 
-    def _load_collection(self, collection_name: str, entity_type: type[Any]) -> None:
+    def _load_collection(self, collection_name: str, entity_type: type[Any]) -> LazyCollection:
         """Load collection from JSON file.
 
+        Only the JSON parse and entity IDs are checked here; entity data is
+        validated lazily by the returned collection.
+
         Args:
             collection_name: Name of the collection
             entity_type: Pydantic model type for deserialization
         """
+
+        def warn_invalid(entity_id: UUID, error: Exception) -> None:
+            print(
+                f"Warning: Dropping invalid {collection_name} entry {entity_id}: {error}",
+                file=sys.stderr,
+            )
+
+        entities: dict[str, Any] = {}
         file_path = self._get_file_path(collection_name)
         if file_path.exists():
             try:
-                with file_path.open() as f:
-                    data = json.load(f)
-                    entities = data.get("entities", {})
-                    for entity_id_str, entity_data in entities.items():
-                        entity_id = UUID(entity_id_str)
-                        entity = entity_type.model_validate(entity_data)
-                        self._collections[collection_name][entity_id] = entity
-            except (json.JSONDecodeError, ValueError, KeyError, TypeError) as e:
-                # If file is corrupted, start fresh
+                data = self._read_file(file_path)
+                entities = data.get("entities", {})
+                for entity_id_str in entities:
+                    UUID(entity_id_str)
+            except (json.JSONDecodeError, ValueError, KeyError, TypeError, AttributeError) as e:
+                # If file is corrupted, keep a copy for debugging and start fresh
+                backup_path = file_path.with_name(f"{file_path.name}.corrupt")
+                file_path.replace(backup_path)
                 print(
-                    f"Warning: Could not load {collection_name} data: {e}. Starting fresh.",
+                    f"Warning: Could not load {collection_name} data: {e}. "
+                    f"Moved unreadable file to {backup_path}. Starting fresh.",
                     file=sys.stderr,
                 )
-                self._collections[collection_name] = {}
+                entities = {}
+        lines, skipped = self._replay_delta(collection_name, entities)
+        self._delta_lines[collection_name] = lines
+        if skipped:
+            # Fold the readable records in now; appending after a torn tail would
+            # glue the next record onto it and lose that record on the next load
+            self._write_collection(collection_name, entities)
+        # Loaded records are unvalidated, so they are not reused for compaction; the
+        # first compaction re-serializes them through the collection instead
+        self._dumped[collection_name] = {}
+        raw = {UUID(entity_id_str): entity_data for entity_id_str, entity_data in entities.items()}
+        return LazyCollection(entity_type, raw, on_invalid=warn_invalid)
+
+    def _replay_delta(self, collection_name: str, entities: dict[str, Any]) -> tuple[int, int]:
+        """Apply the collection's delta log to ``entities``.
+
+        Lines that cannot be parsed (for example one torn by a crash while
+        appending) are skipped with a warning.
+
+        Returns:
+            Number of replayed lines and number of skipped lines
+        """
+        delta_path = self._get_delta_path(collection_name)
+        if not delta_path.exists():
+            return 0, 0
+        lines = 0
+        skipped = 0
+        with delta_path.open("rb") as f:
+            for line in f:
+                try:
+                    record = loads_json(line)
+                    entity_id = UUID(record["id"])
+                except (json.JSONDecodeError, ValueError, KeyError, TypeError) as e:
+                    print(
+                        f"Warning: Ignoring unreadable {collection_name} delta entry: {e}",
+                        file=sys.stderr,
+                    )
+                    skipped += 1
+                    continue
+                if record.get("deleted"):
+                    entities.pop(str(entity_id), None)
+                else:
+                    entities[str(entity_id)] = record["entity"]
+                lines += 1
+        return lines, skipped
 
     def _save_collection(self, collection_name: str) -> None:
         """Save collection to JSON file.
@@ -100,18 +208,42 @@ class JsonFileStorage(Storage):
         if collection_name not in self._collections:
             return
 
-        file_path = self._get_file_path(collection_name, create_parent=True)
         entities = {
-            str(entity_id): entity.model_dump(mode="json")
-            for entity_id, entity in self._collections[collection_name].items()
+            str(entity_id): entity_data
+            for entity_id, entity_data in self._collections[collection_name].serialized_items()
         }
+        self._write_collection(collection_name, entities)
+
+    def _write_collection(self, collection_name: str, entities: dict[str, Any]) -> None:
+        """Atomically write serialized entities and reset the delta log.
+
+        Args:
+            collection_name: Name of the collection
+            entities: Serialized entities keyed by ID string
+        """
+        file_path = self._get_file_path(collection_name, create_parent=True)
         data = {
             "schema_version": PERSISTENCE_SCHEMA_VERSION,
             "collection_name": collection_name,
             "entities": entities,
         }
-        with file_path.open("w") as f:
-            json.dump(data, f, indent=2)
+        fd, temp_name = tempfile.mkstemp(
+            prefix=f".{file_path.stem}.", suffix=".tmp", dir=file_path.parent
+        )
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._encode(data))
+                if self._fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            temp_path.replace(file_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        self._get_delta_path(collection_name).unlink(missing_ok=True)
+        self._delta_lines[collection_name] = 0
+        self._dumped[collection_name] = entities
 
     def save(self, collection_name: str) -> None:
         """Save collection to disk.
@@ -122,6 +254,46 @@ class JsonFileStorage(Storage):
         if collection_name in self._collections:
             self._save_collection(collection_name)
 
+    def mark_dirty(self, collection_name: str, entity_id: UUID) -> None:
+        """Persist a single changed or deleted entity.
+
+        Appends the entity (or a deletion marker when it is no longer in the
+        collection) to the delta log instead of rewriting the whole file, and
+        compacts the log into the collection file once it outgrows the collection.
+
+        Args:
+            collection_name: Name of the collection the entity belongs to
+            entity_id: ID of the saved or deleted entity
+        """
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            return
+        entity_id_str = str(entity_id)
+        dumped = self._dumped.setdefault(collection_name, {})
+        record: dict[str, Any]
+        try:
+            entity_data = collection.serialize(entity_id)
+        except KeyError:
+            # Deleted, or a stored record that failed validation and was dropped
+            dumped.pop(entity_id_str, None)
+            record = {"id": entity_id_str, "deleted": True}
+        else:
+            dumped[entity_id_str] = entity_data
+            record = {"id": entity_id_str, "entity": entity_data}
+
+        self._get_file_path(collection_name, create_parent=True)
+        with self._get_delta_path(collection_name).open("ab") as f:
+            f.write(dumps_json(record) + b"\n")
+        lines = self._delta_lines.get(collection_name, 0) + 1
+        self._delta_lines[collection_name] = lines
+        if lines >= max(MIN_DELTA_LINES_BEFORE_COMPACT, len(collection)):
+            # The shadow is only trusted while it covers exactly the collection's
+            # entities; changes made without mark_dirty fall back to a full save.
+            if dumped.keys() == {str(key) for key in collection}:
+                self._write_collection(collection_name, dumped)
+            else:
+                self._save_collection(collection_name)
+
     def clear(self, collection_name: str | None = None) -> None:
         """Clear storage.
 
@@ -135,8 +307,14 @@ class JsonFileStorage(Storage):
                 file_path = self._get_file_path(collection_name)
                 if file_path.exists():
                     file_path.unlink()
+                self._get_delta_path(collection_name).unlink(missing_ok=True)
+                self._delta_lines[collection_name] = 0
+                self._dumped[collection_name] = {}
         else:
             self._collections.clear()
-            for file_path in self._data_path.rglob("*.json"):
-                if file_path.exists():
-                    file_path.unlink()
+            self._delta_lines.clear()
+            self._dumped.clear()
+            for pattern in (f"*{self.FILE_SUFFIX}", f"*{self.FILE_SUFFIX}.delta.jsonl"):
+                for file_path in self._data_path.rglob(pattern):
+                    if file_path.exists():
+                        file_path.unlink()
@@ -0,0 +1,209 @@
+"""Entity mapping that defers Pydantic validation until a record is accessed."""
+
+from collections.abc import Callable, ItemsView, Iterator, KeysView, MutableMapping, ValuesView
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from pydantic import TypeAdapter, ValidationError
+
+_LIST_ADAPTERS: dict[type[Any], TypeAdapter[list[Any]]] = {}
+
+
+def _list_adapter(entity_type: type[Any]) -> TypeAdapter[list[Any]]:
+    """Return a cached ``TypeAdapter(list[entity_type])`` for batch validation."""
+    adapter = _LIST_ADAPTERS.get(entity_type)
+    if adapter is None:
+        adapter = _LIST_ADAPTERS[entity_type] = TypeAdapter(list[entity_type])  # type: ignore[valid-type]
+    return adapter
+
+
+# Field value types that cannot change in place, so equal snapshots imply equal dumps.
+_IMMUTABLE_FIELD_TYPES = frozenset(
+    {str, int, float, bool, Decimal, datetime, date, UUID, type(None)}
+)
+
+
+def _snapshot(entity: Any) -> tuple[Any, ...] | None:
+    """Return the entity's field values if all are immutable scalars, else None."""
+    values = tuple(entity.__dict__.values())
+    for value in values:
+        if type(value) not in _IMMUTABLE_FIELD_TYPES and not isinstance(value, Enum):
+            return None
+    return values
+
+
+# Pending records validated together while values or items are iterated, so a
+# consumer that stops early (e.g. a paginated listing) only pays for what it read.
+_MATERIALIZE_BATCH = 256
+
+
+class _LazyValuesView(ValuesView[Any]):
+    """Values view that validates pending records as iteration reaches them."""
+
+    def __init__(self, collection: "LazyCollection") -> None:
+        super().__init__(collection)
+        self._collection = collection
+
+    def __iter__(self) -> Iterator[Any]:
+        for _, value in self._collection._iter_items():
+            yield value
+
+
+class _LazyItemsView(ItemsView[UUID, Any]):
+    """Items view that validates pending records as iteration reaches them."""
+
+    def __init__(self, collection: "LazyCollection") -> None:
+        super().__init__(collection)
+        self._collection = collection
+
+    def __iter__(self) -> Iterator[tuple[UUID, Any]]:
+        return self._collection._iter_items()
+
+
+class LazyCollection(MutableMapping[UUID, Any]):
+    """Mapping of entity IDs to entities, validating stored records on first access.
+
+    Records loaded from disk are kept as raw JSON-compatible dicts and only passed
+    through ``entity_type.model_validate`` when read, so opening a large collection
+    costs a JSON parse rather than a full validation pass. Serializing validates
+    pending records first, so validator normalization and new default fields reach
+    disk; dumps of entities whose scalar fields are unchanged since the last
+    serialization are reused.
+
+    A record that fails validation is dropped from the collection and reported
+    through ``on_invalid``; reading it raises ``KeyError``. Until then it still counts
+    towards ``len()`` and ``in``, which never validate, so those can report records
+    that iterating :meth:`values` or :meth:`items` will skip.
+    """
+
+    def __init__(
+        self,
+        entity_type: type[Any],
+        raw: dict[UUID, Any] | None = None,
+        on_invalid: Callable[[UUID, Exception], None] | None = None,
+    ) -> None:
+        """Initialize the collection.
+
+        Args:
+            entity_type: Pydantic model type used to validate raw records
+            raw: Raw records keyed by entity ID, validated lazily
+            on_invalid: Called with the ID and error of a record that fails validation
+        """
+        self._entity_type = entity_type
+        self._entries: dict[UUID, Any] = dict(raw) if raw else {}
+        self._pending: set[UUID] = set(self._entries)
+        self._on_invalid = on_invalid
+        # id -> (entity, field snapshot, dumped data) from the last serialization
+        self._dumps: dict[UUID, tuple[Any, tuple[Any, ...], Any]] = {}
+
+    def _remember_dump(self, key: UUID, entity: Any, data: Any) -> None:
+        snapshot = _snapshot(entity)
+        if snapshot is not None:
+            self._dumps[key] = (entity, snapshot, data)
+
+    def _materialize(self, key: UUID) -> Any:
+        try:
+            entity = self._entity_type.model_validate(self._entries[key])
+        except ValueError as e:
+            del self._entries[key]
+            self._pending.discard(key)
+            if self._on_invalid is not None:
+                self._on_invalid(key, e)
+            raise KeyError(key) from e
+        self._entries[key] = entity
+        self._pending.discard(key)
+        return entity
+
+    def _materialize_batch(self, keys: list[UUID]) -> None:
+        try:
+            entities = _list_adapter(self._entity_type).validate_python(
+                [self._entries[key] for key in keys]
+            )
+        except ValidationError:
+            # Fall back to per-record validation so only invalid records are dropped
+            for key in keys:
+                try:
+                    self._materialize(key)
+                except KeyError:
+                    continue
+            return
+        for key, entity in zip(keys, entities, strict=True):
+            self._entries[key] = entity
+            self._pending.discard(key)
+
+    def _iter_items(self) -> Iterator[tuple[UUID, Any]]:
+        keys = list(self._entries)
+        for start in range(0, len(keys), _MATERIALIZE_BATCH):
+            batch = keys[start : start + _MATERIALIZE_BATCH]
+            pending = [key for key in batch if key in self._pending]
+            if pending:
+                self._materialize_batch(pending)
+            for key in batch:
+                # Skip records dropped as invalid or deleted while iterating
+                if key in self._entries:
+                    yield key, self._entries[key]
+
+    def __getitem__(self, key: UUID) -> Any:
+        """Return the entity for ``key``, validating it on first access."""
+        if key in self._pending:
+            return self._materialize(key)
+        return self._entries[key]
+
+    def __setitem__(self, key: UUID, value: Any) -> None:
+        """Store an already validated entity."""
+        self._entries[key] = value
+        self._pending.discard(key)
+
+    def __delitem__(self, key: UUID) -> None:
+        """Remove the entry for ``key``."""
+        del self._entries[key]
+        self._pending.discard(key)
+        self._dumps.pop(key, None)
+
+    def __iter__(self) -> Iterator[UUID]:
+        """Iterate over entity IDs without validating records."""
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        """Return the number of entries, including records not yet validated."""
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        """Check for ``key`` without validating its record."""
+        return key in self._entries
+
+    def keys(self) -> KeysView[UUID]:
+        return self._entries.keys()
+
+    def values(self) -> ValuesView[Any]:
+        return _LazyValuesView(self)
+
+    def items(self) -> ItemsView[UUID, Any]:
+        return _LazyItemsView(self)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pending.clear()
+        self._dumps.clear()
+
+    def serialize(self, key: UUID) -> Any:
+        """Return JSON-compatible data for one entry, reusing an unchanged dump.
+
+        Raises:
+            KeyError: If ``key`` is missing or its stored record fails validation
+        """
+        value = self[key]
+        cached = self._dumps.get(key)
+        if cached is not None and cached[0] is value and cached[1] == _snapshot(value):
+            return cached[2]
+        data = value.model_dump(mode="json")
+        self._remember_dump(key, value, data)
+        return data
+
+    def serialized_items(self) -> Iterator[tuple[UUID, Any]]:
+        """Yield ``(id, json_data)`` pairs, skipping records that fail validation."""
+        for key, _ in self._iter_items():
+            yield key, self.serialize(key)
@@ -0,0 +1,85 @@
+"""MessagePack file-based storage backend for repositories.
+
+Requires the optional ``msgpack`` package (``pip install copinance-os[msgpack]``).
+"""
+
+from pathlib import Path
+from typing import Any
+
+from copinance_os.data.repositories.storage.file import JsonFileStorage
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+
+class MsgPackFileStorage(JsonFileStorage):
+    """MessagePack file-based storage backend.
+
+    Same layout, delta log, and atomic saves as :class:`JsonFileStorage`, but
+    collection files are ``<name>.mpk`` MessagePack documents, which are smaller
+    and faster to decode than JSON. Entities are still dumped in JSON mode so
+    UUIDs, datetimes, and decimals round-trip without custom extension types.
+    """
+
+    FILE_SUFFIX = ".mpk"
+
+    def __init__(self, base_path: Path | str, *, fsync: bool = True) -> None:
+        """Initialize MessagePack file storage.
+
+        Args:
+            base_path: Explicit base directory for storing collection files.
+            fsync: Flush collection files to disk before replacing them.
+
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        if not MSGPACK_AVAILABLE:
+            raise ImportError(
+                "msgpack is required for MessagePack storage. "
+                "Install it with: pip install copinance-os[msgpack]"
+            )
+        super().__init__(base_path, fsync=fsync)
+
+    def _read_file(self, file_path: Path) -> Any:
+        """Read and decode a MessagePack collection file."""
+        try:
+            return msgpack.unpackb(file_path.read_bytes(), raw=False)
+        except msgpack.UnpackException as e:
+            raise ValueError(f"Invalid MessagePack data: {e}") from e
+
+    def _encode(self, data: dict[str, Any]) -> bytes:
+        """Encode collection file contents as MessagePack."""
+        packed: bytes = msgpack.packb(data, use_bin_type=True)
+        return packed
+
+    def migrate_from_json(self, collection_name: str, entity_type: type[Any]) -> bool:
+        """Copy a collection from its legacy JSON file into MessagePack.
+
+        Reads ``<name>.json`` (and any pending delta log) with
+        :class:`JsonFileStorage` and writes ``<name>.mpk``. The JSON file is left
+        in place. Does nothing if the MessagePack file already exists.
+
+        Args:
+            collection_name: Name of the collection to migrate
+            entity_type: Pydantic model type for deserialization
+
+        Returns:
+            True if a JSON collection was migrated, False otherwise
+        """
+        file_path = self._get_file_path(collection_name)
+        legacy_storage = JsonFileStorage(self._root_path)
+        if file_path.exists() or not legacy_storage._get_file_path(collection_name).exists():
+            return False
+
+        legacy = legacy_storage.get_collection(collection_name, entity_type)
+        # Fold the JSON delta log into its file so the legacy copy stays complete
+        legacy_storage.save(collection_name)
+        collection = self.get_collection(collection_name, entity_type)
+        collection.update(legacy.items())
+        self.save(collection_name)
+        return True
@@ -18,12 +18,18 @@ def relative_strength_index(prices: list[float], period: int = 14) -> float | No
     if len(prices) < period + 1:
         return None
 
-    changes = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
-    window = changes[-period:]
-    gains = [c if c > 0 else 0.0 for c in window]
-    losses = [-c if c < 0 else 0.0 for c in window]
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
+    # Only the last ``period`` changes contribute, so never touch older prices.
+    tail = prices[-(period + 1) :]
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for prev, curr in zip(tail, tail[1:], strict=False):
+        change = curr - prev
+        if change > 0:
+            gain_sum += change
+        elif change < 0:
+            loss_sum -= change
+    avg_gain = gain_sum / period
+    avg_loss = loss_sum / period
 
     if avg_loss == 0:
         return 100.0
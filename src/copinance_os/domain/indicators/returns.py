@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from math import log
+
+import numpy as np
 
 
 def log_returns_from_prices(prices: Sequence[float]) -> list[float]:
@@ -18,11 +19,8 @@ def log_returns_from_prices(prices: Sequence[float]) -> list[float]:
     if len(prices) < 2:
         return []
 
-    out: list[float] = []
-    for i in range(1, len(prices)):
-        p0 = prices[i - 1]
-        p1 = prices[i]
-        lp0 = log(p0) if p0 > 0 else 0.0
-        lp1 = log(p1) if p1 > 0 else 0.0
-        out.append(lp1 - lp0)
-    return out
+    arr = np.asarray(prices, dtype=np.float64)
+    logs = np.zeros_like(arr)
+    np.log(arr, out=logs, where=arr > 0)
+    diffs: list[float] = np.diff(logs).tolist()
+    return diffs
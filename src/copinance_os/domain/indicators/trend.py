@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
 
 def simple_moving_average(prices: list[float], window: int) -> list[float | None]:
     """Simple moving average aligned to input length (oldest first).
@@ -21,12 +24,8 @@ def simple_moving_average(prices: list[float], window: int) -> list[float | None
     if len(prices) < window:
         return [None] * len(prices)
 
-    n = len(prices)
-    out: list[float | None] = []
-    for i in range(n):
-        if i < window - 1:
-            out.append(None)
-        else:
-            s = sum(prices[i - window + 1 : i + 1])
-            out.append(s / window)
+    arr = np.asarray(prices, dtype=np.float64)
+    means: list[float] = (sliding_window_view(arr, window).sum(axis=1) / window).tolist()
+    out: list[float | None] = [None] * (window - 1)
+    out.extend(means)
     return out
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from typing import cast
-
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from copinance_os.domain.indicators.returns import log_returns_from_prices
 
@@ -22,32 +21,14 @@ def rolling_volatility_annualized_from_prices(
     if len(prices) < window + 1:
         return [None] * len(prices)
 
-    log_returns_list = log_returns_from_prices(prices)
-    if len(log_returns_list) < window:
-        return [None] * len(prices)
-
-    arr = cast(np.ndarray, np.asarray(log_returns_list, dtype=float))
-    n = len(arr)
-    ann = float(trading_days_per_year) ** 0.5
-    rolling_std: list[float | None] = []
-    for i in range(n):
-        if i < window - 1:
-            rolling_std.append(None)
-        else:
-            chunk = arr[i - window + 1 : i + 1]
-            std = float(np.std(chunk, ddof=1))
-            rolling_std.append(std * ann)
-
-    valid_vols = rolling_std[window:]
-    result = cast(
-        list[float | None],
-        [None] + [None] * window + list(valid_vols),
-    )
-    if len(result) > len(prices):
-        result = result[: len(prices)]
-    elif len(result) < len(prices):
-        result.extend([None] * (len(prices) - len(result)))
-    return result
+    log_returns = np.asarray(log_returns_from_prices(prices), dtype=np.float64)
+    # stds[j] is the sample std of log_returns[j : j + window]. The first full window
+    # (ending at return index window - 1) is skipped to keep the legacy alignment.
+    stds = sliding_window_view(log_returns, window).std(axis=1, ddof=1)
+    vols: list[float] = (stds[1:] * float(trading_days_per_year) ** 0.5).tolist()
+    out: list[float | None] = [None] * (window + 1)
+    out.extend(vols)
+    return out
 
 
 def ewma_volatility_annualized_from_prices(
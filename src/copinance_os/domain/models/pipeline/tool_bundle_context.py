@@ -10,7 +10,7 @@ from copinance_os.domain.ports.data_providers import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolBundleContext:
     """Dependencies passed to each tool bundle factory.
 
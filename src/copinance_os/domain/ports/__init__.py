@@ -11,6 +11,7 @@ from copinance_os.domain.ports.analytics import OptionsChainGreeksEstimator
 from copinance_os.domain.ports.analyzers import LLMAnalyzer
 from copinance_os.domain.ports.data_providers import (
     AlternativeDataProvider,
+    BatchHistoricalDataProvider,
     DataProvider,
     FundamentalDataProvider,
     MacroeconomicDataProvider,
@@ -51,6 +52,7 @@ __all__ = [
     # Data Providers
     "DataProvider",
     "MarketDataProvider",
+    "BatchHistoricalDataProvider",
     "OptionsChainGreeksEstimator",
     "AlternativeDataProvider",
     "FundamentalDataProvider",
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
 from datetime import datetime
-from typing import Any
+from typing import Any, Protocol, runtime_checkable
 
 from copinance_os.domain.models.market import MarketDataPoint, OptionsChain
 from copinance_os.domain.models.market.fundamentals import StockFundamentals
@@ -82,6 +82,29 @@ class MarketDataProvider(DataProvider):
         pass
 
 
+@runtime_checkable
+class BatchHistoricalDataProvider(Protocol):
+    """Optional market data capability: historical data for several symbols in one request.
+
+    Callers check for it with ``isinstance`` and fall back to per-symbol
+    :meth:`MarketDataProvider.get_historical_data` calls when it is absent.
+    """
+
+    async def get_historical_data_batch(
+        self,
+        symbols: Sequence[str],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> dict[str, list[MarketDataPoint]]:
+        """Get historical market data for several symbols.
+
+        Returns:
+            Data points keyed by upper-cased symbol. Symbols without data are omitted.
+        """
+        ...
+
+
 class AlternativeDataProvider(DataProvider):
     """Interface for alternative data sources."""
 
@@ -197,6 +220,8 @@ class FundamentalDataProvider(DataProvider):
         symbol: str,
         periods: int = 5,
         period_type: str = "annual",
+        *,
+        as_of: datetime | None = None,
     ) -> StockFundamentals:
         """
         Get comprehensive detailed fundamentals for a stock.
@@ -209,6 +234,9 @@ class FundamentalDataProvider(DataProvider):
             symbol: Stock ticker symbol
             periods: Number of periods to retrieve (e.g., 5 years of annual data)
             period_type: "annual" or "quarterly"
+            as_of: Timestamp to stamp as ``data_as_of``. Callers fetching many symbols
+                can read the clock once and pass it to every call so the batch shares
+                one timestamp. Defaults to the current UTC time.
 
         Returns:
             StockFundamentals entity with comprehensive fundamental data
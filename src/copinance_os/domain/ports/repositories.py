@@ -52,5 +52,5 @@ class StockRepository(ABC):
 
     @abstractmethod
     async def get_market_data(self, symbol: str, limit: int = 100) -> list[MarketDataPoint]:
-        """Get historical market data."""
+        """Get the most recent ``limit`` historical data points, oldest first."""
         pass
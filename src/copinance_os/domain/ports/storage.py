@@ -1,6 +1,7 @@
 """Storage and caching interfaces."""
 
 from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -99,7 +100,9 @@ class Storage(ABC):
     """
 
     @abstractmethod
-    def get_collection(self, collection_name: str, entity_type: type[Any]) -> dict[UUID, Any]:
+    def get_collection(
+        self, collection_name: str, entity_type: type[Any]
+    ) -> MutableMapping[UUID, Any]:
         """Get or create a collection by name.
 
         Args:
@@ -107,7 +110,7 @@ class Storage(ABC):
             entity_type: Pydantic model type for deserialization
 
         Returns:
-            Dictionary mapping UUIDs to entities
+            Mutable mapping of UUIDs to entities (backends may validate lazily)
         """
         pass
 
@@ -120,6 +123,19 @@ class Storage(ABC):
         """
         pass
 
+    def mark_dirty(self, collection_name: str, entity_id: UUID) -> None:
+        """Persist a change to a single entity in a collection.
+
+        Repositories call this after adding, updating, or deleting one entity.
+        Backends that can persist incrementally override it; the default saves
+        the whole collection.
+
+        Args:
+            collection_name: Name of the collection the entity belongs to
+            entity_id: ID of the saved or deleted entity
+        """
+        self.save(collection_name)
+
     @abstractmethod
     def clear(self, collection_name: str | None = None) -> None:
         """Clear storage.
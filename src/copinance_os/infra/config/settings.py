@@ -48,7 +48,7 @@ class Settings(BaseSettings):
     # Storage configuration
     storage_type: str = Field(
         default="file",
-        description="Storage backend type (file, memory). File storage persists data, memory storage is ephemeral.",
+        description="Storage backend type (file, msgpack, memory). File and msgpack storage persist data, memory storage is ephemeral.",
     )
     storage_path: str = Field(
         default=".copinance",
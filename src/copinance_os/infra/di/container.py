@@ -299,6 +299,7 @@ def create_container(
     cache_manager: CacheManager | None = None,
     storage_type: str = "memory",
     storage_path: str | None = None,
+    storage_fsync: bool = True,
     storage_backend: Any | None = None,
     current_profile_path: str | None = None,
     market_data_provider: Any | None = None,
@@ -328,8 +329,10 @@ def create_container(
             ``prompt_templates`` is provided, the default PromptManager (package prompts)
             is used.
         cache_manager: Explicit cache manager. Omit for a no-op cache.
-        storage_type: ``"memory"`` (default) or ``"file"``.
-        storage_path: Required when ``storage_type="file"``.
+        storage_type: ``"memory"`` (default), ``"file"``, or ``"msgpack"``.
+        storage_path: Required when ``storage_type`` is ``"file"`` or ``"msgpack"``.
+        storage_fsync: Flush file-backed collections to disk on every save (default).
+            Pass False to skip the fsync and keep only the atomic replace.
         storage_backend: Optional pre-built ``Storage`` instance. When provided,
             takes precedence over ``storage_type`` and ``storage_path``. Use this
             when you have a custom ``Storage`` implementation (e.g. SQLite, S3) and
@@ -372,9 +375,11 @@ def create_container(
     else:
         from copinance_os.data.repositories.storage import create_storage  # noqa: PLC0415
 
-        if storage_type == "file" and storage_path is None:
-            raise ValueError("storage_path is required when storage_type='file'")
-        storage = create_storage(storage_type=storage_type, base_path=storage_path)
+        if storage_type in ("file", "msgpack") and storage_path is None:
+            raise ValueError(f"storage_path is required when storage_type='{storage_type}'")
+        storage = create_storage(
+            storage_type=storage_type, base_path=storage_path, fsync=storage_fsync
+        )
         container_instance.storage_backend.override(providers.Object(storage))
 
     if current_profile_path is not None:
@@ -158,14 +158,11 @@ def configure_use_cases(
         if llm_config is None:
             return None
         try:
-            from copinance_os.ai.llm.providers.factory import LLMProviderFactory  # noqa: PLC0415
+            from copinance_os.ai.llm.analyzer_factory import LLMAnalyzerFactory  # noqa: PLC0415
 
-            provider_name = LLMProviderFactory.get_provider_for_execution_type(
+            analyzer = LLMAnalyzerFactory.create_for_execution_type(
                 "question_driven_analysis", llm_config=llm_config
             )
-            from copinance_os.ai.llm.analyzer_factory import LLMAnalyzerFactory  # noqa: PLC0415
-
-            analyzer = LLMAnalyzerFactory.create(provider_name, llm_config=llm_config)
             return getattr(analyzer, "_llm_provider", None)
         except Exception:
             return None
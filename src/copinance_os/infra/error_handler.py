@@ -5,6 +5,7 @@ following the error handling strategy where infrastructure errors are converted
 domain exceptions before being propagated to the application layer.
 """
 
+import socket
 from typing import Any
 
 import structlog
@@ -17,6 +18,17 @@ from copinance_os.domain.exceptions import (
 
 logger = structlog.get_logger(__name__)
 
+# Exception types whose class alone identifies a connectivity failure.
+# ``asyncio.TimeoutError`` and ``socket.timeout`` are aliases of ``TimeoutError``.
+_UNAVAILABLE_ERROR_TYPES: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    TimeoutError,
+    socket.gaierror,
+)
+
+# Message keywords used as a fallback for exception types not listed above.
+_UNAVAILABLE_KEYWORDS: tuple[str, ...] = ("connection", "timeout", "network", "unreachable")
+
 
 def flatten_exception_message(exc: BaseException) -> str:
     """Return one user-facing message, unwrapping nested exception groups.
@@ -40,6 +52,7 @@ def convert_to_domain_exception(
     component: str,
     operation: str,
     context: dict[str, Any] | None = None,
+    log: bool = True,
 ) -> DomainError:
     """Convert an infrastructure error to a domain exception.
 
@@ -51,6 +64,8 @@ def convert_to_domain_exception(
         component: Name of the infrastructure component (e.g., "YFinanceProvider", "Cache")
         operation: Operation that failed (e.g., "get_quote", "get_fundamentals")
         context: Optional context information for logging
+        log: Whether to log the error with its traceback. Callers that already
+            log (or classify errors in a hot path) can pass ``False``.
 
     Returns:
         Domain exception representing the error
@@ -64,33 +79,32 @@ def convert_to_domain_exception(
     error_message = str(error)
     error_type = type(error).__name__
 
-    # Log the infrastructure error for debugging
-    log_context = {
-        "component": component,
-        "operation": operation,
-        "error_type": error_type,
-        "error_message": error_message,
-    }
-    if context:
-        log_context.update(context)
-
-    logger.warning(
-        "Infrastructure error converted to domain exception",
-        **log_context,
-        exc_info=True,
-    )
+    if log:
+        # Log the infrastructure error for debugging
+        log_context = {
+            "component": component,
+            "operation": operation,
+            "error_type": error_type,
+            "error_message": error_message,
+        }
+        if context:
+            log_context.update(context)
+
+        logger.warning(
+            "Infrastructure error converted to domain exception",
+            **log_context,
+            exc_info=True,
+        )
 
     # Convert specific error types to appropriate domain exceptions
     if isinstance(error, DomainError):
         # Already a domain exception, return as-is
         return error
 
-    # Check for common infrastructure error patterns
-    error_lower = error_message.lower()
-
-    # Network/connectivity errors
-    if any(
-        keyword in error_lower for keyword in ["connection", "timeout", "network", "unreachable"]
+    # Network/connectivity errors: dispatch on type first, then fall back to
+    # message keywords for exception types that do not encode the category.
+    if isinstance(error, _UNAVAILABLE_ERROR_TYPES) or any(
+        keyword in error_message.lower() for keyword in _UNAVAILABLE_KEYWORDS
     ):
         return DataProviderUnavailableError(
             provider_name=component,
@@ -47,6 +47,9 @@ def get_container() -> Container:
         cache_manager=cache_manager,
         storage_type=settings.storage_type,
         storage_path=storage_path if settings.storage_type == "file" else None,
+        # CLI state is cheap to rebuild; the atomic replace already rules out torn
+        # files on a crash, so skip the per-save fsync
+        storage_fsync=False,
         current_profile_path=profile_path,
     )
 
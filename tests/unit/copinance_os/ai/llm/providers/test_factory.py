@@ -211,3 +211,23 @@ class TestLLMProviderFactory:
         )
 
         assert result == "ollama"
+
+    def test_is_configured_requires_api_key_for_cloud_providers(self) -> None:
+        """Test that cloud providers need an API key while local providers do not."""
+        assert LLMProviderFactory.is_configured("gemini", LLMConfig(provider="gemini")) is False
+        assert LLMProviderFactory.is_configured("OpenAI", None) is False
+        assert LLMProviderFactory.is_configured(
+            "openai", LLMConfig(provider="openai", api_key="sk-test")
+        )
+        assert LLMProviderFactory.is_configured("ollama", None)
+
+    def test_provider_is_configured_matches_factory_check(self) -> None:
+        """Test that provider instances report configuration consistently."""
+        configured = LLMProviderFactory.create_provider(
+            "gemini", llm_config=LLMConfig(provider="gemini", api_key="test-key")
+        )
+        unconfigured = LLMProviderFactory.create_provider("gemini", llm_config=None)
+
+        assert configured.is_configured()
+        assert not unconfigured.is_configured()
+        assert LLMProviderFactory.create_provider("ollama", llm_config=None).is_configured()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from decimal import Decimal
 from typing import Any
@@ -11,7 +12,8 @@ import pytest
 from copinance_os.core.pipeline.tools.analysis.market_regime.macro_indicators import (
     MacroRegimeIndicatorsTool,
 )
-from copinance_os.domain.models.market import MarketDataPoint, OptionsChain
+from copinance_os.data.cache import CacheManager, InMemoryCacheBackend
+from copinance_os.domain.models.market import MacroDataPoint, MarketDataPoint, OptionsChain
 
 
 class _FailingMacroProvider:
@@ -25,6 +27,45 @@ class _FailingMacroProvider:
         raise RuntimeError("FRED down")
 
 
+class _RecordingMacroProvider:
+    """FRED stub that records requested series and how many requests overlap."""
+
+    def __init__(self, failing: frozenset[str] = frozenset()) -> None:
+        self.failing = failing
+        self.availability_checks = 0
+        self.requested: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get_provider_name(self) -> str:
+        return "fred"
+
+    async def is_available(self) -> bool:
+        self.availability_checks += 1
+        return True
+
+    async def get_time_series(
+        self, series_id: str, start_date: datetime, end_date: datetime
+    ) -> list[MacroDataPoint]:
+        self.requested.append(series_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight -= 1
+        if series_id in self.failing:
+            raise RuntimeError(f"{series_id} down")
+        return [
+            MacroDataPoint(
+                series_id=series_id,
+                timestamp=datetime(2025, 1, day, tzinfo=UTC),
+                value=Decimal(day),
+            )
+            for day in range(1, 26)
+        ]
+
+
 class _StubMarketProvider:
     def get_provider_name(self) -> str:
         return "yfinance"
@@ -77,6 +118,29 @@ class _StubMarketProvider:
         return []
 
 
+class _SlowMarketProvider(_StubMarketProvider):
+    """Stub that records how many historical-data requests overlap."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_historical_data(
+        self,
+        symbol: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> list[MarketDataPoint]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return await super().get_historical_data(symbol, start_date, end_date, interval)
+        finally:
+            self.in_flight -= 1
+
+
 @pytest.mark.unit
 class TestMacroRegimeIndicatorsTool:
     @pytest.mark.asyncio
@@ -89,3 +153,156 @@ class TestMacroRegimeIndicatorsTool:
         assert result.data["rates"]["source"] == "yfinance"
         assert result.data["credit"]["source"] == "yfinance"
         assert result.data["commodities"]["source"] == "yfinance"
+
+    @pytest.mark.asyncio
+    async def test_blocks_are_fetched_concurrently(self) -> None:
+        market = _SlowMarketProvider()
+        tool = MacroRegimeIndicatorsTool(_FailingMacroProvider(), market)  # type: ignore[arg-type]
+        result = await tool.execute(lookback_days=30)
+
+        assert result.success is True
+        assert result.data is not None
+        assert market.max_in_flight > 1
+        assert list(result.data)[2:] == [
+            "rates",
+            "credit",
+            "commodities",
+            "labor",
+            "housing",
+            "manufacturing",
+            "consumer",
+            "global",
+            "advanced",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failing_block_does_not_sink_the_others(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        tool = MacroRegimeIndicatorsTool(_FailingMacroProvider(), _StubMarketProvider())  # type: ignore[arg-type]
+
+        async def broken_block(
+            start_date: datetime, end_date: datetime, fred_available: bool
+        ) -> dict[str, Any]:
+            raise RuntimeError("credit down")
+
+        monkeypatch.setattr(tool, "_get_credit_block", broken_block)
+        result = await tool.execute(lookback_days=30)
+
+        assert result.success is True
+        assert result.data is not None
+        assert result.data["credit"] == {"available": False, "error": "credit down"}
+        assert result.data["rates"]["source"] == "yfinance"
+        assert result.data["commodities"]["source"] == "yfinance"
+
+    @pytest.mark.asyncio
+    async def test_block_series_are_fetched_concurrently_once_each(self) -> None:
+        macro = _RecordingMacroProvider()
+        tool = MacroRegimeIndicatorsTool(macro, _StubMarketProvider())  # type: ignore[arg-type]
+        block = await tool._get_consumer_block(
+            datetime(2025, 1, 1, tzinfo=UTC), datetime.now(UTC), fred_available=True
+        )
+
+        assert block["source"] == "fred"
+        assert macro.max_in_flight > 1
+        # retail_sales and retail_sales_mom share RRSFS; it is requested once
+        assert macro.requested.count("RRSFS") == 1
+        assert block["series"]["retail_sales"]["unit"] == "millions_dollars"
+        assert list(block["series"])[:2] == ["retail_sales", "retail_sales_mom"]
+
+    @pytest.mark.asyncio
+    async def test_retail_sales_change_is_requested_with_the_other_series(self) -> None:
+        macro = _RecordingMacroProvider()
+        tool = MacroRegimeIndicatorsTool(macro, _StubMarketProvider())  # type: ignore[arg-type]
+        block = await tool._get_consumer_block(
+            datetime(2025, 1, 1, tzinfo=UTC), datetime.now(UTC), fred_available=True
+        )
+
+        # Six distinct consumer series plus RSXFS, all in flight together
+        assert macro.max_in_flight == 7
+        assert block["series"]["retail_sales_mom"]["latest"]["value"] == Decimal("4.17")
+
+    @pytest.mark.asyncio
+    async def test_retail_sales_change_failure_still_fails_the_block(self) -> None:
+        macro = _RecordingMacroProvider(failing=frozenset({"RSXFS"}))
+        tool = MacroRegimeIndicatorsTool(macro, _StubMarketProvider())  # type: ignore[arg-type]
+        block = await tool._get_consumer_block(
+            datetime(2025, 1, 1, tzinfo=UTC), datetime.now(UTC), fred_available=True
+        )
+
+        assert block == {"available": False, "source": "fred", "error": "RSXFS down"}
+
+    @pytest.mark.asyncio
+    async def test_failed_series_falls_back_for_the_whole_block(self) -> None:
+        macro = _RecordingMacroProvider(failing=frozenset({"DGS2"}))
+        tool = MacroRegimeIndicatorsTool(macro, _StubMarketProvider())  # type: ignore[arg-type]
+        block = await tool._get_rates_block(
+            datetime(2025, 1, 1, tzinfo=UTC), datetime.now(UTC), fred_available=True
+        )
+
+        assert block["source"] == "yfinance"
+        assert "DGS10" in macro.requested and "T10Y3M" in macro.requested
+
+    @pytest.mark.asyncio
+    async def test_fred_availability_is_checked_once_per_call(self) -> None:
+        macro = _RecordingMacroProvider()
+        tool = MacroRegimeIndicatorsTool(
+            macro,  # type: ignore[arg-type]
+            _StubMarketProvider(),  # type: ignore[arg-type]
+            cache_manager=CacheManager(InMemoryCacheBackend()),
+        )
+
+        first = await tool.execute(lookback_days=30)
+        assert first.success is True
+        assert first.data is not None
+        assert first.data["labor"]["source"] == "fred"
+        assert macro.availability_checks == 1
+
+        # Every block is cached now, so the second call does not probe at all
+        requests = len(macro.requested)
+        second = await tool.execute(lookback_days=30)
+        assert second.data is not None
+        assert second.data == first.data | {"analysis_date": second.data["analysis_date"]}
+        assert macro.availability_checks == 1
+        assert len(macro.requested) == requests
+
+    @pytest.mark.asyncio
+    async def test_series_are_reused_across_calls_within_ttl(self) -> None:
+        macro = _RecordingMacroProvider()
+        tool = MacroRegimeIndicatorsTool(macro, _StubMarketProvider())  # type: ignore[arg-type]
+
+        first = await tool.execute(lookback_days=30)
+        requests = len(macro.requested)
+        second = await tool.execute(lookback_days=30)
+
+        assert first.data is not None and second.data is not None
+        assert second.data["labor"] == first.data["labor"]
+        assert len(macro.requested) == requests
+
+    @pytest.mark.asyncio
+    async def test_series_cache_can_be_disabled(self) -> None:
+        macro = _RecordingMacroProvider()
+        tool = MacroRegimeIndicatorsTool(
+            macro, _StubMarketProvider(), series_cache_ttl_seconds=None  # type: ignore[arg-type]
+        )
+        start, end = datetime(2025, 1, 1, tzinfo=UTC), datetime(2025, 2, 1, tzinfo=UTC)
+
+        await tool._get_time_series_cached("DGS10", start, end)
+        await tool._get_time_series_cached("DGS10", start, end)
+
+        assert macro.requested == ["DGS10", "DGS10"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_for_a_series_share_one_fetch(self) -> None:
+        macro = _RecordingMacroProvider()
+        tool = MacroRegimeIndicatorsTool(macro, _StubMarketProvider())  # type: ignore[arg-type]
+        start, end = datetime(2025, 1, 1, tzinfo=UTC), datetime(2025, 2, 1, 12, tzinfo=UTC)
+
+        first, second = await asyncio.gather(
+            tool._get_time_series_cached("UNRATE", start, end),
+            # Same calendar days, different times of day
+            tool._get_time_series_cached("UNRATE", start, end.replace(hour=18)),
+        )
+
+        assert first is second
+        assert macro.requested == ["UNRATE"]
@@ -1,5 +1,8 @@
 """Unit tests for domain indicator helpers used by market regime tools."""
 
+import subprocess
+import sys
+
 import pytest
 
 from copinance_os.domain.indicators import log_returns_from_prices, simple_moving_average
@@ -58,3 +61,16 @@ class TestDomainIndicatorHelpersForRegime:
         log_returns = log_returns_from_prices(prices)
 
         assert len(log_returns) == 0
+
+
+@pytest.mark.unit
+def test_market_regime_tools_import_without_pandas() -> None:
+    """Regime tools and their indicators must not pull pandas in at import time."""
+    code = (
+        "import sys\n"
+        "import copinance_os.core.pipeline.tools.analysis.market_regime.base\n"
+        "import copinance_os.domain.indicators\n"
+        "sys.exit('pandas' in sys.modules)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=False)
+    assert result.returncode == 0
@@ -1,16 +1,24 @@
 """Unit tests for market regime indicators tool."""
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from copinance_os.core.pipeline.tools.analysis.market_regime import indicators
 from copinance_os.core.pipeline.tools.analysis.market_regime.indicators import (
+    MAX_CONCURRENT_FETCHES,
     SECTOR_ETFS,
     MarketRegimeIndicatorsTool,
     create_market_regime_indicators_tool,
 )
+from copinance_os.data.cache import CacheManager, InMemoryCacheBackend
+from copinance_os.domain.indicators import (
+    relative_strength_index,
+    rolling_volatility_annualized_from_prices,
+)
 from copinance_os.domain.models.market import MarketDataPoint
 from copinance_os.domain.ports.data_providers import MarketDataProvider
 
@@ -129,6 +137,7 @@ class TestMarketRegimeIndicatorsTool:
         assert "include_sector_rotation" in schema.parameters["properties"]
         assert schema.parameters["properties"]["market_index"]["default"] == "SPY"
         assert schema.parameters["properties"]["lookback_days"]["default"] == 252
+        assert tool.get_schema() is schema
 
     @pytest.mark.asyncio
     async def test_execute_all_indicators(
@@ -320,6 +329,40 @@ class TestMarketRegimeIndicatorsTool:
         assert vix_data["regime"] in ["high", "very_high"]
         assert vix_data["sentiment"] in ["fearful", "panic"]
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("level", "regime"),
+        [
+            ("14.99", "low"),
+            ("15", "normal"),
+            ("24.99", "normal"),
+            ("25", "high"),
+            ("30", "very_high"),
+            ("80", "very_high"),
+        ],
+    )
+    async def test_fetch_vix_data_regime_boundaries(
+        self, mock_market_data_provider: MarketDataProvider, level: str, regime: str
+    ) -> None:
+        """Each threshold is the first value of the next VIX regime."""
+        point = MarketDataPoint(
+            symbol="^VIX",
+            timestamp=datetime(2024, 1, 1),
+            open_price=Decimal(level),
+            close_price=Decimal(level),
+            high_price=Decimal(level),
+            low_price=Decimal(level),
+            volume=0,
+        )
+        mock_market_data_provider.get_historical_data = AsyncMock(return_value=[point])
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        vix_data = await tool._fetch_vix_data(
+            datetime(2024, 1, 1), datetime(2024, 1, 2), "intermediate"
+        )
+
+        assert vix_data["regime"] == regime
+
     @pytest.mark.asyncio
     async def test_calculate_market_breadth_success(
         self,
@@ -329,21 +372,11 @@ class TestMarketRegimeIndicatorsTool:
     ) -> None:
         """Test successful market breadth calculation."""
 
-        async def mock_get_historical_data(symbol, start_date, end_date, interval="1d"):
-            if symbol == "SPY":
-                return sample_market_data
-            elif symbol in SECTOR_ETFS:
-                return sample_sector_data
-            return []
-
-        mock_market_data_provider.get_historical_data = AsyncMock(
-            side_effect=mock_get_historical_data
-        )
+        history = {"SPY": sample_market_data}
+        history.update(dict.fromkeys(SECTOR_ETFS, sample_sector_data))
 
         tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
-        breadth_data = await tool._calculate_market_breadth(
-            "SPY", datetime(2023, 1, 1), datetime(2023, 12, 31)
-        )
+        breadth_data = await tool._calculate_market_breadth("SPY", history)
 
         assert breadth_data["available"] is True
         assert "breadth_ratio" in breadth_data
@@ -360,40 +393,24 @@ class TestMarketRegimeIndicatorsTool:
         self, mock_market_data_provider: MarketDataProvider
     ) -> None:
         """Test market breadth calculation with no market data."""
-        mock_market_data_provider.get_historical_data = AsyncMock(return_value=[])
-
         tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
-        breadth_data = await tool._calculate_market_breadth(
-            "SPY", datetime(2023, 1, 1), datetime(2023, 12, 31)
-        )
+        breadth_data = await tool._calculate_market_breadth("SPY", {})
 
         assert breadth_data["available"] is False
         assert "error" in breadth_data
 
-    @pytest.mark.asyncio
-    async def test_calculate_sector_rotation_success(
+    def test_calculate_sector_rotation_success(
         self,
         mock_market_data_provider: MarketDataProvider,
         sample_market_data: list[MarketDataPoint],
         sample_sector_data: list[MarketDataPoint],
     ) -> None:
         """Test successful sector rotation calculation."""
-
-        async def mock_get_historical_data(symbol, start_date, end_date, interval="1d"):
-            if symbol == "SPY":
-                return sample_market_data
-            elif symbol in SECTOR_ETFS:
-                return sample_sector_data
-            return []
-
-        mock_market_data_provider.get_historical_data = AsyncMock(
-            side_effect=mock_get_historical_data
-        )
+        history = {"SPY": sample_market_data}
+        history.update(dict.fromkeys(SECTOR_ETFS, sample_sector_data))
 
         tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
-        rotation_data = await tool._calculate_sector_rotation(
-            "SPY", datetime(2023, 1, 1), datetime(2023, 12, 31)
-        )
+        rotation_data = tool._calculate_sector_rotation("SPY", indicators._close_prices(history))
 
         assert rotation_data["available"] is True
         assert "rotation_theme" in rotation_data
@@ -404,17 +421,12 @@ class TestMarketRegimeIndicatorsTool:
         assert "market_return_20d" in rotation_data
         assert "market_return_60d" in rotation_data
 
-    @pytest.mark.asyncio
-    async def test_calculate_sector_rotation_no_data(
+    def test_calculate_sector_rotation_no_data(
         self, mock_market_data_provider: MarketDataProvider
     ) -> None:
         """Test sector rotation calculation with no data."""
-        mock_market_data_provider.get_historical_data = AsyncMock(return_value=[])
-
         tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
-        rotation_data = await tool._calculate_sector_rotation(
-            "SPY", datetime(2023, 1, 1), datetime(2023, 12, 31)
-        )
+        rotation_data = tool._calculate_sector_rotation("SPY", {})
 
         assert rotation_data["available"] is False
         assert "error" in rotation_data
@@ -507,3 +519,605 @@ class TestFactoryFunction:
 
         assert isinstance(tool, MarketRegimeIndicatorsTool)
         assert tool._provider == mock_market_data_provider
+
+
+@pytest.mark.unit
+class TestSectorFetchConcurrency:
+    """Test that sector ETF fetches overlap instead of running one after another."""
+
+    @pytest.mark.asyncio
+    async def test_sector_fetches_run_concurrently_with_cap(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """Sector fetches overlap, but never more than MAX_CONCURRENT_FETCHES at once."""
+        in_flight = 0
+        peak = 0
+
+        async def mock_get_historical_data(symbol, start_date, end_date, interval="1d"):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if symbol == "XLE":
+                raise RuntimeError("boom")
+            return sample_sector_data
+
+        mock_market_data_provider.get_historical_data = AsyncMock(
+            side_effect=mock_get_historical_data
+        )
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        history = await tool._fetch_history(
+            list(SECTOR_ETFS), datetime(2023, 1, 1), datetime(2023, 12, 31)
+        )
+
+        assert set(history) == set(SECTOR_ETFS) - {"XLE"}
+        assert 1 < peak <= MAX_CONCURRENT_FETCHES
+
+    @pytest.mark.asyncio
+    async def test_execute_overlaps_vix_with_sector_fetches(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_vix_data: list[MarketDataPoint],
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """The VIX request is in flight before any market/sector fetch completes."""
+        events: list[tuple[str, str]] = []
+
+        async def mock_get_historical_data(symbol, start_date, end_date, interval="1d"):
+            events.append(("start", symbol))
+            await asyncio.sleep(0.01)
+            events.append(("end", symbol))
+            return sample_vix_data if symbol == "^VIX" else sample_sector_data
+
+        mock_market_data_provider.get_historical_data = AsyncMock(
+            side_effect=mock_get_historical_data
+        )
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        result = await tool.execute(market_index="SPY")
+
+        assert result.data["vix"]["available"] is True
+        first_end = next(i for i, (kind, _) in enumerate(events) if kind == "end")
+        assert ("start", "^VIX") in events[:first_end]
+
+    @pytest.mark.asyncio
+    async def test_execute_overlaps_vix_with_market_cap_quotes(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_vix_data: list[MarketDataPoint],
+        sample_market_data: list[MarketDataPoint],
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """Breadth requests its quotes without waiting for the VIX fetch to finish."""
+        quote_requested = asyncio.Event()
+
+        async def mock_get_historical_data(symbol, start_date, end_date, interval="1d"):
+            if symbol == "^VIX":
+                await quote_requested.wait()
+                return sample_vix_data
+            return sample_market_data if symbol == "SPY" else sample_sector_data
+
+        async def mock_get_quote(symbol):
+            quote_requested.set()
+            return {"market_cap": 1_000_000_000}
+
+        mock_market_data_provider.get_historical_data = AsyncMock(
+            side_effect=mock_get_historical_data
+        )
+        mock_market_data_provider.get_quote = AsyncMock(side_effect=mock_get_quote)
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        result = await asyncio.wait_for(tool.execute(market_index="SPY"), timeout=5)
+
+        assert list(result.data)[-3:] == ["vix", "market_breadth", "sector_rotation"]
+        assert result.data["vix"]["available"] is True
+        assert result.data["market_breadth"]["available"] is True
+        assert result.data["sector_rotation"]["available"] is True
+
+    @pytest.mark.asyncio
+    async def test_missing_market_index_skips_queued_sector_fetches(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """Without market index history, sector fetches still queued never start."""
+
+        async def mock_get_historical_data(symbol, start_date, end_date, interval="1d"):
+            if symbol == "SPY":
+                return []
+            await asyncio.sleep(0.01)
+            return sample_sector_data
+
+        mock_market_data_provider.get_historical_data = AsyncMock(
+            side_effect=mock_get_historical_data
+        )
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        result = await tool.execute(market_index="SPY", include_vix=False)
+
+        assert result.success is True
+        assert result.data["market_breadth"]["available"] is False
+        assert result.data["sector_rotation"]["available"] is False
+        fetched = mock_market_data_provider.get_historical_data.await_count
+        assert fetched <= MAX_CONCURRENT_FETCHES + 1 < len(SECTOR_ETFS) + 1
+        mock_market_data_provider.get_quote.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_execute_fetches_each_symbol_once(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_market_data: list[MarketDataPoint],
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """Breadth and rotation share one fetch of the market index and each sector."""
+
+        async def mock_get_historical_data(symbol, start_date, end_date, interval="1d"):
+            return sample_market_data if symbol == "SPY" else sample_sector_data
+
+        mock_market_data_provider.get_historical_data = AsyncMock(
+            side_effect=mock_get_historical_data
+        )
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        result = await tool.execute(market_index="SPY", include_vix=False)
+
+        assert result.data["market_breadth"]["available"] is True
+        assert result.data["sector_rotation"]["available"] is True
+        fetched = [
+            call.args[0] for call in mock_market_data_provider.get_historical_data.call_args_list
+        ]
+        assert sorted(fetched) == sorted(["SPY", *SECTOR_ETFS])
+
+
+@pytest.mark.unit
+class TestBatchHistoryFetch:
+    """Test history fetching through providers with a multi-symbol endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_cache_misses_fetched_in_one_batch_request(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_market_data: list[MarketDataPoint],
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """Symbols missing from the caches go to the provider in one batch call."""
+
+        async def mock_get_historical_data_batch(symbols, start_date, end_date, interval="1d"):
+            return {s: sample_market_data if s == "SPY" else sample_sector_data for s in symbols}
+
+        mock_market_data_provider.get_historical_data = AsyncMock(return_value=sample_sector_data)
+        mock_market_data_provider.get_historical_data_batch = AsyncMock(
+            side_effect=mock_get_historical_data_batch
+        )
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        start, end = datetime(2023, 1, 1), datetime(2023, 12, 31)
+        # XLK is already in the in-process cache
+        await tool._get_historical_data_cached("XLK", start, end)
+
+        history = await tool._fetch_history(["SPY", "XLK", "XLF"], start, end)
+
+        assert list(history) == ["SPY", "XLK", "XLF"]
+        assert history["SPY"] == sample_market_data
+        batch = mock_market_data_provider.get_historical_data_batch
+        batch.assert_awaited_once()
+        assert batch.await_args.args[0] == ["SPY", "XLF"]
+        # A repeat run is served from the in-process cache
+        assert await tool._fetch_history(["SPY", "XLF"], start, end) == {
+            "SPY": sample_market_data,
+            "XLF": sample_sector_data,
+        }
+        assert batch.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_request_falls_back_to_per_symbol_fetches(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """A failing batch endpoint does not fail the run."""
+        mock_market_data_provider.get_historical_data = AsyncMock(return_value=sample_sector_data)
+        mock_market_data_provider.get_historical_data_batch = AsyncMock(
+            side_effect=RuntimeError("batch endpoint down")
+        )
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+
+        history = await tool._fetch_history(
+            ["XLK", "XLF"], datetime(2023, 1, 1), datetime(2023, 12, 31)
+        )
+
+        assert history == {"XLK": sample_sector_data, "XLF": sample_sector_data}
+        assert mock_market_data_provider.get_historical_data.await_count == 2
+
+
+@pytest.mark.unit
+class TestHistoryCache:
+    """Test the in-process TTL cache for historical data."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_and_concurrent_fetches_hit_provider_once(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """Concurrent and repeated requests for the same window share one fetch."""
+
+        async def mock_get_historical_data(symbol, start_date, end_date, interval="1d"):
+            await asyncio.sleep(0.01)
+            return sample_sector_data
+
+        mock_market_data_provider.get_historical_data = AsyncMock(
+            side_effect=mock_get_historical_data
+        )
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        start, end = datetime(2023, 1, 1, 9), datetime(2023, 12, 31, 9)
+
+        results = await asyncio.gather(
+            *(tool._get_historical_data_cached("xlk", start, end) for _ in range(3))
+        )
+        # A later call on the same days reuses the entry despite a different time of day
+        again = await tool._get_historical_data_cached("XLK", start, end.replace(hour=15))
+
+        assert all(result == sample_sector_data for result in [*results, again])
+        assert mock_market_data_provider.get_historical_data.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_repeat_runs_reuse_converted_close_prices(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_market_data: list[MarketDataPoint],
+        sample_sector_data: list[MarketDataPoint],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Closes of cached history are converted once, not on every run."""
+
+        async def mock_get_historical_data(symbol, start_date, end_date, interval="1d"):
+            return sample_market_data if symbol == "SPY" else list(sample_sector_data)
+
+        mock_market_data_provider.get_historical_data = AsyncMock(
+            side_effect=mock_get_historical_data
+        )
+        conversions: list[int] = []
+        real_to_prices = indicators._to_prices
+
+        def counting_to_prices(data_list):
+            conversions.append(len(data_list))
+            return real_to_prices(data_list)
+
+        monkeypatch.setattr(indicators, "_to_prices", counting_to_prices)
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+
+        first = await tool.execute(market_index="SPY", include_vix=False)
+        converted_first_run = len(conversions)
+        second = await tool.execute(market_index="SPY", include_vix=False)
+
+        assert converted_first_run == len(SECTOR_ETFS) + 1
+        assert len(conversions) == converted_first_run
+        assert second.data["market_breadth"] == first.data["market_breadth"]
+        assert all(not closes.flags.writeable for _, closes in tool._close_cache.values())
+
+    @pytest.mark.asyncio
+    async def test_cache_manager_entries_use_tool_ttls(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """History and quotes are stored with their own TTLs and reused by new instances."""
+        mock_market_data_provider.get_historical_data = AsyncMock(return_value=sample_sector_data)
+        cache_manager = CacheManager(InMemoryCacheBackend(), default_ttl=timedelta(minutes=1))
+        start, end = datetime(2023, 1, 1), datetime(2023, 12, 31)
+
+        for _ in range(2):
+            tool = MarketRegimeIndicatorsTool(
+                mock_market_data_provider, cache_manager=cache_manager
+            )
+            assert await tool._get_historical_data_cached("XLK", start, end) == sample_sector_data
+            assert (await tool._get_quote_cached("XLK"))["market_cap"] == 1_000_000_000
+
+        assert mock_market_data_provider.get_historical_data.await_count == 1
+        assert mock_market_data_provider.get_quote.await_count == 1
+        history_entry = await cache_manager.get(
+            "get_historical_market_data",
+            symbol="XLK",
+            start_date="2023-01-01",
+            end_date="2023-12-31",
+            interval="1d",
+        )
+        quote_entry = await cache_manager.get("get_market_quote", symbol="XLK")
+        assert history_entry is not None and quote_entry is not None
+        assert history_entry.metadata["ttl_seconds"] == indicators.HISTORY_CACHE_TTL.total_seconds()
+        assert quote_entry.metadata["ttl_seconds"] == indicators.QUOTE_CACHE_TTL.total_seconds()
+
+    @pytest.mark.asyncio
+    async def test_entries_expire_and_cache_can_be_disabled(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_sector_data: list[MarketDataPoint],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Expired entries are refetched; a TTL of None always goes to the provider."""
+        mock_market_data_provider.get_historical_data = AsyncMock(return_value=sample_sector_data)
+        start, end = datetime(2023, 1, 1), datetime(2023, 12, 31)
+        clock = [1000.0]
+        monkeypatch.setattr(indicators.time, "monotonic", lambda: clock[0])
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider, history_cache_ttl_seconds=60)
+        await tool._get_historical_data_cached("XLK", start, end)
+        clock[0] += 59
+        await tool._get_historical_data_cached("XLK", start, end)
+        assert mock_market_data_provider.get_historical_data.await_count == 1
+        clock[0] += 2
+        await tool._get_historical_data_cached("XLK", start, end)
+        assert mock_market_data_provider.get_historical_data.await_count == 2
+
+        uncached = MarketRegimeIndicatorsTool(
+            mock_market_data_provider, history_cache_ttl_seconds=None
+        )
+        await uncached._get_historical_data_cached("XLK", start, end)
+        await uncached._get_historical_data_cached("XLK", start, end)
+        assert mock_market_data_provider.get_historical_data.await_count == 4
+
+
+def _linear_history(
+    symbol: str, start: float, step: float, days: int = 80
+) -> list[MarketDataPoint]:
+    base_date = datetime(2023, 1, 1)
+    return [
+        MarketDataPoint(
+            symbol=symbol,
+            timestamp=base_date + timedelta(days=i),
+            open_price=Decimal("1"),
+            close_price=Decimal(str(start + step * i)),
+            high_price=Decimal("1"),
+            low_price=Decimal("1"),
+            volume=1,
+        )
+        for i in range(days)
+    ]
+
+
+@pytest.mark.unit
+class TestSectorRotationMath:
+    """Test sector rotation returns and ranking."""
+
+    def test_returns_and_ranking_per_sector(
+        self, mock_market_data_provider: MarketDataProvider
+    ) -> None:
+        """Each sector's returns use its own closes and sectors rank by momentum."""
+        history = {"SPY": _linear_history("SPY", 100.0, 0.0)}
+        for i, symbol in enumerate(SECTOR_ETFS):
+            history[symbol] = _linear_history(symbol, 50.0, 0.1 * i)
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        rotation = tool._calculate_sector_rotation("SPY", indicators._close_prices(history))
+
+        ranked = rotation["all_sectors_ranked"]
+        assert [s["symbol"] for s in ranked] == list(reversed(list(SECTOR_ETFS)))
+        xlk = next(s for s in ranked if s["symbol"] == "XLK")
+        assert xlk["sector_return_20d"] == 0.0
+        xlre = ranked[0]
+        closes = [50.0 + 1.0 * i for i in range(80)]
+        assert xlre["sector_return_20d"] == round((closes[-1] - closes[-20]) / closes[-20] * 100, 2)
+        assert xlre["sector_return_60d"] == round((closes[-1] - closes[-60]) / closes[-60] * 100, 2)
+        assert rotation["market_return_20d"] == 0.0
+
+    @pytest.mark.parametrize(
+        ("leaders", "theme"),
+        [
+            (("XLU", "XLP", "XLE"), "defensive"),
+            (("XLK", "XLE", "XLB"), "growth"),
+            (("XLF", "XLE", "XLB"), "value"),
+            (("XLU", "XLK", "XLE"), "mixed"),
+            (("XLU", "XLF", "XLE"), "defensive"),
+            (("XLU", "XLK", "XLF"), "value"),
+        ],
+    )
+    def test_rotation_theme_from_leading_sectors(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        leaders: tuple[str, ...],
+        theme: str,
+    ) -> None:
+        """The theme follows which sector groups appear among the top three."""
+        history = {"SPY": _linear_history("SPY", 100.0, 0.0)}
+        for symbol in SECTOR_ETFS:
+            step = 1.0 - 0.1 * leaders.index(symbol) if symbol in leaders else 0.0
+            history[symbol] = _linear_history(symbol, 50.0, step)
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        rotation = tool._calculate_sector_rotation("SPY", indicators._close_prices(history))
+
+        assert [s["symbol"] for s in rotation["leading_sectors"]] == list(leaders)
+        assert rotation["rotation_theme"] == theme
+
+
+@pytest.mark.unit
+class TestMarketBreadthMath:
+    """Test per-sector breadth stats computed from the stacked price tails."""
+
+    @pytest.mark.asyncio
+    async def test_sector_stats_with_uneven_history_lengths(
+        self, mock_market_data_provider: MarketDataProvider
+    ) -> None:
+        """Sectors with different history lengths match their own full-series stats."""
+        history = {
+            "SPY": _linear_history("SPY", 100.0, 0.0, days=250),
+            "XLK": _linear_history("XLK", 50.0, 0.5, days=250),
+            "XLF": _linear_history("XLF", 80.0, -0.2, days=60),
+            "XLE": _linear_history("XLE", 50.0, 0.5, days=40),
+        }
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        breadth = await tool._calculate_market_breadth("SPY", history)
+
+        details = breadth["sector_details"]
+        assert set(details) == {"XLK", "XLF"}
+        assert breadth["sectors_above_50ma"] == 1
+        for symbol, days in (("XLK", 250), ("XLF", 60)):
+            closes = [float(d.close_price) for d in history[symbol]]
+            assert len(closes) == days
+            sector = details[symbol]
+            assert sector["current_price"] == round(closes[-1], 2)
+            assert sector["return_5d"] == round((closes[-1] - closes[-6]) / closes[-6] * 100, 2)
+            assert sector["rsi_14d"] == round(relative_strength_index(closes, 14), 2)
+            vol = rolling_volatility_annualized_from_prices(closes, window=20)[-1]
+            assert sector["volatility_20d"] == round(vol * 100, 2)
+        assert details["XLK"]["above_50ma"] is True
+        assert details["XLK"]["price_above_200ma"] is True
+        assert details["XLF"]["above_50ma"] is False
+        assert details["XLF"]["price_above_200ma"] is None
+
+    @pytest.mark.asyncio
+    async def test_ytd_return_starts_at_first_point_of_the_year(
+        self, mock_market_data_provider: MarketDataProvider
+    ) -> None:
+        """YTD uses the first close on or after January 1 of the ``as_of`` year."""
+        year = 2024
+        spanning = [
+            point.model_copy(
+                update={"timestamp": datetime(year - 1, 12, 1, tzinfo=UTC) + timedelta(days=i)}
+            )
+            for i, point in enumerate(_linear_history("XLK", 50.0, 1.0, days=80))
+        ]
+        history = {
+            "SPY": _linear_history("SPY", 100.0, 0.0),
+            "XLK": spanning,
+            "XLF": _linear_history("XLF", 50.0, 1.0),
+        }
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        details = (
+            await tool._calculate_market_breadth(
+                "SPY", history, as_of=datetime(year, 3, 1, tzinfo=UTC)
+            )
+        )["sector_details"]
+
+        # December has 31 days, so January 1 is the 32nd point
+        ytd_start, current = 50.0 + 31.0, 50.0 + 79.0
+        assert details["XLK"]["return_ytd"] == round((current - ytd_start) / ytd_start * 100, 2)
+        assert details["XLF"]["return_ytd"] is None
+
+
+@pytest.mark.unit
+class TestMarketCapFetch:
+    """Test concurrent market-cap quote fetching in market breadth."""
+
+    @pytest.mark.asyncio
+    async def test_quotes_fetched_concurrently_with_per_sector_retry(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_market_data: list[MarketDataPoint],
+        sample_sector_data: list[MarketDataPoint],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A failing quote is retried without holding up the other sectors."""
+        attempts: dict[str, int] = {}
+        in_flight = 0
+        peak = 0
+        real_sleep = asyncio.sleep
+
+        async def mock_get_quote(symbol):
+            nonlocal in_flight, peak
+            attempts[symbol] = attempts.get(symbol, 0) + 1
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await real_sleep(0.01)
+            in_flight -= 1
+            if symbol == "XLC" and attempts[symbol] == 1:
+                raise RuntimeError("transient")
+            if symbol == "XLRE":
+                raise RuntimeError("down")
+            return {"market_cap": 1_000_000 * (list(SECTOR_ETFS).index(symbol) + 1)}
+
+        async def no_backoff(_delay):
+            await real_sleep(0)
+
+        monkeypatch.setattr(indicators.asyncio, "sleep", no_backoff)
+        mock_market_data_provider.get_quote = AsyncMock(side_effect=mock_get_quote)
+        history = {"SPY": sample_market_data}
+        history.update(dict.fromkeys(SECTOR_ETFS, sample_sector_data))
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        breadth = await tool._calculate_market_breadth("SPY", history)
+
+        details = breadth["sector_details"]
+        assert attempts["XLC"] == 2
+        assert details["XLC"]["market_cap"] is not None
+        assert attempts["XLRE"] == 2
+        assert details["XLRE"]["market_cap"] is None
+        assert details["XLRE"]["market_cap_rank"] is None
+        assert 1 < peak <= indicators.MAX_CONCURRENT_FETCHES
+
+    @pytest.mark.asyncio
+    async def test_market_cap_ranks_largest_first_with_ties_in_sector_order(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_market_data: list[MarketDataPoint],
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """Ranks start at 1 for the largest cap; sectors without a cap are unranked."""
+        caps = {"XLK": 50, "XLF": 90, "XLE": 50, "XLV": None}
+        mock_market_data_provider.get_quote = AsyncMock(
+            side_effect=lambda symbol: {"market_cap": caps[symbol]}
+        )
+        history = {"SPY": sample_market_data}
+        history.update(dict.fromkeys(caps, sample_sector_data))
+
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider)
+        details = (await tool._calculate_market_breadth("SPY", history))["sector_details"]
+
+        ranks = {symbol: details[symbol]["market_cap_rank"] for symbol in caps}
+        assert ranks == {"XLF": 1, "XLK": 2, "XLE": 3, "XLV": None}
+
+    @pytest.mark.asyncio
+    async def test_inflight_fetch_shared_without_cache_and_survives_cancelled_caller(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_sector_data: list[MarketDataPoint],
+    ) -> None:
+        """Concurrent callers share a fetch even with the TTL cache disabled."""
+        release = asyncio.Event()
+
+        async def mock_get_historical_data(symbol, start_date, end_date, interval="1d"):
+            await release.wait()
+            return sample_sector_data
+
+        mock_market_data_provider.get_historical_data = AsyncMock(
+            side_effect=mock_get_historical_data
+        )
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider, history_cache_ttl_seconds=None)
+        start, end = datetime(2023, 1, 1), datetime(2023, 12, 31)
+
+        cancelled = asyncio.create_task(tool._get_historical_data_cached("XLK", start, end))
+        waiting = asyncio.create_task(tool._get_historical_data_cached("XLK", start, end))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        release.set()
+
+        assert await waiting == sample_sector_data
+        assert mock_market_data_provider.get_historical_data.await_count == 1
+        assert tool._history_inflight == {}
+        assert tool._history_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_pruned_on_store(
+        self,
+        mock_market_data_provider: MarketDataProvider,
+        sample_sector_data: list[MarketDataPoint],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Storing a new entry drops entries that have outlived the TTL."""
+        mock_market_data_provider.get_historical_data = AsyncMock(return_value=sample_sector_data)
+        clock = [1000.0]
+        monkeypatch.setattr(indicators.time, "monotonic", lambda: clock[0])
+        tool = MarketRegimeIndicatorsTool(mock_market_data_provider, history_cache_ttl_seconds=60)
+        start, end = datetime(2023, 1, 1), datetime(2023, 12, 31)
+
+        await tool._get_historical_data_cached("XLK", start, end)
+        clock[0] += 61
+        await tool._get_historical_data_cached("XLE", start, end)
+
+        assert [key[0] for key in tool._history_cache] == ["XLE"]
@@ -0,0 +1 @@
+"""Unit tests for loaders and persistence helpers."""
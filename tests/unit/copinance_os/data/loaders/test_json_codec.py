@@ -0,0 +1,62 @@
+"""Unit tests for the persisted-state JSON codec."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from copinance_os.data.loaders import json_codec
+from copinance_os.data.loaders.json_codec import dumps_json, load_json_file, loads_json
+
+
+@pytest.mark.unit
+class TestJsonCodec:
+    """Test dumps_json / loads_json with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, use_orjson: bool) -> None:
+        if use_orjson and not json_codec.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        payload = {"schema_version": "v2", "name": "Café", "values": [1, 2.5, None]}
+        backend = json_codec.orjson if use_orjson else None
+
+        with patch.object(json_codec, "orjson", backend):
+            encoded = dumps_json(payload)
+            assert isinstance(encoded, bytes)
+            assert b"\n" not in encoded
+            assert loads_json(encoded) == payload
+            assert loads_json(memoryview(encoded)) == payload
+            assert loads_json(encoded.decode("utf-8")) == payload
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_indent_matches_stdlib_pretty_print(self, use_orjson: bool) -> None:
+        if use_orjson and not json_codec.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        payload = {"entities": {"a": {"value": 1}}, "schema_version": "v2"}
+        backend = json_codec.orjson if use_orjson else None
+
+        with patch.object(json_codec, "orjson", backend):
+            encoded = dumps_json(payload, indent=True)
+
+        assert encoded.decode("utf-8") == json.dumps(payload, indent=2)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_invalid_json_raises_json_decode_error(self, use_orjson: bool) -> None:
+        if use_orjson and not json_codec.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        backend = json_codec.orjson if use_orjson else None
+
+        with patch.object(json_codec, "orjson", backend), pytest.raises(json.JSONDecodeError):
+            loads_json(b"{not json")
+
+    @pytest.mark.parametrize("threshold", [0, 1 << 30])
+    def test_load_json_file_with_and_without_mmap(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, threshold: int
+    ) -> None:
+        monkeypatch.setattr(json_codec, "MMAP_THRESHOLD_BYTES", threshold)
+        payload = {"entities": {str(i): {"value": i} for i in range(50)}}
+        path = tmp_path / "collection.json"
+        path.write_bytes(dumps_json(payload, indent=True))
+
+        assert load_json_file(path) == payload
@@ -2,6 +2,7 @@
 
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -11,7 +12,7 @@ from copinance_os.data.providers.yfinance import (
     YFinanceFundamentalProvider,
     YFinanceMarketProvider,
 )
-from copinance_os.domain.exceptions import DataProviderError
+from copinance_os.domain.exceptions import DataProviderError, DataProviderUnavailableError
 from copinance_os.domain.models.market import MarketDataPoint
 from copinance_os.domain.models.market.fundamentals import (
     BalanceSheet,
@@ -356,6 +357,40 @@ class TestYFinanceMarketProvider:
                 await provider.get_historical_data("AAPL", start_date, end_date)
             mock_logger.error.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_historical_data_batch_splits_download_by_symbol(self) -> None:
+        """One download is split per symbol; missing bars and symbols are dropped."""
+        pd = pytest.importorskip("pandas")
+        index = pd.DatetimeIndex(["2024-01-02", "2024-01-03"], tz="America/New_York")
+        columns = pd.MultiIndex.from_product(
+            [["SPY", "XLK"], ["Open", "High", "Low", "Close", "Volume"]]
+        )
+        frame = pd.DataFrame(
+            [
+                [470.0, 472.0, 468.0, 471.5, 1000, 190.0, 191.0, 189.0, 190.5, 500],
+                [471.0, 473.0, 469.0, 472.5, 1100] + [float("nan")] * 5,
+            ],
+            index=index,
+            columns=columns,
+        )
+        to_thread = AsyncMock(return_value=frame)
+
+        with (
+            patch("copinance_os.data.providers.yfinance.YFINANCE_AVAILABLE", True),
+            patch("asyncio.to_thread", new=to_thread),
+        ):
+            provider = YFinanceMarketProvider()
+            result = await provider.get_historical_data_batch(
+                ["spy", "XLK", "XLC"], datetime(2024, 1, 1), datetime(2024, 1, 31)
+            )
+
+        to_thread.assert_awaited_once()
+        assert set(result) == {"SPY", "XLK"}
+        assert [p.close_price for p in result["SPY"]] == [Decimal("471.5"), Decimal("472.5")]
+        assert len(result["XLK"]) == 1
+        assert result["XLK"][0].symbol == "XLK"
+        assert result["XLK"][0].volume == 500
+
     @pytest.mark.asyncio
     async def test_get_intraday_data_success(self) -> None:
         """Test getting intraday data successfully."""
@@ -1143,13 +1178,58 @@ class TestYFinanceFundamentalProvider:
             ),
         ):
             provider = YFinanceFundamentalProvider()
+            as_of = datetime(2025, 1, 2, tzinfo=UTC)
             result = await provider.get_detailed_fundamentals(
-                "AAPL", periods=1, period_type="annual"
+                "AAPL", periods=1, period_type="annual", as_of=as_of
             )
 
             assert isinstance(result, StockFundamentals)
             assert result.symbol == "AAPL"
             assert result.company_name == "Apple Inc."
+            assert result.data_as_of == as_of
+
+    @staticmethod
+    def _statement_frame(rows: list[str], value: Decimal) -> MagicMock:
+        frame = MagicMock()
+        frame.empty = False
+        frame.columns = [datetime(2024, 12, 31)]
+        series = MagicMock()
+        series.index = rows
+        series.loc = MagicMock(return_value=value)
+        frame.__getitem__ = MagicMock(return_value=series)
+        return frame
+
+    @pytest.mark.asyncio
+    async def test_get_detailed_fundamentals_shared_as_of_stamps_every_symbol(self) -> None:
+        """Symbols fetched with one as_of carry the identical data_as_of."""
+        fetches: list[Any] = []
+        for name in ("Apple Inc.", "Microsoft Corporation"):
+            ticker = MagicMock()
+            ticker.info = {"longName": name, "currency": "USD"}
+            fetches += [
+                ticker,
+                ticker.info,
+                self._statement_frame(["Total Revenue"], Decimal("1000000")),
+                self._statement_frame(["Total Assets"], Decimal("5000000")),
+                self._statement_frame(["Operating Cash Flow"], Decimal("250000")),
+            ]
+
+        with (
+            patch("copinance_os.data.providers.yfinance.YFINANCE_AVAILABLE", True),
+            patch("asyncio.to_thread", new=AsyncMock(side_effect=fetches)),
+        ):
+            provider = YFinanceFundamentalProvider()
+            as_of = datetime(2025, 1, 2, tzinfo=UTC)
+            apple = await provider.get_detailed_fundamentals(
+                "AAPL", periods=1, period_type="annual", as_of=as_of
+            )
+            microsoft = await provider.get_detailed_fundamentals(
+                "MSFT", periods=1, period_type="annual", as_of=as_of
+            )
+
+        assert apple.company_name == "Apple Inc."
+        assert microsoft.company_name == "Microsoft Corporation"
+        assert apple.data_as_of == microsoft.data_as_of == as_of
 
     @pytest.mark.asyncio
     async def test_get_detailed_fundamentals_uses_cache(self) -> None:
@@ -1207,6 +1287,43 @@ class TestYFinanceFundamentalProvider:
             with pytest.raises(DataProviderError, match="No financial data found"):
                 await provider.get_detailed_fundamentals("INVALID", periods=1, period_type="annual")
 
+    @staticmethod
+    def _frame_with_broken_columns() -> MagicMock:
+        frame = MagicMock()
+        frame.empty = False
+        frame.columns.__getitem__.side_effect = IndexError("index 0 is out of bounds")
+        return frame
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("frames", "message"),
+        [
+            ("broken_columns", "out of bounds"),
+            ("none", "has no attribute"),
+        ],
+    )
+    async def test_get_detailed_fundamentals_parse_lookup_errors_are_provider_errors(
+        self, frames: str, message: str
+    ) -> None:
+        """Test that index/attribute errors while parsing frames surface as DataProviderError."""
+        mock_ticker = MagicMock()
+        mock_ticker.info = {}
+        if frames == "broken_columns":
+            statement_frames: list[Any] = [self._frame_with_broken_columns() for _ in range(3)]
+        else:
+            statement_frames = [None, None, None]
+
+        with (
+            patch("copinance_os.data.providers.yfinance.YFINANCE_AVAILABLE", True),
+            patch(
+                "asyncio.to_thread",
+                new=AsyncMock(side_effect=[mock_ticker, mock_ticker.info, *statement_frames]),
+            ),
+        ):
+            provider = YFinanceFundamentalProvider()
+            with pytest.raises(DataProviderError, match=message):
+                await provider.get_detailed_fundamentals("AAPL", periods=1, period_type="annual")
+
     @pytest.mark.asyncio
     async def test_get_detailed_fundamentals_yfinance_not_available(self) -> None:
         """Test get_detailed_fundamentals when yfinance not available."""
@@ -1214,3 +1331,17 @@ class TestYFinanceFundamentalProvider:
             provider = YFinanceFundamentalProvider()
             with pytest.raises(DataProviderError, match="yfinance is not installed"):
                 await provider.get_detailed_fundamentals("AAPL", periods=1, period_type="annual")
+
+    @pytest.mark.asyncio
+    async def test_get_detailed_fundamentals_connection_error_is_unavailable(self) -> None:
+        """Test that connectivity failures during fetch surface as provider unavailable."""
+        with (
+            patch("copinance_os.data.providers.yfinance.YFINANCE_AVAILABLE", True),
+            patch(
+                "asyncio.to_thread",
+                new=AsyncMock(side_effect=ConnectionError("Connection reset by peer")),
+            ),
+        ):
+            provider = YFinanceFundamentalProvider()
+            with pytest.raises(DataProviderUnavailableError):
+                await provider.get_detailed_fundamentals("AAPL", periods=1, period_type="annual")
@@ -2,11 +2,13 @@
 
 from datetime import UTC, datetime
 from decimal import Decimal
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from copinance_os.data.repositories.stock.repository import StockRepositoryImpl
+from copinance_os.data.repositories.storage.file import JsonFileStorage
 from copinance_os.domain.models.entities.stock import Stock
 from copinance_os.domain.models.market import MarketDataPoint
 from copinance_os.domain.ports.storage import Storage
@@ -59,7 +61,7 @@ class TestStockRepositoryImpl:
         mock_storage = MagicMock(spec=Storage)
         collection: dict = {}
         mock_storage.get_collection = MagicMock(return_value=collection)
-        mock_storage.save = MagicMock()
+        mock_storage.mark_dirty = MagicMock()
 
         repository = StockRepositoryImpl(storage=mock_storage)
         stock = Stock(symbol="AAPL", name="Apple Inc.", exchange="NASDAQ")
@@ -68,7 +70,110 @@ class TestStockRepositoryImpl:
 
         assert saved is stock
         assert collection[stock.id] is stock
-        mock_storage.save.assert_called_once_with("market/instruments/equities")
+        mock_storage.mark_dirty.assert_called_once_with("market/instruments/equities", stock.id)
+
+    @pytest.mark.asyncio
+    async def test_symbol_index_tracks_saves(self) -> None:
+        mock_storage = MagicMock(spec=Storage)
+        collection: dict = {}
+        mock_storage.get_collection = MagicMock(return_value=collection)
+        repository = StockRepositoryImpl(storage=mock_storage)
+
+        stub = Stock(symbol="APPLE", name="APPLE", exchange="")
+        await repository.save(stub)
+        renamed = stub.model_copy(update={"symbol": "AAPL"})
+        await repository.save(renamed)
+
+        assert await repository.get_by_symbol("APPLE") is None
+        assert await repository.get_by_symbol("aapl") is renamed
+
+        fresher = Stock(symbol="AAPL", name="Apple Inc.", exchange="NASDAQ")
+        await repository.save(fresher)
+        # Like a scan of the collection, the first stock holding a symbol wins
+        assert await repository.get_by_symbol("AAPL") is renamed
+
+        assert await repository.search("apple") == [renamed, fresher]
+        assert await repository.search("apple", limit=1) == [renamed]
+        assert await repository.search("apple", limit=0) == []
+
+        collection.clear()
+        assert await repository.get_by_symbol("AAPL") is None
+        assert await repository.search("apple") == []
+
+    @pytest.mark.asyncio
+    async def test_construction_leaves_stored_records_unvalidated(self, tmp_path: Path) -> None:
+        writer = StockRepositoryImpl(storage=JsonFileStorage(base_path=tmp_path))
+        for symbol in ("AAA", "BBB", "CCC"):
+            await writer.save(Stock(symbol=symbol, name=symbol, exchange="NYSE"))
+        storage = JsonFileStorage(base_path=tmp_path)
+
+        repository = StockRepositoryImpl(storage=storage)
+
+        collection = storage.get_collection("market/instruments/equities", Stock)
+        assert len(collection._pending) == 3
+        stock = await repository.get_by_symbol("bbb")
+        assert stock is not None and stock.symbol == "BBB"
+
+    @pytest.mark.asyncio
+    async def test_search_sees_updates_from_another_repository(self) -> None:
+        mock_storage = MagicMock(spec=Storage)
+        mock_storage.get_collection = MagicMock(return_value={})
+        reader = StockRepositoryImpl(storage=mock_storage)
+        writer = StockRepositoryImpl(storage=mock_storage)
+        stock = Stock(symbol="FB", name="Facebook", exchange="NASDAQ")
+        await writer.save(stock)
+        assert await reader.search("facebook") == [stock]
+
+        renamed = stock.model_copy(update={"name": "Meta Platforms"})
+        await writer.save(renamed)
+        assert await reader.search("facebook") == []
+        assert (await reader.search("meta"))[0] is renamed
+
+        renamed.symbol = "META"
+        await writer.save(renamed)
+        assert await reader.search("fb") == []
+        assert await reader.search("meta") == [renamed]
+
+    @pytest.mark.asyncio
+    async def test_symbol_index_follows_in_place_rename(self) -> None:
+        mock_storage = MagicMock(spec=Storage)
+        mock_storage.get_collection = MagicMock(return_value={})
+        repository = StockRepositoryImpl(storage=mock_storage)
+
+        stock = Stock(symbol="FB", name="Meta Platforms", exchange="NASDAQ")
+        await repository.save(stock)
+        stock.symbol = "META"
+        await repository.save(stock)
+
+        assert await repository.get_by_symbol("FB") is None
+        assert await repository.get_by_symbol("META") is stock
+        assert await repository.search("meta") == [stock]
+
+    @pytest.mark.asyncio
+    async def test_symbol_index_with_duplicate_symbols(self) -> None:
+        mock_storage = MagicMock(spec=Storage)
+        mock_storage.get_collection = MagicMock(return_value={})
+        repository = StockRepositoryImpl(storage=mock_storage)
+
+        first = Stock(symbol="ABC", name="First", exchange="NYSE")
+        second = Stock(symbol="ABC", name="Second", exchange="NASDAQ")
+        await repository.save(first)
+        await repository.save(second)
+        assert await repository.get_by_symbol("abc") is first
+
+        # Renaming the indexed holder hands the symbol to the remaining stock
+        await repository.save(first.model_copy(update={"symbol": "XYZ"}))
+        assert await repository.get_by_symbol("ABC") is second
+
+        # Renaming back puts the earlier stock in front again
+        restored = first.model_copy(update={"symbol": "ABC"})
+        await repository.save(restored)
+        assert await repository.get_by_symbol("ABC") is restored
+        assert await repository.get_by_symbol("XYZ") is None
+
+        # Renaming a non-indexed holder leaves the symbol with the other stock
+        await repository.save(second.model_copy(update={"symbol": "DEF"}))
+        assert await repository.get_by_symbol("ABC") is restored
 
     @pytest.mark.asyncio
     async def test_get_market_data(self) -> None:
@@ -88,3 +193,26 @@ class TestStockRepositoryImpl:
         repository._market_data["AAPL"] = [point]
 
         assert await repository.get_market_data("aapl") == [point]
+
+    @pytest.mark.asyncio
+    async def test_get_market_data_returns_most_recent_points(self) -> None:
+        mock_storage = MagicMock(spec=Storage)
+        mock_storage.get_collection = MagicMock(return_value={})
+        repository = StockRepositoryImpl(storage=mock_storage)
+
+        points = [
+            MarketDataPoint(
+                symbol="AAPL",
+                timestamp=datetime(2024, 1, day, tzinfo=UTC),
+                open_price=Decimal("150"),
+                close_price=Decimal("151"),
+                high_price=Decimal("152"),
+                low_price=Decimal("149"),
+                volume=1000000,
+            )
+            for day in range(1, 6)
+        ]
+        repository._market_data["AAPL"] = points
+
+        assert await repository.get_market_data("AAPL", limit=2) == points[-2:]
+        assert await repository.get_market_data("AAPL", limit=0) == []
@@ -1,9 +1,11 @@
 """Tests for explicit storage factory behavior."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from copinance_os.data.repositories.storage import file as file_storage
 from copinance_os.data.repositories.storage.factory import (
     StorageType,
     create_storage,
@@ -49,7 +51,7 @@ class TestStorageFactory:
         storage = create_storage(storage_type=StorageType.FILE, base_path=configured_path)
 
         assert isinstance(storage, JsonFileStorage)
-        assert storage._base_path == path
+        assert storage.base_path == path
         assert not path.exists()
 
     def test_file_storage_creates_directories_on_first_save(self, tmp_path: Path) -> None:
@@ -63,10 +65,30 @@ class TestStorageFactory:
 
         assert (path / "data" / "v2" / "items.json").exists()
 
+    @pytest.mark.parametrize("fsync", [True, False])
+    def test_file_storage_fsync_is_passed_through(self, tmp_path: Path, fsync: bool) -> None:
+        storage = create_storage(storage_type=StorageType.FILE, base_path=tmp_path, fsync=fsync)
+        entity = SampleEntity(name="one")
+        storage.get_collection("items", SampleEntity)[entity.id] = entity
+
+        with patch.object(file_storage.os, "fsync") as os_fsync:
+            storage.save("items")
+
+        assert os_fsync.called is fsync
+
     def test_file_storage_requires_explicit_path(self) -> None:
         with pytest.raises(ValueError, match="base_path is required"):
             create_storage(storage_type=StorageType.FILE)
 
+    def test_msgpack_storage_requires_explicit_path(self) -> None:
+        with pytest.raises(ValueError, match="base_path is required"):
+            create_storage(storage_type=StorageType.MSGPACK)
+
+    def test_plain_string_storage_type_is_accepted(self, tmp_path: Path) -> None:
+        assert StorageType("file") is StorageType.FILE
+        assert isinstance(create_storage("file", base_path=tmp_path), JsonFileStorage)
+        assert isinstance(create_storage("memory"), InMemoryStorage)
+
     def test_unknown_storage_type_is_rejected(self) -> None:
         with pytest.raises(ValueError, match="Unsupported storage type"):
             create_storage(storage_type="unknown")
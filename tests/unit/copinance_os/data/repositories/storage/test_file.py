@@ -3,12 +3,15 @@
 import json
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
 from copinance_os.data.loaders.persistence import get_data_dir
+from copinance_os.data.repositories.storage import file as file_storage
 from copinance_os.data.repositories.storage.file import JsonFileStorage
+from copinance_os.data.repositories.storage.lazy_collection import LazyCollection
 from copinance_os.domain.models.common.base import Entity
 from copinance_os.domain.models.entities.profile import AnalysisProfile, FinancialLiteracy
 
@@ -46,7 +49,7 @@ class TestJsonFileStorage:
             storage = JsonFileStorage(base_path=tmpdir)
             collection = storage.get_collection("test_collection", SampleEntity)
 
-            assert isinstance(collection, dict)
+            assert isinstance(collection, LazyCollection)
             assert len(collection) == 0
 
     def test_get_collection_loads_existing_data(self) -> None:
@@ -276,7 +279,7 @@ class TestJsonFileStorage:
             # Should not raise an error, should start fresh
             collection = storage.get_collection("test_collection", SampleEntity)
 
-            assert isinstance(collection, dict)
+            assert isinstance(collection, LazyCollection)
             assert len(collection) == 0
 
             # Verify warning was printed to stderr
@@ -284,6 +287,163 @@ class TestJsonFileStorage:
             assert "Warning" in captured.err or "Warning" in captured.out
             assert "test_collection" in captured.err or "test_collection" in captured.out
 
+            # The unreadable file is kept aside rather than discarded
+            assert not file_path.exists()
+            backup_path = data_dir / "test_collection.json.corrupt"
+            assert backup_path.read_text() == "invalid json content {"
+
+    def test_save_writes_compact_json_atomically(self) -> None:
+        """Test that save writes compact JSON without leaving temporary files."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = JsonFileStorage(base_path=tmpdir)
+            entity = SampleEntity(name="Compact", value=1)
+            storage.get_collection("test_collection", SampleEntity)[entity.id] = entity
+
+            storage.save("test_collection")
+            storage.save("test_collection")
+
+            data_dir = get_data_dir(tmpdir)
+            assert [p.name for p in data_dir.iterdir()] == ["test_collection.json"]
+            assert b"\n" not in (data_dir / "test_collection.json").read_bytes()
+
+    def test_save_pretty_writes_indented_json(self) -> None:
+        """Test that pretty storage writes indented JSON."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = JsonFileStorage(base_path=tmpdir, pretty=True)
+            entity = SampleEntity(name="Pretty", value=1)
+            storage.get_collection("test_collection", SampleEntity)[entity.id] = entity
+
+            storage.save("test_collection")
+
+            content = (get_data_dir(tmpdir) / "test_collection.json").read_text()
+            assert content.startswith('{\n  "schema_version"')
+
+    def test_mark_dirty_appends_delta_and_replays_on_load(self) -> None:
+        """Test that single-entity writes go to the delta log and survive a reload."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = JsonFileStorage(base_path=tmpdir)
+            kept = SampleEntity(name="Kept", value=1)
+            removed = SampleEntity(name="Removed", value=2)
+            collection = storage.get_collection("test_collection", SampleEntity)
+            collection[kept.id] = kept
+            collection[removed.id] = removed
+            storage.save("test_collection")
+
+            kept.value = 10
+            storage.mark_dirty("test_collection", kept.id)
+            del collection[removed.id]
+            storage.mark_dirty("test_collection", removed.id)
+
+            data_dir = get_data_dir(tmpdir)
+            delta_path = data_dir / "test_collection.json.delta.jsonl"
+            assert len(delta_path.read_bytes().splitlines()) == 2
+            saved = json.loads((data_dir / "test_collection.json").read_text())
+            assert len(saved["entities"]) == 2
+
+            reloaded = JsonFileStorage(base_path=tmpdir).get_collection(
+                "test_collection", SampleEntity
+            )
+            assert list(reloaded) == [kept.id]
+            assert reloaded[kept.id].value == 10
+
+    def test_save_compacts_delta_log(self) -> None:
+        """Test that a full save folds the delta log into the collection file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = JsonFileStorage(base_path=tmpdir)
+            entity = SampleEntity(name="Entity", value=1)
+            storage.get_collection("test_collection", SampleEntity)[entity.id] = entity
+            storage.mark_dirty("test_collection", entity.id)
+
+            storage.save("test_collection")
+
+            data_dir = get_data_dir(tmpdir)
+            assert not (data_dir / "test_collection.json.delta.jsonl").exists()
+            saved = json.loads((data_dir / "test_collection.json").read_text())
+            assert saved["entities"][str(entity.id)]["value"] == 1
+
+    def test_mark_dirty_compacts_when_log_outgrows_collection(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the delta log is compacted once it reaches the threshold."""
+        monkeypatch.setattr(file_storage, "MIN_DELTA_LINES_BEFORE_COMPACT", 3)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = JsonFileStorage(base_path=tmpdir)
+            entity = SampleEntity(name="Entity", value=0)
+            storage.get_collection("test_collection", SampleEntity)[entity.id] = entity
+            delta_path = get_data_dir(tmpdir) / "test_collection.json.delta.jsonl"
+
+            for value in range(1, 4):
+                entity.value = value
+                storage.mark_dirty("test_collection", entity.id)
+
+            assert not delta_path.exists()
+            reloaded = JsonFileStorage(base_path=tmpdir).get_collection(
+                "test_collection", SampleEntity
+            )
+            assert reloaded[entity.id].value == 3
+
+    def test_load_ignores_torn_delta_line(self, capsys) -> None:
+        """Test that a partially written trailing delta line is ignored."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = JsonFileStorage(base_path=tmpdir)
+            entity = SampleEntity(name="Entity", value=1)
+            storage.get_collection("test_collection", SampleEntity)[entity.id] = entity
+            storage.mark_dirty("test_collection", entity.id)
+            delta_path = get_data_dir(tmpdir) / "test_collection.json.delta.jsonl"
+            with delta_path.open("ab") as f:
+                f.write(b'{"id": "trunc')
+
+            reloaded = JsonFileStorage(base_path=tmpdir).get_collection(
+                "test_collection", SampleEntity
+            )
+
+            assert reloaded[entity.id].value == 1
+            assert "Ignoring unreadable test_collection delta" in capsys.readouterr().err
+
+    def test_appends_after_torn_delta_line_survive_reload(self, capsys) -> None:
+        """Test that records logged after a torn line are not hidden on the next load."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = JsonFileStorage(base_path=tmpdir)
+            first = SampleEntity(name="First", value=1)
+            storage.get_collection("test_collection", SampleEntity)[first.id] = first
+            storage.mark_dirty("test_collection", first.id)
+            delta_path = get_data_dir(tmpdir) / "test_collection.json.delta.jsonl"
+            with delta_path.open("ab") as f:
+                f.write(b'{"id": "trunc')
+
+            storage = JsonFileStorage(base_path=tmpdir)
+            collection = storage.get_collection("test_collection", SampleEntity)
+            second = SampleEntity(name="Second", value=2)
+            collection[second.id] = second
+            storage.mark_dirty("test_collection", second.id)
+            collection[first.id].value = 10
+            storage.mark_dirty("test_collection", first.id)
+
+            reloaded = JsonFileStorage(base_path=tmpdir).get_collection(
+                "test_collection", SampleEntity
+            )
+
+            assert reloaded[first.id].value == 10
+            assert reloaded[second.id].value == 2
+            assert capsys.readouterr().err.count("Ignoring unreadable") == 1
+
+    def test_load_skips_unreadable_delta_lines(self, capsys) -> None:
+        """Test that records after an unreadable line in the middle are still replayed."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            entity = SampleEntity(name="Entity", value=1)
+            delta_path = get_data_dir(tmpdir) / "test_collection.json.delta.jsonl"
+            delta_path.parent.mkdir(parents=True)
+            record = {"id": str(entity.id), "entity": entity.model_dump(mode="json")}
+            delta_path.write_text(f'{{"id": "trunc\n{json.dumps(record)}\n')
+
+            reloaded = JsonFileStorage(base_path=tmpdir).get_collection(
+                "test_collection", SampleEntity
+            )
+
+            assert reloaded[entity.id].value == 1
+            assert not delta_path.exists()
+            assert "Ignoring unreadable test_collection delta" in capsys.readouterr().err
+
     def test_load_collection_handles_invalid_uuid(self, capsys) -> None:
         """Test that invalid UUIDs in JSON are handled gracefully."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -306,7 +466,7 @@ class TestJsonFileStorage:
             # Should not raise an error, should start fresh
             collection = storage.get_collection("test_collection", SampleEntity)
 
-            assert isinstance(collection, dict)
+            assert isinstance(collection, LazyCollection)
             assert len(collection) == 0
 
     def test_load_collection_handles_invalid_entity_data(self, capsys) -> None:
@@ -329,11 +489,29 @@ class TestJsonFileStorage:
                     f,
                 )
 
-            # Should not raise an error, should start fresh
+            # Entity data is validated lazily; the invalid entry is dropped on access
             collection = storage.get_collection("test_collection", SampleEntity)
 
-            assert isinstance(collection, dict)
+            assert isinstance(collection, LazyCollection)
+            assert list(collection.values()) == []
             assert len(collection) == 0
+            assert "Dropping invalid test_collection entry" in capsys.readouterr().err
+
+    def test_save_writes_normalized_untouched_records(self, tmp_path: Path) -> None:
+        """Test that records never read are validated so new defaults reach disk."""
+        entity = SampleEntity(name="Old", value=1)
+        data = entity.model_dump(mode="json")
+        del data["updated_at"]
+        data_dir = get_data_dir(tmp_path)
+        data_dir.mkdir(parents=True)
+        (data_dir / "items.json").write_text(json.dumps({"entities": {str(entity.id): data}}))
+        storage = JsonFileStorage(base_path=tmp_path)
+        storage.get_collection("items", SampleEntity)
+
+        storage.save("items")
+
+        saved = json.loads((data_dir / "items.json").read_text())["entities"]
+        assert "updated_at" in saved[str(entity.id)]
 
     def test_multiple_collections_independence(self) -> None:
         """Test that multiple collections are independent."""
@@ -495,3 +673,96 @@ class TestJsonFileStorage:
             # But collection dict still exists in memory (just empty)
             assert collection is not None
             assert len(collection) == 0
+
+    def test_parent_directory_is_created_once(self, tmp_path: Path) -> None:
+        """Test that repeated writes do not re-create the collection directory."""
+        storage = JsonFileStorage(base_path=tmp_path)
+        entity = SampleEntity(name="Entity", value=1)
+        storage.get_collection("nested/items", SampleEntity)[entity.id] = entity
+
+        storage.save("nested/items")
+
+        with patch.object(Path, "mkdir") as mkdir:
+            storage.mark_dirty("nested/items", entity.id)
+            storage.save("nested/items")
+
+        mkdir.assert_not_called()
+        assert (get_data_dir(tmp_path) / "nested" / "items.json").exists()
+
+    @pytest.mark.parametrize("fsync", [True, False])
+    def test_fsync_flag_controls_flush_to_disk(self, tmp_path: Path, fsync: bool) -> None:
+        """Test that fsync=False skips os.fsync but still writes the file."""
+        storage = JsonFileStorage(base_path=tmp_path, fsync=fsync)
+        entity = SampleEntity(name="Entity", value=1)
+        storage.get_collection("items", SampleEntity)[entity.id] = entity
+
+        with patch.object(file_storage.os, "fsync") as os_fsync:
+            storage.save("items")
+
+        assert os_fsync.called is fsync
+        saved = json.loads((get_data_dir(tmp_path) / "items.json").read_text())
+        assert str(entity.id) in saved["entities"]
+
+    def test_compaction_writes_tracked_dumps_without_reserializing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that delta compaction reuses the dumps recorded by mark_dirty."""
+        monkeypatch.setattr(file_storage, "MIN_DELTA_LINES_BEFORE_COMPACT", 2)
+        storage = JsonFileStorage(base_path=tmp_path)
+        first = SampleEntity(name="First", value=1)
+        second = SampleEntity(name="Second", value=2)
+        collection = storage.get_collection("items", SampleEntity)
+        collection[first.id] = first
+        storage.mark_dirty("items", first.id)
+
+        with patch.object(LazyCollection, "serialized_items", side_effect=AssertionError):
+            collection[second.id] = second
+            storage.mark_dirty("items", second.id)
+
+        data_dir = get_data_dir(tmp_path)
+        assert not (data_dir / "items.json.delta.jsonl").exists()
+        saved = json.loads((data_dir / "items.json").read_text())["entities"]
+        assert {saved[str(first.id)]["name"], saved[str(second.id)]["name"]} == {
+            "First",
+            "Second",
+        }
+
+    def test_compaction_falls_back_to_full_save_for_untracked_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that entities added without mark_dirty are still written on compaction."""
+        monkeypatch.setattr(file_storage, "MIN_DELTA_LINES_BEFORE_COMPACT", 1)
+        storage = JsonFileStorage(base_path=tmp_path)
+        tracked = SampleEntity(name="Tracked", value=1)
+        untracked = SampleEntity(name="Untracked", value=2)
+        collection = storage.get_collection("items", SampleEntity)
+        collection[untracked.id] = untracked
+        collection[tracked.id] = tracked
+
+        storage.mark_dirty("items", tracked.id)
+        storage.mark_dirty("items", tracked.id)  # second line reaches len(collection)
+
+        saved = json.loads((get_data_dir(tmp_path) / "items.json").read_text())["entities"]
+        assert set(saved) == {str(tracked.id), str(untracked.id)}
+
+    def test_compaction_detects_untracked_swap_with_same_size(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an untracked delete plus add is not hidden by an equal entity count."""
+        monkeypatch.setattr(file_storage, "MIN_DELTA_LINES_BEFORE_COMPACT", 3)
+        storage = JsonFileStorage(base_path=tmp_path)
+        removed = SampleEntity(name="Removed", value=1)
+        added = SampleEntity(name="Added", value=2)
+        tracked = SampleEntity(name="Tracked", value=3)
+        collection = storage.get_collection("items", SampleEntity)
+        collection[removed.id] = removed
+        storage.mark_dirty("items", removed.id)
+
+        del collection[removed.id]
+        collection[added.id] = added
+        collection[tracked.id] = tracked
+        storage.mark_dirty("items", tracked.id)
+        storage.mark_dirty("items", tracked.id)  # third line reaches the threshold
+
+        saved = json.loads((get_data_dir(tmp_path) / "items.json").read_text())["entities"]
+        assert set(saved) == {str(added.id), str(tracked.id)}
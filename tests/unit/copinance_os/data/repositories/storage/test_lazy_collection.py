@@ -0,0 +1,150 @@
+"""Unit tests for the lazily validated entity collection."""
+
+from itertools import islice
+from uuid import uuid4
+
+import pytest
+
+from copinance_os.data.repositories.storage.lazy_collection import LazyCollection
+from copinance_os.domain.models.common.base import Entity
+
+
+class SampleEntity(Entity):
+    """Sample entity for collection testing."""
+
+    name: str
+    value: int
+
+
+def _raw(name: str, value: int) -> tuple:
+    entity = SampleEntity(name=name, value=value)
+    return entity.id, entity.model_dump(mode="json")
+
+
+@pytest.mark.unit
+class TestLazyCollection:
+    """Test LazyCollection validation and serialization."""
+
+    def test_validates_on_access_and_memoizes(self) -> None:
+        entity_id, data = _raw("A", 1)
+        collection = LazyCollection(SampleEntity, {entity_id: data})
+
+        assert entity_id in collection
+        first = collection[entity_id]
+
+        assert isinstance(first, SampleEntity)
+        assert first.name == "A"
+        assert collection[entity_id] is first
+
+    def test_untouched_records_are_validated_before_serializing(self) -> None:
+        touched_id, touched = _raw("A", 1)
+        untouched_id, untouched = _raw("B", 2)
+        del untouched["updated_at"]
+        collection = LazyCollection(SampleEntity, {touched_id: touched, untouched_id: untouched})
+        collection[touched_id].value = 10
+
+        serialized = dict(collection.serialized_items())
+
+        assert serialized[untouched_id] is not untouched
+        assert "updated_at" in serialized[untouched_id]
+        assert serialized[touched_id]["value"] == 10
+
+    def test_invalid_record_is_dropped_and_reported(self) -> None:
+        valid_id, valid = _raw("A", 1)
+        invalid_id = uuid4()
+        reported: list = []
+        collection = LazyCollection(
+            SampleEntity,
+            {valid_id: valid, invalid_id: {"invalid": "data"}},
+            on_invalid=lambda key, error: reported.append(key),
+        )
+        # Counting does not validate, so the invalid record is included until read
+        assert len(collection) == 2
+        assert invalid_id in collection
+
+        with pytest.raises(KeyError):
+            collection[invalid_id]
+
+        assert collection.get(invalid_id) is None
+        assert [e.name for e in collection.values()] == ["A"]
+        assert reported == [invalid_id]
+        assert len(collection) == 1
+
+    def test_set_delete_and_clear(self) -> None:
+        entity_id, data = _raw("A", 1)
+        collection = LazyCollection(SampleEntity, {entity_id: data})
+        replacement = SampleEntity(id=entity_id, name="B", value=2)
+
+        collection[entity_id] = replacement
+        assert collection[entity_id] is replacement
+        del collection[entity_id]
+        assert entity_id not in collection
+
+        collection[entity_id] = replacement
+        collection.clear()
+        assert len(collection) == 0
+
+    def test_values_batch_validates_pending_records(self) -> None:
+        records = dict(_raw(f"S{i}", i) for i in range(5))
+        collection = LazyCollection(SampleEntity, records)
+        first_id = next(iter(records))
+        first = collection[first_id]
+
+        values = list(collection.values())
+
+        assert [e.value for e in values] == list(range(5))
+        assert all(isinstance(e, SampleEntity) for e in values)
+        assert values[0] is first
+        assert list(collection.keys()) == list(records)
+
+    def test_values_validate_lazily_as_consumed(self) -> None:
+        records = dict(_raw(f"S{i}", i) for i in range(1000))
+        invalid_id = uuid4()
+        records[invalid_id] = {"invalid": "data"}
+        reported: list = []
+        collection = LazyCollection(
+            SampleEntity, records, on_invalid=lambda key, error: reported.append(key)
+        )
+
+        page = list(islice(collection.values(), 10, 20))
+
+        assert [e.value for e in page] == list(range(10, 20))
+        assert reported == []
+        assert len(list(collection.items())) == 1000
+        assert reported == [invalid_id]
+
+    def test_serialize_reuses_dump_until_fields_change(self) -> None:
+        entity = SampleEntity(name="A", value=1)
+        collection = LazyCollection(SampleEntity)
+        collection[entity.id] = entity
+
+        first = collection.serialize(entity.id)
+        assert collection.serialize(entity.id) is first
+
+        entity.value = 2
+        second = collection.serialize(entity.id)
+        assert second is not first
+        assert second["value"] == 2
+
+        replacement = SampleEntity(id=entity.id, name="B", value=2)
+        collection[entity.id] = replacement
+        assert collection.serialize(entity.id)["name"] == "B"
+
+    def test_loaded_record_is_redumped_once_then_reused(self) -> None:
+        entity_id, data = _raw("A", 1)
+        collection = LazyCollection(SampleEntity, {entity_id: data})
+
+        first = collection.serialize(entity_id)
+
+        assert first is not data
+        assert first == data
+        assert collection.serialize(entity_id) is first
+
+    def test_serialized_items_skip_invalid_records(self) -> None:
+        valid_id, valid = _raw("A", 1)
+        invalid_id = uuid4()
+        collection = LazyCollection(SampleEntity, {valid_id: valid, invalid_id: {"invalid": 1}})
+
+        assert [key for key, _ in collection.serialized_items()] == [valid_id]
+        with pytest.raises(KeyError):
+            collection.serialize(invalid_id)
@@ -0,0 +1,107 @@
+"""Unit tests for MessagePack file storage implementation."""
+
+from pathlib import Path
+
+import pytest
+
+from copinance_os.data.loaders.persistence import get_data_dir
+from copinance_os.data.repositories.storage import msgpack as msgpack_storage
+from copinance_os.data.repositories.storage.file import JsonFileStorage
+from copinance_os.data.repositories.storage.msgpack import MsgPackFileStorage
+from copinance_os.domain.models.common.base import Entity
+
+pytest.importorskip("msgpack")
+
+
+class SampleEntity(Entity):
+    """Sample entity for storage testing."""
+
+    name: str
+    value: int
+
+
+@pytest.mark.unit
+class TestMsgPackFileStorage:
+    """Test MsgPackFileStorage."""
+
+    def test_persistence_across_instances(self, tmp_path: Path) -> None:
+        storage = MsgPackFileStorage(base_path=tmp_path)
+        entity = SampleEntity(name="Packed", value=7)
+        storage.get_collection("test/collection", SampleEntity)[entity.id] = entity
+        storage.save("test/collection")
+
+        file_path = get_data_dir(tmp_path) / "test" / "collection.mpk"
+        assert file_path.exists()
+        reloaded = MsgPackFileStorage(base_path=tmp_path).get_collection(
+            "test/collection", SampleEntity
+        )
+        assert reloaded[entity.id] == entity
+
+    def test_corrupted_file_starts_fresh(self, tmp_path: Path, capsys) -> None:
+        data_dir = get_data_dir(tmp_path)
+        data_dir.mkdir(parents=True)
+        (data_dir / "test_collection.mpk").write_bytes(b"\xc1not msgpack")
+
+        collection = MsgPackFileStorage(base_path=tmp_path).get_collection(
+            "test_collection", SampleEntity
+        )
+
+        assert len(collection) == 0
+        assert (data_dir / "test_collection.mpk.corrupt").exists()
+        assert "Could not load test_collection" in capsys.readouterr().err
+
+    def test_migrate_from_json(self, tmp_path: Path) -> None:
+        json_storage = JsonFileStorage(base_path=tmp_path)
+        entity = SampleEntity(name="Legacy", value=1)
+        json_storage.get_collection("test_collection", SampleEntity)[entity.id] = entity
+        json_storage.save("test_collection")
+
+        storage = MsgPackFileStorage(base_path=tmp_path)
+        assert storage.migrate_from_json("test_collection", SampleEntity) is True
+        assert storage.migrate_from_json("test_collection", SampleEntity) is False
+
+        reloaded = MsgPackFileStorage(base_path=tmp_path).get_collection(
+            "test_collection", SampleEntity
+        )
+        assert reloaded[entity.id].name == "Legacy"
+
+    def test_migrate_keeps_json_delta_changes(self, tmp_path: Path) -> None:
+        json_storage = JsonFileStorage(base_path=tmp_path)
+        entity = SampleEntity(name="Legacy", value=1)
+        json_storage.get_collection("test_collection", SampleEntity)[entity.id] = entity
+        json_storage.save("test_collection")
+        entity.value = 2
+        json_storage.mark_dirty("test_collection", entity.id)
+
+        storage = MsgPackFileStorage(base_path=tmp_path)
+        assert storage.migrate_from_json("test_collection", SampleEntity) is True
+
+        for backend in (JsonFileStorage, MsgPackFileStorage):
+            reloaded = backend(base_path=tmp_path).get_collection("test_collection", SampleEntity)
+            assert reloaded[entity.id].value == 2
+
+    def test_backends_keep_separate_delta_logs(self, tmp_path: Path) -> None:
+        json_storage = JsonFileStorage(base_path=tmp_path)
+        json_entity = SampleEntity(name="Json", value=1)
+        json_storage.get_collection("test_collection", SampleEntity)[json_entity.id] = json_entity
+        json_storage.mark_dirty("test_collection", json_entity.id)
+        storage = MsgPackFileStorage(base_path=tmp_path)
+        packed_entity = SampleEntity(name="Packed", value=2)
+        storage.get_collection("test_collection", SampleEntity)[packed_entity.id] = packed_entity
+        storage.mark_dirty("test_collection", packed_entity.id)
+
+        reloaded = MsgPackFileStorage(base_path=tmp_path).get_collection(
+            "test_collection", SampleEntity
+        )
+        assert list(reloaded) == [packed_entity.id]
+
+        MsgPackFileStorage(base_path=tmp_path).clear()
+        data_dir = get_data_dir(tmp_path)
+        assert not (data_dir / "test_collection.mpk.delta.jsonl").exists()
+        assert (data_dir / "test_collection.json.delta.jsonl").exists()
+
+    def test_requires_msgpack(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(msgpack_storage, "MSGPACK_AVAILABLE", False)
+
+        with pytest.raises(ImportError, match="msgpack is required"):
+            MsgPackFileStorage(base_path=tmp_path)
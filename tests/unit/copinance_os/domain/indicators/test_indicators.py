@@ -1,5 +1,8 @@
 """Unit tests for pure domain indicators."""
 
+import statistics
+from math import log
+
 import pytest
 
 from copinance_os.domain.indicators import (
@@ -47,6 +50,16 @@ class TestRSI:
         assert r is not None
         assert 0 <= r <= 100
 
+    def test_rsi_uses_only_last_period_changes(self) -> None:
+        recent = [100.0, 101.0, 100.5, 102.0, 101.0]
+        # Older history must not affect the result
+        assert relative_strength_index([50.0, 300.0, 10.0] + recent, period=4) == (
+            relative_strength_index(recent, period=4)
+        )
+        gains, losses = 1.0 + 1.5, 0.5 + 1.0
+        expected = 100.0 - 100.0 / (1.0 + gains / losses)
+        assert relative_strength_index(recent, period=4) == pytest.approx(expected)
+
 
 @pytest.mark.unit
 class TestIndicatorResultModel:
@@ -65,3 +78,46 @@ class TestRollingVol:
         assert vol[0] is None
         assert all(v is None for v in vol[1:21])
         assert vol[21] is not None
+
+
+@pytest.mark.unit
+class TestVectorizedHelpersMatchReference:
+    def test_log_returns_match_scalar_formula(self) -> None:
+        prices = [100.0, 0.0, 101.5, -3.0, 99.0, 98.25]
+        ref = [
+            (log(b) if b > 0 else 0.0) - (log(a) if a > 0 else 0.0)
+            for a, b in zip(prices, prices[1:], strict=False)
+        ]
+        assert log_returns_from_prices(prices) == pytest.approx(ref, rel=1e-12)
+        assert all(type(r) is float for r in log_returns_from_prices(prices))
+
+    def test_sma_matches_windowed_mean(self) -> None:
+        prices = [100.0 + (i % 7) * 1.25 - i * 0.1 for i in range(60)]
+        window = 10
+        out = simple_moving_average(prices, window)
+        ref = [
+            None if i < window - 1 else sum(prices[i - window + 1 : i + 1]) / window
+            for i in range(len(prices))
+        ]
+        assert out[: window - 1] == ref[: window - 1]
+        assert out[window - 1 :] == pytest.approx(ref[window - 1 :], rel=1e-12)
+        assert simple_moving_average(prices[:3], 3) == [
+            None,
+            None,
+            pytest.approx(sum(prices[:3]) / 3),
+        ]
+
+    def test_rolling_vol_matches_windowed_std(self) -> None:
+        prices = [100.0 + (i % 5) * 0.8 - i * 0.05 for i in range(60)]
+        window = 20
+        out = rolling_volatility_annualized_from_prices(prices, window=window)
+        returns = log_returns_from_prices(prices)
+        ref = [
+            statistics.stdev(returns[i - window : i]) * 252**0.5
+            for i in range(window + 1, len(prices))
+        ]
+        assert out[: window + 1] == [None] * (window + 1)
+        assert out[window + 1 :] == pytest.approx(ref, rel=1e-9)
+        assert rolling_volatility_annualized_from_prices(prices[: window + 1], window) == [None] * (
+            window + 1
+        )
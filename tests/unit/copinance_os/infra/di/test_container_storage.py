@@ -1,11 +1,20 @@
 """Unit tests for container storage_type and storage_path injection."""
 
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
+from copinance_os.data.repositories.storage import file as file_storage
 from copinance_os.data.repositories.storage.memory import InMemoryStorage
+from copinance_os.domain.models.common.base import Entity
 from copinance_os.infra.di import create_container
 
 
+class SampleEntity(Entity):
+    name: str
+
+
 @pytest.mark.unit
 class TestContainerStorageConfig:
     """Validate explicit storage composition."""
@@ -34,3 +43,16 @@ class TestContainerStorageConfig:
     def test_file_storage_requires_an_explicit_path(self) -> None:
         with pytest.raises(ValueError, match="storage_path is required"):
             create_container(storage_type="file")
+
+    def test_storage_fsync_reaches_file_storage(self, tmp_path: Path) -> None:
+        container = create_container(
+            storage_type="file", storage_path=str(tmp_path), storage_fsync=False
+        )
+        storage = container.storage_backend()
+        entity = SampleEntity(name="one")
+        storage.get_collection("items", SampleEntity)[entity.id] = entity
+
+        with patch.object(file_storage.os, "fsync") as os_fsync:
+            storage.save("items")
+
+        os_fsync.assert_not_called()
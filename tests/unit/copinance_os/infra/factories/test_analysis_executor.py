@@ -39,7 +39,6 @@ class TestAnalysisExecutorFactory:
         assert mock_executor in result
         mock_market_executor.assert_called_once()
 
-    @patch("copinance_os.core.execution_engine.factory.LLMProviderFactory")
     @patch("copinance_os.core.execution_engine.factory.LLMAnalyzerFactory")
     @patch("copinance_os.core.execution_engine.factory.QuestionDrivenAnalysisExecutor")
     @patch("copinance_os.core.execution_engine.factory.InstrumentAnalysisExecutor")
@@ -48,14 +47,10 @@ class TestAnalysisExecutorFactory:
         mock_market: MagicMock,
         mock_agentic: MagicMock,
         mock_llm_factory: MagicMock,
-        mock_provider_factory: MagicMock,
         mock_dependencies: dict,
     ) -> None:
         llm_config = LLMConfig(provider="gemini", api_key="test-key")
-        mock_provider_factory.get_provider_for_execution_type.return_value = "gemini"
         mock_llm_analyzer = MagicMock()
-        mock_llm_analyzer._llm_provider = MagicMock()
-        mock_llm_analyzer._llm_provider._api_key = "test_key"
         mock_llm_factory.create.return_value = mock_llm_analyzer
         mock_market_executor = MagicMock()
         mock_market.return_value = mock_market_executor
@@ -66,8 +61,9 @@ class TestAnalysisExecutorFactory:
         assert mock_market_executor in result
         assert mock_agentic_executor in result
         mock_agentic.assert_called_once()
+        assert mock_agentic.call_args.kwargs.get("llm_analyzer") is mock_llm_analyzer
+        mock_llm_factory.create.assert_called_once_with("gemini", llm_config)
 
-    @patch("copinance_os.core.execution_engine.factory.LLMProviderFactory")
     @patch("copinance_os.core.execution_engine.factory.LLMAnalyzerFactory")
     @patch("copinance_os.core.execution_engine.factory.QuestionDrivenAnalysisExecutor")
     @patch("copinance_os.core.execution_engine.factory.InstrumentAnalysisExecutor")
@@ -76,15 +72,9 @@ class TestAnalysisExecutorFactory:
         mock_market: MagicMock,
         mock_agentic: MagicMock,
         mock_llm_factory: MagicMock,
-        mock_provider_factory: MagicMock,
         mock_dependencies: dict,
     ) -> None:
         llm_config = LLMConfig(provider="gemini", api_key=None)
-        mock_provider_factory.get_provider_for_execution_type.return_value = "gemini"
-        mock_llm_analyzer = MagicMock()
-        mock_llm_analyzer._llm_provider = MagicMock()
-        mock_llm_analyzer._llm_provider._api_key = None
-        mock_llm_factory.create.return_value = mock_llm_analyzer
         mock_market_executor = MagicMock()
         mock_market.return_value = mock_market_executor
         result = AnalysisExecutorFactory.create_all(**mock_dependencies, llm_config=llm_config)
@@ -92,21 +82,18 @@ class TestAnalysisExecutorFactory:
         assert mock_market_executor in result
         mock_agentic.assert_called_once()
         assert mock_agentic.call_args.kwargs.get("llm_analyzer") is None
+        mock_llm_factory.create.assert_not_called()
 
-    @patch("copinance_os.core.execution_engine.factory.LLMProviderFactory")
     @patch("copinance_os.core.execution_engine.factory.LLMAnalyzerFactory")
     @patch("copinance_os.core.execution_engine.factory.InstrumentAnalysisExecutor")
     def test_create_all_handles_llm_factory_exception(
         self,
         mock_market: MagicMock,
         mock_llm_factory: MagicMock,
-        mock_provider_factory: MagicMock,
         mock_dependencies: dict,
     ) -> None:
         llm_config = LLMConfig(provider="gemini", api_key="test-key")
-        mock_provider_factory.get_provider_for_execution_type.side_effect = Exception(
-            "Config error"
-        )
+        mock_llm_factory.create.side_effect = Exception("Config error")
         mock_market_executor = MagicMock()
         mock_market.return_value = mock_market_executor
         result = AnalysisExecutorFactory.create_all(**mock_dependencies, llm_config=llm_config)
@@ -1,5 +1,6 @@
 """Unit tests for infrastructure error handling utilities."""
 
+import socket
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -102,6 +103,29 @@ class TestConvertToDomainError:
         assert result.provider_name == component
         mock_logger.warning.assert_called_once()
 
+    @patch("copinance_os.infra.error_handler.logger")
+    def test_convert_connection_error_type_without_keywords(self, mock_logger: MagicMock) -> None:
+        """Test that connectivity exception types are classified without message keywords."""
+        for error in (
+            ConnectionResetError("peer reset"),
+            TimeoutError(),
+            socket.gaierror("Name or service not known"),
+        ):
+            result = convert_to_domain_exception(error, "YFinanceProvider", "get_quote")
+
+            assert isinstance(result, DataProviderUnavailableError)
+            assert result.details["error_type"] == type(error).__name__
+
+    @patch("copinance_os.infra.error_handler.logger")
+    def test_convert_without_logging(self, mock_logger: MagicMock) -> None:
+        """Test that log=False skips the warning log."""
+        result = convert_to_domain_exception(
+            ValueError("Invalid data format"), "TestProvider", "test_operation", log=False
+        )
+
+        assert isinstance(result, DataProviderError)
+        mock_logger.warning.assert_not_called()
+
     @patch("copinance_os.infra.error_handler.logger")
     def test_convert_generic_error_to_data_provider_error(self, mock_logger: MagicMock) -> None:
         """Test that generic errors are converted to DataProviderError."""